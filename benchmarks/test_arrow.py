@@ -0,0 +1,30 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.arrow conversions of Arrow tables.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+
+from hepunits.arrow import to_numpy, to_units, with_units
+
+_size = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def table():
+    rng = np.random.default_rng(42)
+    columns = {f"p{i}": rng.exponential(5000.0, _size) for i in range(10)}
+    return with_units(pa.table(columns), dict.fromkeys(columns, "MeV"))
+
+
+@pytest.mark.parametrize("unit", ["MeV", "GeV"])
+def test_to_numpy(benchmark, table, unit):
+    benchmark(to_numpy, table, "p0", unit)
+
+
+def test_to_units(benchmark, table):
+    benchmark(to_units, table, dict.fromkeys(table.column_names, "GeV"))
@@ -0,0 +1,29 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.awkward conversions of jagged arrays.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+ak = pytest.importorskip("awkward")
+np = pytest.importorskip("numpy")
+
+from hepunits import GeV, MeV
+from hepunits.awkward import to, with_units
+
+
+@pytest.fixture(scope="module")
+def pt():
+    rng = np.random.default_rng(42)
+    counts = rng.poisson(20, 100_000)
+    values = rng.exponential(5000.0, counts.sum())
+    return with_units(ak.unflatten(values, counts), "MeV")
+
+
+def test_to(benchmark, pt):
+    benchmark(to, pt, "GeV")
+
+
+def test_broadcast_multiply(benchmark, pt):
+    benchmark(lambda: pt * (MeV / GeV))
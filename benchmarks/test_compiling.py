@@ -0,0 +1,48 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.compile against formulas with units multiplied at run time.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+from hepunits import units as u
+from hepunits.compiling import _compile, compile
+from hepunits.constants import c_light, c_light_sq
+
+_size = 10_000_000
+
+
+@pytest.fixture(scope="module")
+def momenta():
+    rng = np.random.default_rng(42)
+    return rng.uniform(5.0, 10.0, _size), rng.uniform(0.0, 5.0, _size)
+
+
+def _naive(e, p):
+    return (
+        np.sqrt((e * u.GeV) ** 2 - (p * u.GeV / c_light * c_light) ** 2)
+        / c_light_sq
+        / (u.MeV / c_light_sq)
+    )
+
+
+def test_naive(benchmark, momenta):
+    benchmark(_naive, *momenta)
+
+
+def test_compiled(benchmark, momenta):
+    mass = compile(
+        "sqrt(E^2 - (p * c_light)^2) / c_light_sq",
+        {"E": "GeV", "p": "GeV / c_light"},
+        "MeV / c_light_sq",
+    )
+    assert mass(*momenta) == pytest.approx(_naive(*momenta))
+    benchmark(mass, *momenta)
+
+
+def test_compile(benchmark):
+    formula = "pt / (eplus * c_light * B)", (("pt", "GeV"), ("B", "T")), "m"
+    benchmark(_compile.__wrapped__, *formula)
@@ -0,0 +1,33 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.formatting against formatting with NumPy string operations.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+from hepunits.formatting import format_with_prefixes, with_prefixes
+
+_size = 1_000_000
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(42)
+    return rng.lognormal(0.0, 5.0, _size) * rng.choice([-1.0, 1.0], _size)
+
+
+def _format_with_numpy(values, unit):
+    scaled, labels = with_prefixes(values, unit)
+    return np.char.add(np.char.add(np.char.mod("%.3g", scaled), " "), labels)
+
+
+@pytest.mark.parametrize("digits", [3, 4])
+def test_format_with_prefixes(benchmark, values, digits):
+    benchmark(format_with_prefixes, values, "eV", digits)
+
+
+def test_format_with_numpy(benchmark, values):
+    benchmark(_format_with_numpy, values, "eV")
@@ -0,0 +1,36 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.hist rescaling of a histogram with 10^7 bins.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+bh = pytest.importorskip("boost_histogram")
+
+from hepunits.hist import rescale
+
+
+@pytest.fixture(scope="module", params=[bh.storage.Double(), bh.storage.Weight()])
+def hist(request):
+    h = bh.Histogram(
+        bh.axis.Regular(198, 0, 1),
+        bh.axis.Regular(248, 0, 1),
+        bh.axis.Variable(np.linspace(0, 1, 200)),
+        storage=request.param,
+    )
+    h.fill(*np.random.default_rng(42).random((3, 1_000_000)))
+    return h
+
+
+def test_rescale_axes(benchmark, hist):
+    benchmark(rescale, hist, {0: 1e-3, 2: 1e-3}, 1e3)
+
+
+def test_rescale_inplace(benchmark, hist):
+    benchmark(rescale, hist, contents=1.0 + 1e-9, inplace=True)
+
+
+def test_copy(benchmark, hist):
+    benchmark(hist.copy)
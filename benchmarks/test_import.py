@@ -0,0 +1,85 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of the import time of hepunits.
+
+Run with ``pytest benchmarks``. Each round re-imports hepunits from scratch,
+with its submodules removed from ``sys.modules``, so that the lazy top-level
+import can be compared to loading all units and constants eagerly. The original
+modules are restored afterwards, for the benchmarks that follow. The cold start
+of a new interpreter importing hepunits is compared to one importing nothing.
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _is_hepunits(name):
+    return name == "hepunits" or name.startswith("hepunits.")
+
+
+def _unload():
+    for name in list(sys.modules):
+        if _is_hepunits(name):
+            del sys.modules[name]
+
+
+@pytest.fixture(autouse=True)
+def _restore_modules():
+    modules = {name: m for name, m in sys.modules.items() if _is_hepunits(name)}
+    yield
+    _unload()
+    sys.modules.update(modules)
+
+
+def _import_lazy():
+    importlib.import_module("hepunits")
+
+
+def _import_eager():
+    hepunits = importlib.import_module("hepunits")
+    return hepunits.units, hepunits.constants
+
+
+def test_import_hepunits(benchmark):
+    benchmark.pedantic(_import_lazy, setup=_unload, rounds=200)
+
+
+def test_import_hepunits_eager(benchmark):
+    benchmark.pedantic(_import_eager, setup=_unload, rounds=200)
+
+
+def test_import_hepunits_first_attribute(benchmark):
+    def first_attribute():
+        return importlib.import_module("hepunits").GeV
+
+    benchmark.pedantic(first_attribute, setup=_unload, rounds=200)
+
+
+@pytest.mark.parametrize("statement", ["pass", "import hepunits"])
+def test_cold_start(benchmark, statement):
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", statement],),
+        kwargs={"check": True},
+        rounds=20,
+    )
+
+
+def test_attribute(benchmark):
+    hepunits = importlib.import_module("hepunits")
+    benchmark(getattr, hepunits, "GeV")
+
+
+def test_submodule_attribute(benchmark):
+    hepunits = importlib.import_module("hepunits")
+    benchmark(getattr, hepunits.units, "GeV")
+
+
+def test_lazy_function(benchmark):
+    hepunits = importlib.import_module("hepunits")
+    benchmark(getattr, hepunits, "parse")
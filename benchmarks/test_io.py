@@ -0,0 +1,32 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.io conversions of files, against loading them in memory.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+from hepunits import ps
+from hepunits.io import convert_file
+
+_size = 10_000_000
+
+
+@pytest.fixture(scope="module")
+def times(tmp_path_factory):
+    path = tmp_path_factory.mktemp("io") / "times.npy"
+    np.save(path, np.random.default_rng(42).exponential(25.0, _size))
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_convert_file(benchmark, times, workers):
+    benchmark(
+        convert_file, times, times.with_name("result.npy"), "ns", "ps", workers=workers
+    )
+
+
+def test_load_multiply_save(benchmark, times):
+    benchmark(lambda: np.save(times.with_name("result.npy"), np.load(times) / ps))
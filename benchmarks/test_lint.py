@@ -0,0 +1,49 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.lint on many files, cold, in parallel and from the cache.
+"""
+
+import textwrap
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from hepunits.lint import lint_paths
+
+_files = 200
+
+_source = textwrap.dedent(
+    """
+    from hepunits import GeV, MeV, c_light, mm, ns
+
+    def mass_{0}(energy, momentum):
+        E = energy * GeV
+        p = momentum * GeV / c_light
+        return (E**2 - (p * c_light) ** 2) ** 0.5 / c_light**2
+
+    def velocity_{0}():
+        v = 3 * mm / ns
+        return v < c_light and v + {0} * MeV
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def sources(tmp_path_factory):
+    path = tmp_path_factory.mktemp("lint")
+    for i in range(_files):
+        (path / f"module_{i}.py").write_text(_source.format(i) * 20)
+    return path
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_cold(benchmark, sources, jobs):
+    findings = benchmark(lint_paths, [sources], jobs=jobs)
+    assert len(findings) == 20 * _files
+
+
+def test_cached(benchmark, sources, tmp_path):
+    lint_paths([sources], cache_dir=tmp_path)
+    findings = benchmark(lint_paths, [sources], cache_dir=tmp_path)
+    assert len(findings) == 20 * _files
@@ -0,0 +1,33 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.numpy.QuantityArray against plain NumPy arrays and Pint.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+pint = pytest.importorskip("pint")
+
+from hepunits.numpy import QuantityArray
+
+ureg = pint.UnitRegistry()
+
+_size = 1_000_000
+
+
+@pytest.fixture(params=["numpy", "hepunits", "pint"])
+def values(request):
+    values = np.random.default_rng(42).uniform(1.0, 10.0, _size)
+    if request.param == "hepunits":
+        return QuantityArray(values, "GeV^2")
+    if request.param == "pint":
+        return values * ureg.GeV**2
+    return values
+
+
+@pytest.mark.parametrize("func", [np.sqrt, np.sum, np.histogram])
+def test_function(benchmark, values, func):
+    if func is np.histogram and isinstance(values, pint.Quantity):
+        pytest.skip("not supported by Pint")
+    benchmark(func, values)
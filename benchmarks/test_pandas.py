@@ -0,0 +1,46 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.pandas columns, against plain float64 and pint-pandas columns.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from hepunits import GeV
+from hepunits.pandas import HepArray
+
+_size = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def values():
+    return np.random.default_rng(42).exponential(5000.0, _size)
+
+
+def test_to(benchmark, values):
+    series = pd.Series(HepArray(values, "MeV"))
+    benchmark(series.hep.to, "GeV")
+
+
+def test_float_multiply(benchmark, values):
+    series = pd.Series(values)
+    benchmark(series.__truediv__, GeV)
+
+
+def test_concat(benchmark, values):
+    series = [pd.Series(HepArray(values, "MeV")), pd.Series(HepArray(values, "GeV"))]
+    benchmark(pd.concat, series, ignore_index=True)
+
+
+def test_float_concat(benchmark, values):
+    series = [pd.Series(values), pd.Series(values)]
+    benchmark(pd.concat, series, ignore_index=True)
+
+
+def test_pint_pandas_to(benchmark, values):
+    pytest.importorskip("pint_pandas")
+    series = pd.Series(values, dtype="pint[MeV]")
+    benchmark(series.pint.to, "GeV")
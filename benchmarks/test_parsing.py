@@ -0,0 +1,32 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of the parsing of unit expressions and of columns of quantities.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from hepunits.parsing import parse, parse_array, parse_unit
+
+
+@pytest.mark.parametrize("expr", ["25 GeV", "3.5 GeV/c^2", "1.2e-3 T*m"])
+def test_parse(benchmark, expr):
+    benchmark(parse, expr)
+
+
+def test_parse_unit_uncached(benchmark):
+    def uncached():
+        parse_unit.cache_clear()
+        return parse_unit("kg*m^2/s^2")
+
+    benchmark(uncached)
+
+
+def test_parse_array(benchmark):
+    np = pytest.importorskip("numpy")
+    values = np.char.add(
+        np.random.default_rng(42).uniform(0, 100, 100_000).astype(str),
+        np.array([" keV", " MeV", " GeV", " TeV"])[np.arange(100_000) % 4],
+    )
+    benchmark(parse_array, values)
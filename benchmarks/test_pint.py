@@ -0,0 +1,64 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of the conversions between Pint quantities and the HEP system of units.
+
+The cached conversions of hepunits.pint are compared to their first, uncached,
+call and to converting with Pint alone.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+pint = pytest.importorskip("pint")
+
+import hepunits
+from hepunits.pint import (
+    cache_clear,
+    from_clhep,
+    from_clhep_array,
+    to_clhep,
+    to_clhep_array,
+)
+
+ureg = pint.UnitRegistry()
+
+_size = 1_000_000
+
+
+@pytest.fixture(params=["scalar", "array"])
+def energy(request):
+    if request.param == "scalar":
+        return 12.5 * ureg.GeV
+    return ureg.Quantity(np.random.default_rng(42).uniform(1.0, 100.0, _size), "GeV")
+
+
+def test_to_clhep(benchmark):
+    benchmark(to_clhep, 9.8 * ureg.meter / ureg.second**2)
+
+
+def test_to_clhep_uncached(benchmark):
+    value = 9.8 * ureg.meter / ureg.second**2
+
+    def uncached():
+        cache_clear()
+        return to_clhep(value)
+
+    benchmark(uncached)
+
+
+def test_from_clhep(benchmark):
+    benchmark(from_clhep, hepunits.c_light, ureg.meter / ureg.second)
+
+
+def test_to_clhep_array(benchmark, energy):
+    benchmark(to_clhep_array, energy)
+
+
+def test_from_clhep_array(benchmark):
+    values = np.random.default_rng(42).uniform(1e3, 1e5, _size)
+    benchmark(from_clhep_array, values, ureg.GeV)
+
+
+def test_pint_to(benchmark, energy):
+    benchmark(energy.to, ureg.MeV)
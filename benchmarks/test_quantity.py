@@ -0,0 +1,66 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.Quantity against Pint, for scalar and array arithmetic.
+"""
+
+import pytest
+
+from hepunits import Quantity
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+pint = pytest.importorskip("pint")
+
+ureg = pint.UnitRegistry()
+
+
+def _momentum(energy, mass, c):
+    return (energy**2 - (mass * c**2) ** 2) ** 0.5 / c
+
+
+@pytest.fixture(params=["scalar", "array"])
+def size(request):
+    return 1 if request.param == "scalar" else 1_000_000
+
+
+def _magnitudes(size):
+    if size == 1:
+        return 10.0, 0.1
+    return np.full(size, 10.0), np.full(size, 0.1)
+
+
+def test_hepunits_quantity(benchmark, size):
+    energy, mass = _magnitudes(size)
+    energy = Quantity(energy, "GeV")
+    mass = Quantity(mass, "GeV/c^2")
+    c = Quantity(1, "c")
+    p = benchmark(_momentum, energy, mass, c)
+    assert p.dimension == Quantity(1, "GeV/c").dimension
+
+
+def test_pint_quantity(benchmark, size):
+    energy, mass = _magnitudes(size)
+    energy = energy * ureg.GeV
+    mass = mass * ureg.GeV / ureg.c**2
+    c = 1 * ureg.c
+    p = benchmark(_momentum, energy, mass, c)
+    assert p.check("[momentum]")
+
+
+def test_plain_floats(benchmark, size):
+    from hepunits import GeV, c_light  # noqa: PLC0415
+
+    energy, mass = _magnitudes(size)
+    benchmark(_momentum, energy * GeV, mass * GeV / c_light**2, c_light)
+
+
+def test_hepunits_quantity_to(benchmark):
+    from hepunits import MeV  # noqa: PLC0415
+
+    q = Quantity(10.0, "GeV")
+    benchmark(q.to, MeV)
+
+
+def test_pint_quantity_to(benchmark):
+    q = 10.0 * ureg.GeV
+    benchmark(q.to, ureg.MeV)
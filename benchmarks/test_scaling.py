@@ -0,0 +1,51 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.scale against naive expressions, in time and allocated memory.
+
+The peak memory allocated by each call, traced by tracemalloc, is stored in the
+``extra_info`` of the benchmarks.
+"""
+
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+from hepunits import GeV, MeV, scale
+
+_size = 1_000_000
+
+
+@pytest.fixture(params=[np.float32, np.float64])
+def values(request):
+    return np.random.default_rng(42).exponential(5.0, _size).astype(request.param)
+
+
+def _run(benchmark, func):
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["allocated"] = peak
+    benchmark(func)
+
+
+def test_naive(benchmark, values):
+    _run(benchmark, lambda: (values * MeV) / GeV)
+
+
+def test_scale(benchmark, values):
+    _run(benchmark, lambda: scale(values, MeV, GeV))
+
+
+def test_scale_out(benchmark, values):
+    out = np.empty_like(values)
+    _run(benchmark, lambda: scale(values, MeV, GeV, out=out))
+
+
+def test_scale_in_place(benchmark, values):
+    _run(benchmark, lambda: scale(values, 1.0, 1.0, out=values))
@@ -0,0 +1,30 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Benchmarks of hepunits.xarray chained conversions of Dask-backed variables.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+xr = pytest.importorskip("xarray")
+pytest.importorskip("dask.array")
+
+import hepunits.xarray  # noqa: F401
+from hepunits import fs, ns, ps, us
+
+_size = 10_000_000
+
+
+@pytest.fixture(scope="module")
+def times():
+    values = np.random.default_rng(42).exponential(25.0, _size)
+    return xr.DataArray(values, dims="hit", attrs={"units": "ns"}).chunk(hit=1_000_000)
+
+
+def test_chained_to(benchmark, times):
+    benchmark(lambda: times.hep.to("ps").hep.to("us").hep.to("fs").compute())
+
+
+def test_chained_multiply(benchmark, times):
+    benchmark((times * (ns / ps) * (ps / us) * (us / fs)).compute)
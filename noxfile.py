@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import nox
 
 nox.needs_version = ">=2024.4.15"
@@ -20,3 +22,27 @@ def tests(session: nox.Session) -> None:
     """
     session.install("-e.[test]")
     session.run("pytest", *session.posargs)
+
+
+BENCHMARKS = Path(".benchmarks")
+
+
+@nox.session
+def benchmarks(session: nox.Session) -> None:
+    """
+    Run the benchmarks, failing on regressions against the last saved baseline.
+
+    Save a baseline with ``nox -s benchmarks -- --benchmark-save=<name>``.
+    Baselines are stored in ``.benchmarks``, per machine and Python version.
+    """
+    session.install("-e.[test]", "pytest-benchmark")
+    compare = []
+    if any(BENCHMARKS.glob("*/*.json")):
+        compare = ["--benchmark-compare", "--benchmark-compare-fail=mean:25%"]
+    session.run(
+        "pytest",
+        "benchmarks",
+        f"--benchmark-storage={BENCHMARKS}",
+        *compare,
+        *session.posargs,
+    )
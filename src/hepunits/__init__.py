@@ -1,301 +1,321 @@
 # Licensed under a 3-clause BSD style license, see LICENSE.
 
-from . import constants, units
+"""
+Units and constants in the HEP system of units.
+
+The units and constants are loaded lazily, on first access,
+so that ``import hepunits`` itself is nearly free.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from ._version import version as __version__
-from .constants.constants import (
-    Avogadro,
-    c_light,
-    c_light_sq,
-    e_sq,
-    eminus,
-    h_Planck,
-    half_pi,
-    hbar,
-    hbar_Planck,
-    hbarc,
-    hbarc_sq,
-    k_Boltzmann,
-    pi,
-    pi_sq,
-    two_pi,
-)
-from .units.prefixes import (
-    atto,
-    centi,
-    deca,
-    deci,
-    exa,
-    exbi,
-    femto,
-    gibi,
-    giga,
-    googol,
-    hecto,
-    kibi,
-    kilo,
-    mebi,
-    mega,
-    micro,
-    milli,
-    nano,
-    pebi,
-    peta,
-    pico,
-    quecto,
-    quetta,
-    ronna,
-    ronto,
-    tebi,
-    tera,
-    yobi,
-    yocto,
-    yotta,
-    zebi,
-    zepto,
-    zetta,
-)
-from .units.units import (
-    GJ,
-    GW,
-    MJ,
-    MV,
-    MW,
-    A,
-    Bq,
-    C,
-    Ci,
-    EeV,
-    F,
-    G,
-    GBq,
-    GeV,
-    GHz,
-    Gs,
-    Gy,
-    H,
-    Hz,
-    J,
-    K,
-    MBq,
-    MeV,
-    MGy,
-    MHz,
-    Mx,
-    N,
-    Pa,
-    PeV,
-    Qg,
-    Rg,
-    S,
-    Sv,
-    T,
-    TeV,
-    THz,
-    V,
-    W,
-    Wb,
-    ZeV,
-    ab,
-    ampere,
-    angstrom,
-    atm,
-    atmosphere,
-    attobarn,
-    attosecond,
-    bar,
-    barn,
-    becquerel,
-    candela,
-    cd,
-    centimeter,
-    centimeter2,
-    centimeter3,
-    cm,
-    cm2,
-    cm3,
-    coulomb,
-    curie,
-    d,
-    day,
-    deg,
-    degree,
-    dyne,
-    e_SI,
-    electronvolt,
-    electronvolt2,
-    eplus,
-    erg,
-    eV,
-    eV2,
-    exaelectronvolt,
-    farad,
-    fb,
-    femtobarn,
-    femtometer,
-    femtosecond,
-    fermi,
-    fm,
-    fm2,
-    fm3,
-    fs,
-    g,
-    gauss,
-    gigabecquerel,
-    gigaelectronvolt,
-    gigahertz,
-    gigajoule,
-    gigawatt,
-    gram,
-    gray,
-    h,
-    henry,
-    hertz,
-    hour,
-    invab,
-    invfb,
-    invmb,
-    invnb,
-    invpb,
-    invub,
-    joule,
-    kBq,
-    kelvin,
-    keV,
-    kG,
-    kg,
-    kGs,
-    kGy,
-    kHz,
-    kilobecquerel,
-    kiloelectronvolt,
-    kilogauss,
-    kilogram,
-    kilogray,
-    kilohertz,
-    kilojoule,
-    kilometer,
-    kilometer2,
-    kilometer3,
-    kilovolt,
-    kilowatt,
-    kJ,
-    km,
-    km2,
-    km3,
-    kV,
-    kW,
-    lm,
-    lumen,
-    lux,
-    lx,
-    m,
-    m2,
-    m3,
-    mA,
-    maxwell,
-    mb,
-    mbar,
-    mCi,
-    megabecquerel,
-    megaelectronvolt,
-    megagray,
-    megahertz,
-    megajoule,
-    megavolt,
-    megawatt,
-    meter,
-    meter2,
-    meter3,
-    mF,
-    mg,
-    mGy,
-    microampere,
-    microbarn,
-    microcurie,
-    microfarad,
-    microgray,
-    micrometer,
-    micron,
-    microsecond,
-    microweber,
-    milliampere,
-    millibar,
-    millibarn,
-    millicurie,
-    millifarad,
-    milligram,
-    milligray,
-    millimeter,
-    millimeter2,
-    millimeter3,
-    milliradian,
-    millisecond,
-    milliweber,
-    minute,
-    mm,
-    mm2,
-    mm3,
-    mol,
-    mole,
-    mrad,
-    ms,
-    mWb,
-    nA,
-    nanoampere,
-    nanobarn,
-    nanocurie,
-    nanofarad,
-    nanometer,
-    nanosecond,
-    nanoweber,
-    nb,
-    nCi,
-    newton,
-    nF,
-    ns,
-    nWb,
-    ohm,
-    pascal,
-    pb,
-    petaelectronvolt,
-    pF,
-    picobarn,
-    picofarad,
-    picosecond,
-    ps,
-    quettagram,
-    rad,
-    radian,
-    rg,
-    ronnagram,
-    rontogram,
-    s,
-    second,
-    siemens,
-    sievert,
-    sr,
-    steradian,
-    teraelectronvolt,
-    terahertz,
-    tesla,
-    uA,
-    ub,
-    uCi,
-    uF,
-    uGy,
-    us,
-    uWb,
-    volt,
-    watt,
-    weber,
-    y,
-    year,
-    yoctosecond,
-    ys,
-    zeptosecond,
-    zettaelectronvolt,
-    zs,
-)
+
+if TYPE_CHECKING:
+    from . import constants, units
+    from .checking import checked as checked
+    from .compiling import compile as compile
+    from .constants.constants import (
+        Avogadro,
+        c_light,
+        c_light_sq,
+        e_sq,
+        eminus,
+        h_Planck,
+        half_pi,
+        hbar,
+        hbar_Planck,
+        hbarc,
+        hbarc_sq,
+        k_Boltzmann,
+        pi,
+        pi_sq,
+        two_pi,
+    )
+    from .parsing import parse as parse
+    from .parsing import parse_array as parse_array
+    from .quantity import Quantity as Quantity
+    from .scaling import scale as scale
+    from .units.prefixes import (
+        atto,
+        centi,
+        deca,
+        deci,
+        exa,
+        exbi,
+        femto,
+        gibi,
+        giga,
+        googol,
+        hecto,
+        kibi,
+        kilo,
+        mebi,
+        mega,
+        micro,
+        milli,
+        nano,
+        pebi,
+        peta,
+        pico,
+        quecto,
+        quetta,
+        ronna,
+        ronto,
+        tebi,
+        tera,
+        yobi,
+        yocto,
+        yotta,
+        zebi,
+        zepto,
+        zetta,
+    )
+    from .units.units import (
+        GJ,
+        GW,
+        MJ,
+        MV,
+        MW,
+        A,
+        Bq,
+        C,
+        Ci,
+        EeV,
+        F,
+        G,
+        GBq,
+        GeV,
+        GHz,
+        Gs,
+        Gy,
+        H,
+        Hz,
+        J,
+        K,
+        MBq,
+        MeV,
+        MGy,
+        MHz,
+        Mx,
+        N,
+        Pa,
+        PeV,
+        Qg,
+        Rg,
+        S,
+        Sv,
+        T,
+        TeV,
+        THz,
+        V,
+        W,
+        Wb,
+        ZeV,
+        ab,
+        ampere,
+        angstrom,
+        atm,
+        atmosphere,
+        attobarn,
+        attosecond,
+        bar,
+        barn,
+        becquerel,
+        candela,
+        cd,
+        centimeter,
+        centimeter2,
+        centimeter3,
+        cm,
+        cm2,
+        cm3,
+        coulomb,
+        curie,
+        d,
+        day,
+        deg,
+        degree,
+        dyne,
+        e_SI,
+        electronvolt,
+        electronvolt2,
+        eplus,
+        erg,
+        eV,
+        eV2,
+        exaelectronvolt,
+        farad,
+        fb,
+        femtobarn,
+        femtometer,
+        femtosecond,
+        fermi,
+        fm,
+        fm2,
+        fm3,
+        fs,
+        g,
+        gauss,
+        gigabecquerel,
+        gigaelectronvolt,
+        gigahertz,
+        gigajoule,
+        gigawatt,
+        gram,
+        gray,
+        h,
+        henry,
+        hertz,
+        hour,
+        invab,
+        invfb,
+        invmb,
+        invnb,
+        invpb,
+        invub,
+        joule,
+        kBq,
+        kelvin,
+        keV,
+        kG,
+        kg,
+        kGs,
+        kGy,
+        kHz,
+        kilobecquerel,
+        kiloelectronvolt,
+        kilogauss,
+        kilogram,
+        kilogray,
+        kilohertz,
+        kilojoule,
+        kilometer,
+        kilometer2,
+        kilometer3,
+        kilovolt,
+        kilowatt,
+        kJ,
+        km,
+        km2,
+        km3,
+        kV,
+        kW,
+        lm,
+        lumen,
+        lux,
+        lx,
+        m,
+        m2,
+        m3,
+        mA,
+        maxwell,
+        mb,
+        mbar,
+        mCi,
+        megabecquerel,
+        megaelectronvolt,
+        megagray,
+        megahertz,
+        megajoule,
+        megavolt,
+        megawatt,
+        meter,
+        meter2,
+        meter3,
+        mF,
+        mg,
+        mGy,
+        microampere,
+        microbarn,
+        microcurie,
+        microfarad,
+        microgray,
+        micrometer,
+        micron,
+        microsecond,
+        microweber,
+        milliampere,
+        millibar,
+        millibarn,
+        millicurie,
+        millifarad,
+        milligram,
+        milligray,
+        millimeter,
+        millimeter2,
+        millimeter3,
+        milliradian,
+        millisecond,
+        milliweber,
+        minute,
+        mm,
+        mm2,
+        mm3,
+        mol,
+        mole,
+        mrad,
+        ms,
+        mWb,
+        nA,
+        nanoampere,
+        nanobarn,
+        nanocurie,
+        nanofarad,
+        nanometer,
+        nanosecond,
+        nanoweber,
+        nb,
+        nCi,
+        newton,
+        nF,
+        ns,
+        nWb,
+        ohm,
+        pascal,
+        pb,
+        petaelectronvolt,
+        pF,
+        picobarn,
+        picofarad,
+        picosecond,
+        ps,
+        quettagram,
+        rad,
+        radian,
+        rg,
+        ronnagram,
+        rontogram,
+        s,
+        second,
+        siemens,
+        sievert,
+        sr,
+        steradian,
+        teraelectronvolt,
+        terahertz,
+        tesla,
+        uA,
+        ub,
+        uCi,
+        uF,
+        uGy,
+        us,
+        uWb,
+        volt,
+        watt,
+        weber,
+        y,
+        year,
+        yoctosecond,
+        ys,
+        zeptosecond,
+        zettaelectronvolt,
+        zs,
+    )
 
 # Units and constants directly available
 
@@ -595,5 +615,40 @@ __all__ = (
 )
 
 
+# Submodules holding the units and constants, in lookup order
+_submodules = ("constants", "units")
+
+# Functions and classes provided by other submodules. They are not in __all__,
+# so that "from hepunits import *" only imports the units and constants, e.g.
+# does not shadow the builtin compile.
+_functions = {
+    "checked": "checking",
+    "compile": "compiling",
+    "parse": "parsing",
+    "parse_array": "parsing",
+    "Quantity": "quantity",
+    "scale": "scaling",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _functions:
+        module = importlib.import_module(f"{__name__}.{_functions[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in __all__:
+        for submodule in _submodules:
+            module = importlib.import_module(f"{__name__}.{submodule}")
+            if name in module.__all__:
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 def __dir__() -> list[str]:  # pragma: no cover
-    return list(__all__)
+    return [*__all__, *_functions]
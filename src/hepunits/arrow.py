@@ -0,0 +1,211 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units of the columns of Arrow tables, stored in their field metadata.
+
+The unit expression of a column is stored under the ``b"hepunits"`` key of the
+metadata of its field, hence travels with the table to Parquet and Arrow IPC files.
+Columns are read as NumPy arrays without any copy when they are already in the
+requested unit, and with one vectorized multiply otherwise. Tables are converted
+with Arrow compute kernels, reusing the columns that need no conversion.
+
+Typical use cases::
+
+    >>> import pyarrow as pa
+    >>> from hepunits.arrow import to_numpy, to_units, with_units
+    >>> table = with_units(pa.table({"pt": [1200.0, 4100.0], "t": [1.5, 0.5]}),
+    ...                    {"pt": "MeV", "t": "ns"})
+    >>> to_numpy(table, "pt", "GeV")
+    array([1.2, 4.1])
+    >>> to_units(table, {"t": "ps"}).column("t").to_pylist()
+    [1500.0, 500.0]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .parsing import conversion_factor, parse_dimension
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as exc:  # pragma: no cover
+    msg = "PyArrow is required to use hepunits.arrow."
+    raise ImportError(msg) from exc
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+__all__ = ("to_numpy", "to_units", "units", "with_units")
+
+# Key of the unit expression in the metadata of fields
+_key = b"hepunits"
+
+_Table = TypeVar("_Table", pa.Table, pa.RecordBatch)
+
+
+def _check_columns(table: pa.Table | pa.RecordBatch, names: Mapping[str, str]) -> None:
+    unknown = set(names) - set(table.column_names)
+    if unknown:
+        msg = f"No columns {sorted(unknown)} in {table.column_names}"
+        raise ValueError(msg)
+
+
+def _with_field_unit(field: pa.Field, unit: str) -> pa.Field:
+    return field.with_metadata({**(field.metadata or {}), _key: unit.encode()})
+
+
+def _from_columns(table: _Table, columns: list[Any], fields: list[pa.Field]) -> _Table:
+    """A table of the same type, with the schema metadata of the original one."""
+    schema = pa.schema(fields, metadata=table.schema.metadata)
+    return type(table).from_arrays(columns, schema=schema)
+
+
+def with_units(table: _Table, units: Mapping[str, str]) -> _Table:
+    """
+    Tag columns of a table with the units of their values, without changing them.
+
+    The columns are not copied.
+
+    Parameters
+    ----------
+    table : pyarrow.Table or pyarrow.RecordBatch
+        The table.
+    units : dict
+        The unit expressions of columns, e.g. ``{"pt": "GeV"}``.
+        Columns not in the mapping are left as is.
+
+    Returns
+    -------
+    pyarrow.Table or pyarrow.RecordBatch
+        The same columns, with their units.
+    """
+    _check_columns(table, units)
+    fields = []
+    for field in table.schema:
+        if field.name in units:
+            parse_dimension(units[field.name])
+            field = _with_field_unit(field, units[field.name])  # noqa: PLW2901
+        fields.append(field)
+    return _from_columns(table, table.columns, fields)
+
+
+def units(table: pa.Table | pa.RecordBatch | pa.Schema) -> dict[str, str]:
+    """
+    Get the units of the columns of a table, see `with_units`.
+
+    Parameters
+    ----------
+    table : pyarrow.Table, pyarrow.RecordBatch or pyarrow.Schema
+        The table, or its schema.
+
+    Returns
+    -------
+    dict
+        The unit expressions of the columns with units.
+    """
+    schema = table if isinstance(table, pa.Schema) else table.schema
+    return {
+        field.name: field.metadata[_key].decode()
+        for field in schema
+        if field.metadata and _key in field.metadata
+    }
+
+
+def _unit(table: pa.Table | pa.RecordBatch, name: str) -> str:
+    field = table.schema.field(name)
+    if not field.metadata or _key not in field.metadata:
+        msg = f"Column {name!r} has no units, see hepunits.arrow.with_units"
+        raise ValueError(msg)
+    return field.metadata[_key].decode()  # type: ignore[no-any-return]
+
+
+def to_numpy(
+    table: pa.Table | pa.RecordBatch, name: str, unit: str | None = None
+) -> NDArray[Any]:
+    """
+    Get a column of a table as a NumPy array, in a given unit.
+
+    The array is a read-only view of the Arrow buffer if the column is
+    already in the unit and can be viewed without copy, i.e. it has a single
+    chunk of numbers without nulls. Otherwise the values are converted with one
+    vectorized multiply.
+
+    Parameters
+    ----------
+    table : pyarrow.Table or pyarrow.RecordBatch
+        The table.
+    name : str
+        The name of the column.
+    unit : str, optional
+        The unit expression to convert to, e.g. ``"GeV"``.
+        By default, the unit of the column.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values in the unit.
+
+    Raises
+    ------
+    ValueError
+        If a unit is given for a column without units, see `with_units`.
+    DimensionError
+        If the units have different dimensions.
+    """
+    column = table.column(name)
+    if isinstance(column, pa.ChunkedArray):
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    values = column.to_numpy(zero_copy_only=False)
+    if unit is None:
+        return values  # type: ignore[no-any-return]
+    factor = conversion_factor(_unit(table, name), unit)
+    return values if factor == 1 else values * factor  # type: ignore[no-any-return]
+
+
+def to_units(table: _Table, units: Mapping[str, str]) -> _Table:
+    """
+    Convert columns of a table to other units, see `with_units`.
+
+    Each column is converted with one multiply by Arrow compute kernels, and
+    the columns already in the requested units are reused as they are.
+
+    Parameters
+    ----------
+    table : pyarrow.Table or pyarrow.RecordBatch
+        The table with units.
+    units : dict
+        The unit expressions to convert to, e.g. ``{"pt": "GeV", "t": "ps"}``.
+        Columns not in the mapping are left as is.
+
+    Returns
+    -------
+    pyarrow.Table or pyarrow.RecordBatch
+        The columns in the given units.
+
+    Raises
+    ------
+    ValueError
+        If a column has no units, see `with_units`.
+    DimensionError
+        If the units have different dimensions.
+    """
+    _check_columns(table, units)
+    columns = []
+    fields = []
+    for field, column in zip(table.schema, table.columns):
+        if field.name in units:
+            unit = units[field.name]
+            factor = conversion_factor(_unit(table, field.name), unit)
+            if factor != 1:
+                column = pc.multiply(column, pa.scalar(factor))  # noqa: PLW2901
+                field = field.with_type(column.type)  # noqa: PLW2901
+            field = _with_field_unit(field, unit)  # noqa: PLW2901
+        columns.append(column)
+        fields.append(field)
+    return _from_columns(table, columns, fields)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,214 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units of jagged Awkward Arrays, such as tracks per event or hits per track.
+
+The unit of a numeric field is stored as a ``"hepunits"`` parameter of its
+innermost content, hence travels with the array through slicing, selections
+and concatenation. Conversions scale the flat content buffer of each field with
+a single vectorized multiply, while the offsets of the jagged dimensions are
+reused without any copy.
+
+Note that arithmetic does not update the units of its results,
+which should be tagged again with `with_units`.
+
+Typical use cases::
+
+    >>> import awkward as ak
+    >>> from hepunits.awkward import to, units, with_units
+    >>> pt = with_units(ak.Array([[1200.0, 500.0], [], [4100.0]]), "MeV")
+    >>> to(pt, "GeV").tolist()
+    [[1.2, 0.5], [], [4.1]]
+    >>> units(to(pt, "GeV"))
+    'GeV'
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any, Union
+
+from .parsing import conversion_factor, parse_dimension
+
+try:
+    import awkward as ak
+except ImportError as exc:  # pragma: no cover
+    msg = "Awkward Array is required to use hepunits.awkward."
+    raise ImportError(msg) from exc
+
+__all__ = ("to", "units", "with_units")
+
+# Name of the parameter holding the unit expression of a numeric content
+_parameter = "hepunits"
+
+# A unit expression, or a mapping of record fields to units
+_Units = Union[str, Mapping[str, "_Units"]]
+
+
+def _map_leaves(
+    layout: ak.contents.Content,
+    function: Callable[[ak.contents.Content], ak.contents.Content],
+) -> ak.contents.Content:
+    """Apply a function to the numeric and record nodes, reusing all other nodes."""
+    if layout.is_numpy or layout.is_record:
+        return function(layout)
+    if layout.is_unknown:
+        return layout
+    if layout.is_union:
+        return layout.copy(
+            contents=[_map_leaves(content, function) for content in layout.contents]
+        )
+    return layout.copy(content=_map_leaves(layout.content, function))
+
+
+def _map_fields(
+    layout: ak.contents.Content,
+    unit: _Units,
+    function: Callable[[ak.contents.Content, str], ak.contents.Content],
+) -> ak.contents.Content:
+    """Apply a function to the numeric nodes of each field, with the unit of the field."""
+
+    def apply(node: ak.contents.Content) -> ak.contents.Content:
+        if isinstance(unit, str):
+            if node.is_record:
+                msg = f"Expected one unit per field of {node.fields}, got {unit!r}"
+                raise ValueError(msg)
+            return function(node, unit)
+        if not node.is_record:
+            msg = f"Expected a single unit for an array without fields, got {unit!r}"
+            raise ValueError(msg)
+        unknown = set(unit) - set(node.fields)
+        if unknown:
+            msg = f"No fields {sorted(unknown)} in {node.fields}"
+            raise ValueError(msg)
+        contents = [
+            _map_fields(content, unit[field], function) if field in unit else content
+            for field, content in zip(node.fields, node.contents)
+        ]
+        return node.copy(contents=contents)
+
+    return _map_leaves(layout, apply)
+
+
+def _with_layout(array: Any, layout: ak.contents.Content) -> ak.Array:
+    """Wrap a layout, keeping the behavior and attributes of the original array."""
+    if isinstance(array, ak.Array):
+        return ak.Array(layout, behavior=array.behavior, attrs=array.attrs)
+    return ak.Array(layout)
+
+
+def with_units(array: Any, unit: _Units) -> ak.Array:
+    """
+    Tag an array with the units of its values, without changing them.
+
+    Parameters
+    ----------
+    array : awkward.Array
+        The array, possibly jagged.
+    unit : str or dict
+        The unit expression of the values, e.g. ``"GeV"``, or, for records,
+        a mapping of fields to their units. Fields not in the mapping are left as is.
+
+    Returns
+    -------
+    awkward.Array
+        The same values, with their units.
+
+    Examples
+    --------
+    >>> import awkward as ak
+    >>> tracks = ak.Array([[{"p": 1.5, "t": 25.0}], [{"p": 2.0, "t": 50.0}]])
+    >>> units(with_units(tracks, {"p": "GeV/c", "t": "ns"}))
+    {'p': 'GeV/c', 't': 'ns'}
+    """
+
+    def tag(node: ak.contents.Content, unit: str) -> ak.contents.Content:
+        parse_dimension(unit)
+        return node.copy(parameters={**node.parameters, _parameter: unit})
+
+    return _with_layout(array, _map_fields(ak.to_layout(array), unit, tag))
+
+
+def units(array: Any) -> Any:
+    """
+    Get the units of an array, see `with_units`.
+
+    Parameters
+    ----------
+    array : awkward.Array
+        The array, possibly jagged.
+
+    Returns
+    -------
+    str, dict or None
+        The unit expression of the values, a mapping of fields to their units
+        for records, or None for values without units.
+    """
+
+    def collect(layout: ak.contents.Content) -> Any:
+        if layout.is_numpy:
+            return layout.parameter(_parameter)
+        if layout.is_record:
+            return {
+                field: collect(content)
+                for field, content in zip(layout.fields, layout.contents)
+            }
+        if layout.is_unknown:
+            return None
+        if layout.is_union:
+            return collect(layout.contents[0])
+        return collect(layout.content)
+
+    return collect(ak.to_layout(array))
+
+
+def to(array: Any, unit: _Units) -> ak.Array:
+    """
+    Convert an array with units to other units, see `with_units`.
+
+    The flat content of each field is scaled in one vectorized multiply,
+    and the offsets of jagged dimensions are reused as they are.
+
+    Parameters
+    ----------
+    array : awkward.Array
+        The array with units, possibly jagged.
+    unit : str or dict
+        The unit expression to convert to, e.g. ``"GeV"``, or, for records,
+        a mapping of fields to their units. Fields not in the mapping are left as is.
+
+    Returns
+    -------
+    awkward.Array
+        The values in the given units.
+
+    Raises
+    ------
+    ValueError
+        If the values have no units, see `with_units`.
+    DimensionError
+        If the units have different dimensions.
+
+    Examples
+    --------
+    >>> import awkward as ak
+    >>> t = with_units(ak.Array([[1.0, 2.5], [0.5]]), "ns")
+    >>> to(t, "ps").tolist()
+    [[1000.0, 2500.0], [500.0]]
+    """
+
+    def convert(node: ak.contents.Content, unit: str) -> ak.contents.Content:
+        current = node.parameter(_parameter)
+        if current is None:
+            msg = "Cannot convert values without units, see hepunits.awkward.with_units"
+            raise ValueError(msg)
+        factor = conversion_factor(current, unit)
+        parameters = {**node.parameters, _parameter: unit}
+        if factor == 1:
+            return node.copy(parameters=parameters)
+        return ak.contents.NumpyArray(node.data * factor, parameters=parameters)
+
+    return _with_layout(array, _map_fields(ak.to_layout(array), unit, convert))
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
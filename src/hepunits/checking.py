@@ -0,0 +1,140 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Runtime checks of the dimensions of function arguments and results.
+
+The `checked` decorator validates the dimensions of the `hepunits.Quantity`
+arguments and result of a function. Plain numbers carry no dimension, hence
+are not checked: the same code can run on quantities, for validation,
+and on plain numbers, in production.
+
+Checks are disabled, at no cost, when Python runs with optimizations (``python -O``)
+or when the environment variable ``HEPUNITS_CHECKS`` is set to ``0``:
+the decorator then returns the function unchanged.
+
+Typical use cases::
+
+    >>> from hepunits import Quantity, checked
+    >>> @checked(energy="GeV", momentum="GeV/c", returns="GeV/c^2")
+    ... def mass(energy, momentum):
+    ...     c = Quantity(1, "c")
+    ...     return (energy**2 - (momentum * c) ** 2) ** 0.5 / c**2
+    >>> mass(Quantity(10, "GeV"), Quantity(6, "GeV/c")).to("GeV/c^2")
+    8.0
+    >>> mass(Quantity(10, "GeV"), Quantity(6, "GeV"))
+    Traceback (most recent call last):
+        ...
+    hepunits.dimensions.DimensionError: Argument 'momentum' of mass has dimension [energy], expected [time] * [energy] / [length]
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from .dimensions import Dimension, DimensionError
+from .parsing import parse_dimension
+from .quantity import Quantity
+
+__all__ = ("checked", "checks_enabled")
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def checks_enabled() -> bool:
+    """
+    Whether `checked` validates dimensions, rather than returning functions unchanged.
+
+    Checks are disabled under ``python -O``, or if the environment variable
+    ``HEPUNITS_CHECKS`` is set to ``0``, when functions are decorated.
+    """
+    return __debug__ and os.environ.get("HEPUNITS_CHECKS", "1") != "0"
+
+
+def _dimension_of(value: Any) -> Dimension | None:
+    """The dimension of a quantity, None for values that are not checked."""
+    return value.dimension if isinstance(value, Quantity) else None
+
+
+def _expected(spec: str | Dimension) -> Dimension:
+    return parse_dimension(spec) if isinstance(spec, str) else spec
+
+
+def checked(
+    returns: str | Dimension | None = None, **arguments: str | Dimension
+) -> Callable[[_F], _F]:
+    """
+    Check the dimensions of the arguments and result of a function.
+
+    Only `hepunits.Quantity` values are checked. The check is done once per
+    combination of the dimensions of the arguments, as calls with the same
+    dimensions can only differ in their magnitudes.
+
+    Parameters
+    ----------
+    returns : str or Dimension, optional
+        The unit expression, e.g. ``"GeV"``, or dimension of the result.
+    **arguments : str or Dimension
+        The unit expressions or dimensions of arguments, by name.
+
+    Returns
+    -------
+    callable
+        The decorator. It returns functions unchanged if checks are disabled,
+        see `checks_enabled`.
+
+    Raises
+    ------
+    TypeError
+        If the function has no argument with one of the given names.
+    DimensionError
+        When the function is called with, or returns, a quantity of a different dimension.
+    """
+
+    def decorator(func: _F) -> _F:
+        if not checks_enabled():
+            return func
+
+        signature = inspect.signature(func)
+        unknown = set(arguments) - set(signature.parameters)
+        if unknown:
+            msg = f"{func.__name__} has no arguments {sorted(unknown)}"
+            raise TypeError(msg)
+        expected = {name: _expected(spec) for name, spec in arguments.items()}
+        expected_result = None if returns is None else _expected(returns)
+        # Dimensions of the arguments of calls that passed the checks
+        passed: set[tuple[Any, ...]] = set()
+
+        def check(value: Any, dimension: Dimension, what: str) -> None:
+            actual = _dimension_of(value)
+            if actual is not None and actual != dimension:
+                msg = f"{what} of {func.__name__} has dimension {actual}, expected {dimension}"
+                raise DimensionError(msg)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (
+                *map(_dimension_of, args),
+                *((name, _dimension_of(value)) for name, value in kwargs.items()),
+            )
+            if key in passed:
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            for name, dimension in expected.items():
+                if name in bound.arguments:
+                    check(bound.arguments[name], dimension, f"Argument {name!r}")
+            result = func(*args, **kwargs)
+            if expected_result is not None:
+                check(result, expected_result, "Result")
+            passed.add(key)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,441 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Compilation of formulas with units into fast vectorized functions.
+
+A formula such as ``"pt / (eplus * c_light * B)"``, whose inputs are arrays of numbers
+in given units, is parsed with the unit expression parser of `hepunits.parsing`, its
+dimension is checked against the unit of its output, and all its constant factors,
+i.e. the units and constants of `hepunits`, numbers, and the conversions from the
+units of the inputs and to the unit of the output, are folded into a single number
+per term. The result is a plain Python function of NumPy operations, which does one
+pass over the arrays per remaining operation. Formulas are compiled once, then memoized.
+
+Formulas are simplified algebraically: products of integer powers of the same factor
+are merged, and terms with the same factors are collected, hence ``x / x`` is ``1``.
+Non-integer powers are never merged, so that ``sqrt(x) * sqrt(x)`` is still NaN for
+negative ``x``, as in NumPy, and positive coefficients are taken out of ``abs`` and
+of non-integer powers to be folded with the others.
+
+Typical use cases::
+
+    >>> import numpy as np
+    >>> from hepunits import compile
+    >>> radius = compile("pt / (eplus * c_light * B)", {"pt": "GeV", "B": "T"}, "m")
+    >>> radius(np.array([1.0, 10.0]), 2.0)
+    array([ 1.66782048, 16.67820476])
+    >>> print(radius.__doc__)
+    def compiled(pt, B):
+        pt = _np.asarray(pt)
+        B = _np.asarray(B)
+        return pt / B * 3.3356409519815204
+"""
+
+from __future__ import annotations
+
+import functools
+import keyword
+import math
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .dimensions import Dimension, DimensionError, dimensionless
+from .parsing import _dimension as _unit_dimension
+from .parsing import _Node, _Parser, _values, parse_dimension, parse_unit
+
+__all__ = ("compile",)
+
+# Functions of formulas: the dimensionless ones take and return dimensionless values
+_functions = {
+    "sqrt": None,
+    "abs": None,
+    "exp": math.exp,
+    "log": math.log,
+    "log10": math.log10,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+}
+
+# Name of the NumPy module in the namespace of compiled functions
+_np = "_np"
+
+# A sum of terms, mapping the factors of each term, as sorted (factor, exponent)
+# pairs, to its coefficient. Factors are code: the names of inputs, function
+# calls, or sums in parentheses.
+_Terms = dict[tuple[tuple[str, float], ...], float]
+
+
+class _FormulaParser(_Parser):
+    """Parser of unit expressions with inputs, sums and function calls."""
+
+    def __init__(self, text: str, inputs: frozenset[str]) -> None:
+        super().__init__(text)
+        self.inputs = inputs
+
+    def parse(self) -> _Node:
+        node = self._sum()
+        if self._peek() is not None:
+            raise self._error()
+        return node
+
+    def _sum(self) -> _Node:
+        node = self._product()
+        while (token := self._peek()) in {("op", "+"), ("op", "-")}:
+            self.pos += 1
+            node = ("add" if token[1] == "+" else "sub", node, self._product())
+        return node
+
+    def _atom(self) -> _Node:
+        token = self._peek()
+        if token is not None and token[0] == "name":
+            name = token[1]
+            # Inputs take precedence over units, e.g. for a mass "m"
+            if name in self.inputs:
+                self.pos += 1
+                return ("input", name)
+            if name in _functions and name not in _values:
+                self.pos += 1
+                self._expect("(")
+                node = self._sum()
+                self._expect(")")
+                return ("call", name, node)
+        if token == ("op", "("):
+            self.pos += 1
+            node = self._sum()
+            self._expect(")")
+            return node
+        return super()._atom()
+
+
+def _has_inputs(node: _Node) -> bool:
+    if node[0] == "input":
+        return True
+    return any(isinstance(child, tuple) and _has_inputs(child) for child in node[1:])
+
+
+def _dimension(node: _Node, inputs: Mapping[str, Dimension]) -> Dimension:  # noqa: PLR0911
+    """The dimension of a formula, checking the dimensions of its operations."""
+    kind = node[0]
+    if kind == "input":
+        return inputs[node[1]]
+    if kind == "call":
+        argument = _dimension(node[2], inputs)
+        if node[1] == "sqrt":
+            return argument**0.5
+        if node[1] != "abs" and argument != dimensionless:
+            msg = f"Argument of {node[1]} with dimension {argument}"
+            raise DimensionError(msg)
+        return argument
+    if kind in {"add", "sub"}:
+        left, right = _dimension(node[1], inputs), _dimension(node[2], inputs)
+        if left != right:
+            what = "add" if kind == "add" else "subtract"
+            msg = f"Cannot {what} {left} and {right}"
+            raise DimensionError(msg)
+        return left
+    if kind == "neg":
+        return _dimension(node[1], inputs)
+    if kind in {"mul", "div"}:
+        left, right = _dimension(node[1], inputs), _dimension(node[2], inputs)
+        return left * right if kind == "mul" else left / right
+    if kind == "pow":
+        base, exponent = _dimension(node[1], inputs), _dimension(node[2], inputs)
+        if exponent != dimensionless:
+            msg = f"Exponent with dimension {exponent}"
+            raise DimensionError(msg)
+        if _has_inputs(node[2]):
+            if base != dimensionless:
+                msg = f"Variable exponent of a value with dimension {base}"
+                raise DimensionError(msg)
+            return base
+        return base ** _value(_fold(node[2], {}))
+    return _unit_dimension(node)
+
+
+def _value(terms: _Terms) -> float:
+    """The value of constant terms."""
+    return terms.get((), 0.0)
+
+
+def _is_constant(terms: _Terms) -> bool:
+    return all(not factors for factors in terms)
+
+
+def _is_atom(code: str) -> bool:
+    """Whether code is a name, a call or in parentheses, without a top-level operator."""
+    depth = 0
+    for char in code:
+        depth += (char == "(") - (char == ")")
+        if depth == 0 and char == " ":
+            return False
+    return True
+
+
+def _power_code(factor: str, exponent: float) -> str:
+    if exponent == 1:
+        return factor
+    base = factor if _is_atom(factor) else f"({factor})"
+    return f"{base} ** {int(exponent) if exponent.is_integer() else exponent!r}"
+
+
+def _term_code(factors: tuple[tuple[str, float], ...], coefficient: float) -> str:
+    """The code of a term with a positive coefficient, with one pass per operation."""
+    numerator = [_power_code(factor, e) for factor, e in factors if e > 0]
+    denominator = [_power_code(factor, -e) for factor, e in factors if e < 0]
+    if numerator:
+        code = " * ".join(numerator)
+        if denominator:
+            code = " / ".join([code, *denominator])
+        # The coefficient is applied last, in place of the temporary array
+        return code if coefficient == 1 else f"{code} * {coefficient!r}"
+    return " / ".join([repr(coefficient), *denominator])
+
+
+def _sum_code(terms: _Terms) -> str:
+    """The code of a sum of terms, starting with a positive term if any."""
+    if not terms:
+        return "0.0"
+    items = sorted(terms.items(), key=lambda item: item[1] < 0)
+    code = ""
+    for factors, coefficient in items:
+        term = _term_code(factors, abs(coefficient))
+        sign = "-" if coefficient < 0 else "+"
+        code = f"{code} {sign} {term}" if code else f"-{term}" if sign == "-" else term
+    return code
+
+
+def _common(terms: _Terms, *, folded: bool = False) -> tuple[float, _Terms]:
+    """
+    The common coefficient of a sum of terms, applied with the fewest multiplies,
+    not counting the multiply by the common coefficient if it is folded elsewhere.
+    """
+    coefficients = [abs(c) for factors, c in terms.items() if factors]
+
+    def multiplies(common: float) -> tuple[int, bool]:
+        count = sum(c / common != 1 for c in coefficients)
+        count += common != 1 and not folded
+        return count, common != 1
+
+    common = min({1.0, *coefficients}, key=multiplies)
+    return common, _scale(terms, 1 / common)
+
+
+def _code(terms: _Terms) -> str:
+    """The code of a sum of terms, with their common coefficient applied once."""
+    if len(terms) <= 1:
+        return _sum_code(terms)
+    common, terms = _common(terms)
+    code = _sum_code(terms)
+    return code if common == 1 else f"({code}) * {common!r}"
+
+
+def _factor(terms: _Terms) -> tuple[float, tuple[tuple[str, float], ...]]:
+    """A single term, with sums of several terms as a factor."""
+    if len(terms) == 1:
+        factors, coefficient = next(iter(terms.items()))
+        return coefficient, factors
+    common, terms = _common(terms)
+    return common, ((f"({_sum_code(terms)})", 1.0),)
+
+
+def _merge(*factors: tuple[tuple[str, float], ...]) -> tuple[tuple[str, float], ...]:
+    exponents: dict[str, float] = {}
+    for pairs in factors:
+        for factor, exponent in pairs:
+            exponents[factor] = exponents.get(factor, 0.0) + exponent
+    return tuple(sorted((f, e) for f, e in exponents.items() if e != 0))
+
+
+def _scale(terms: _Terms, factor: float) -> _Terms:
+    if factor == 0:
+        return {}
+    return {factors: coefficient * factor for factors, coefficient in terms.items()}
+
+
+def _multiply(left: _Terms, right: _Terms) -> _Terms:
+    if _is_constant(left):
+        return _scale(right, _value(left))
+    if _is_constant(right):
+        return _scale(left, _value(right))
+    (left_coefficient, left_factors), (right_coefficient, right_factors) = (
+        _factor(left),
+        _factor(right),
+    )
+    factors = _merge(left_factors, right_factors)
+    return {factors: left_coefficient * right_coefficient}
+
+
+def _power(terms: _Terms, exponent: float) -> _Terms:
+    if _is_constant(terms):
+        value = _value(terms)
+        if value < 0 and not exponent.is_integer():
+            msg = f"Negative constant {value!r} to the non-integer power {exponent!r}"
+            raise ValueError(msg)
+        return {(): value**exponent}
+    coefficient, factors = _factor(terms)
+    # (x^a)^b is x^(a b) for integer b, but (x^2)^0.5 is |x|, (x y)^0.5 is not
+    # x^0.5 y^0.5 for negative x and y, and x^0.5 x^0.5 is not x for negative x:
+    # non-integer powers are factors of their own, with their own domain
+    if exponent.is_integer():
+        return {tuple((f, e * exponent) for f, e in factors): coefficient**exponent}
+    if coefficient > 0:
+        # (c x^a)^b is c^b (x^a)^b for positive c
+        code = _power_code(_term_code(factors, 1.0), exponent)
+        return {((code, 1.0),): coefficient**exponent}
+    return {((_power_code(_sum_code(terms), exponent), 1.0),): 1.0}
+
+
+def _add(left: _Terms, right: _Terms) -> _Terms:
+    result = dict(left)
+    for factors, coefficient in right.items():
+        result[factors] = result.get(factors, 0.0) + coefficient
+    return {factors: c for factors, c in result.items() if c != 0}
+
+
+def _fold(node: _Node, inputs: Mapping[str, float]) -> _Terms:  # noqa: PLR0911, PLR0912
+    """Fold the constant factors of a formula, see the module."""
+    kind = node[0]
+    if kind == "number":
+        return _scale({(): 1.0}, node[1])
+    if kind == "name":
+        return {(): _values[node[1]]}
+    if kind == "input":
+        return {((node[1], 1.0),): inputs[node[1]]}
+    if kind == "neg":
+        return _scale(_fold(node[1], inputs), -1.0)
+    if kind == "call":
+        name, argument = node[1], _fold(node[2], inputs)
+        if name == "sqrt":
+            return _power(argument, 0.5)
+        if _is_constant(argument):
+            function, value = _functions[name] or abs, _value(argument)
+            try:
+                return {(): float(function(value))}
+            except ValueError as exc:
+                msg = f"Constant argument {value!r} out of the domain of {name}"
+                raise ValueError(msg) from exc
+        if name == "abs":
+            # |c x| is |c| |x|, so the coefficient stays out of the call
+            if len(argument) == 1:
+                factors, coefficient = next(iter(argument.items()))
+                common, argument = abs(coefficient), {factors: 1.0}
+            else:
+                common, argument = _common(argument, folded=True)
+            return {((f"{_np}.abs({_sum_code(argument)})", 1.0),): common}
+        return {((f"{_np}.{name}({_code(argument)})", 1.0),): 1.0}
+    left = _fold(node[1], inputs)
+    if kind == "pow" and _has_inputs(node[2]):
+        right = _fold(node[2], inputs)
+        code = f"{_np}.power({_code(left)}, {_code(right)})"
+        return {((code, 1.0),): 1.0}
+    right = _fold(node[2], inputs)
+    if kind == "add":
+        return _add(left, right)
+    if kind == "sub":
+        return _add(left, _scale(right, -1.0))
+    if kind == "mul":
+        return _multiply(left, right)
+    if kind == "div":
+        if not right:
+            msg = "Division by zero"
+            raise ZeroDivisionError(msg)
+        return _multiply(left, _power(right, -1.0))
+    return _power(left, _value(right))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(
+    expr: str, inputs: tuple[tuple[str, str], ...], output: str | None
+) -> Callable[..., Any]:
+    import numpy as np  # noqa: PLC0415
+
+    for name, _ in inputs:
+        if not name.isidentifier() or keyword.iskeyword(name) or name == _np:
+            msg = f"Invalid input name {name!r}"
+            raise ValueError(msg)
+    units = dict(inputs)
+    node = _FormulaParser(expr, frozenset(units)).parse()
+
+    try:
+        dimension = _dimension(
+            node, {name: parse_dimension(unit) for name, unit in units.items()}
+        )
+        if output is not None and dimension != parse_dimension(output):
+            msg = f"{expr!r} has dimension {dimension}, expected {parse_dimension(output)}"
+            raise DimensionError(msg)
+        terms = _fold(node, {name: parse_unit(unit) for name, unit in units.items()})
+    except ArithmeticError as exc:
+        msg = f"Cannot compile {expr!r}: {exc}"
+        raise ValueError(msg) from exc
+    if output is not None:
+        terms = _scale(terms, 1 / parse_unit(output))
+    if _is_constant(terms) and units:
+        shapes = ", ".join(f"{_np}.shape({name})" for name in units)
+        result = f"{_np}.full({_np}.broadcast_shapes({shapes}), {_value(terms)!r})"
+    else:
+        result = _code(terms)
+
+    source = "\n".join(
+        [
+            f"def compiled({', '.join(units)}):",
+            *(f"    {name} = {_np}.asarray({name})" for name in units),
+            f"    return {result}",
+        ]
+    )
+    namespace: dict[str, Any] = {_np: np}
+    exec(source, namespace)  # noqa: S102
+    function: Callable[..., Any] = namespace["compiled"]
+    function.__doc__ = source
+    return function
+
+
+def compile(
+    expr: str, inputs: Mapping[str, str] | None = None, output: str | None = None
+) -> Callable[..., Any]:
+    """
+    Compile a formula with units into a vectorized NumPy function.
+
+    The constant factors of the formula are folded into one number per term,
+    see the module. Compiled formulas are memoized, by formula, inputs and output.
+
+    Parameters
+    ----------
+    expr : str
+        The formula, built from the names of inputs, units and constants,
+        numbers, the operators ``+``, ``-``, ``*``, ``/``, ``^`` (or ``**``),
+        parentheses, and the functions ``sqrt``, ``abs``, ``exp``, ``log``,
+        ``log10``, ``sin``, ``cos`` and ``tan``. Names of inputs take precedence
+        over the names of units and constants.
+    inputs : dict, optional
+        The unit expressions of the inputs, by name, e.g. ``{"pt": "GeV"}``.
+        They are also the arguments of the function, in this order.
+    output : str, optional
+        The unit expression of the result, e.g. ``"m"``.
+        By default, the result is in the HEP system of units.
+
+    Returns
+    -------
+    callable
+        The function of arrays, or numbers, of the inputs in their units, giving
+        the result in the unit of the output. Its docstring is its source code.
+
+    Raises
+    ------
+    ValueError
+        If the formula is invalid.
+    DimensionError
+        If the formula adds values of different dimensions, or has another
+        dimension than the output.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> mass = compile("sqrt(E^2 - (p c)^2) / c^2", {"E": "GeV", "p": "GeV/c"}, "MeV/c^2")
+    >>> mass(np.array([10.0, 5.0]), np.array([6.0, 3.0]))
+    array([8000., 4000.])
+    """
+    return _compile(expr, tuple((inputs or {}).items()), output)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
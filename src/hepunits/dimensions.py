@@ -0,0 +1,467 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Dimensions in the HEP system of units
+=====================================
+
+The units and constants of `hepunits` are plain floats, in the HEP system of units.
+This module pairs each of them with its dimension, a small vector of integer
+exponents of the base quantities of the system:
+
+    ===================   =====================
+    Quantity              Field
+    ===================   =====================
+    Length                ``length``
+    Time                  ``time``
+    Energy                ``energy``
+    Positron charge       ``charge``
+    Temperature           ``temperature``
+    Amount of substance   ``amount``
+    Luminous intensity    ``luminous_intensity``
+    ===================   =====================
+
+Angles are dimensionless. Dimensions multiply, divide and raise to powers
+with integer arithmetic on the exponents, which makes checks cheap.
+
+Typical use cases::
+
+    >>> from hepunits.dimensions import energy, registry
+    >>> registry["tesla"]
+    Dimension(length=-2, time=1, energy=1, charge=-1)
+    >>> registry["GeV"] == energy
+    True
+    >>> print(registry["kilogram"])
+    [time] ** 2 * [energy] / [length] ** 2
+"""
+
+from __future__ import annotations
+
+import functools
+from operator import add, sub
+from types import MappingProxyType
+from typing import NamedTuple
+
+from .units import prefixes
+
+__all__ = (
+    "Dimension",
+    "DimensionError",
+    "amount",
+    "area",
+    "charge",
+    "current",
+    "dimensionless",
+    "energy",
+    "force",
+    "frequency",
+    "length",
+    "luminous_intensity",
+    "mass",
+    "momentum",
+    "power",
+    "pressure",
+    "registry",
+    "temperature",
+    "time",
+    "velocity",
+    "voltage",
+    "volume",
+)
+
+
+class DimensionError(ValueError):
+    """Raised when quantities or units have incompatible dimensions."""
+
+
+class Dimension(NamedTuple):
+    """
+    Integer exponents of the base quantities of the HEP system of units.
+
+    Examples
+    --------
+    >>> velocity = Dimension(length=1) / Dimension(time=1)
+    >>> velocity
+    Dimension(length=1, time=-1)
+    >>> velocity**2
+    Dimension(length=2, time=-2)
+    """
+
+    length: int = 0
+    time: int = 0
+    energy: int = 0
+    charge: int = 0
+    temperature: int = 0
+    amount: int = 0
+    luminous_intensity: int = 0
+
+    def __mul__(self, other: Dimension) -> Dimension:  # type: ignore[override]
+        return _multiply(self, other)
+
+    def __truediv__(self, other: Dimension) -> Dimension:
+        return _divide(self, other)
+
+    def __pow__(self, exponent: float) -> Dimension:
+        return _power(self, exponent)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value}" for name, value in zip(self._fields, self) if value
+        )
+        return f"Dimension({fields})"
+
+    def __str__(self) -> str:
+        numerator = [
+            f"[{name}]" + (f" ** {value}" if value != 1 else "")
+            for name, value in zip(self._fields, self)
+            if value > 0
+        ]
+        denominator = [
+            f"[{name}]" + (f" ** {-value}" if value != -1 else "")
+            for name, value in zip(self._fields, self)
+            if value < 0
+        ]
+        if not numerator and not denominator:
+            return "dimensionless"
+        return " / ".join([" * ".join(numerator) or "1", *denominator])
+
+
+# The results of operations on dimensions are cached, since only a handful of
+# distinct dimensions are used in practice
+@functools.lru_cache(maxsize=1024)
+def _multiply(left: Dimension, right: Dimension) -> Dimension:
+    return tuple.__new__(Dimension, map(add, left, right))
+
+
+@functools.lru_cache(maxsize=1024)
+def _divide(left: Dimension, right: Dimension) -> Dimension:
+    return tuple.__new__(Dimension, map(sub, left, right))
+
+
+@functools.lru_cache(maxsize=1024)
+def _power(base: Dimension, exponent: float) -> Dimension:
+    exponents = [value * exponent for value in base]
+    if any(value != int(value) for value in exponents):
+        msg = f"Non-integer exponents in ({base}) ** {exponent}"
+        raise DimensionError(msg)
+    return tuple.__new__(Dimension, map(int, exponents))
+
+
+# --------------------------------------------------------------------
+# Base and common derived dimensions
+# --------------------------------------------------------------------
+dimensionless = Dimension()
+length = Dimension(length=1)
+time = Dimension(time=1)
+energy = Dimension(energy=1)
+charge = Dimension(charge=1)
+temperature = Dimension(temperature=1)
+amount = Dimension(amount=1)
+luminous_intensity = Dimension(luminous_intensity=1)
+
+area = length**2
+volume = length**3
+frequency = dimensionless / time
+velocity = length / time
+mass = energy / velocity**2
+momentum = energy / velocity
+current = charge / time
+power = energy / time
+force = energy / length
+pressure = force / area
+voltage = energy / charge
+
+# --------------------------------------------------------------------
+# Dimensions of the units and constants
+# --------------------------------------------------------------------
+_names = (
+    (
+        dimensionless,
+        (
+            *prefixes.__all__,
+            "radian",
+            "steradian",
+            "rad",
+            "sr",
+            "milliradian",
+            "mrad",
+            "degree",
+            "deg",
+            "e_SI",
+            "pi",
+            "two_pi",
+            "half_pi",
+            "pi_sq",
+        ),
+    ),
+    (
+        length,
+        (
+            "millimeter",
+            "mm",
+            "meter",
+            "m",
+            "centimeter",
+            "cm",
+            "kilometer",
+            "km",
+            "micrometer",
+            "micron",
+            "nanometer",
+            "angstrom",
+            "femtometer",
+            "fermi",
+            "fm",
+        ),
+    ),
+    (
+        area,
+        (
+            "millimeter2",
+            "mm2",
+            "meter2",
+            "m2",
+            "centimeter2",
+            "cm2",
+            "kilometer2",
+            "km2",
+            "fm2",
+            "barn",
+            "millibarn",
+            "microbarn",
+            "nanobarn",
+            "picobarn",
+            "femtobarn",
+            "attobarn",
+            "mb",
+            "ub",
+            "nb",
+            "pb",
+            "fb",
+            "ab",
+        ),
+    ),
+    (
+        volume,
+        (
+            "millimeter3",
+            "mm3",
+            "meter3",
+            "m3",
+            "centimeter3",
+            "cm3",
+            "kilometer3",
+            "km3",
+            "fm3",
+        ),
+    ),
+    (
+        dimensionless / area,
+        ("invmb", "invub", "invnb", "invpb", "invfb", "invab"),
+    ),
+    (
+        time,
+        (
+            "nanosecond",
+            "ns",
+            "second",
+            "millisecond",
+            "microsecond",
+            "picosecond",
+            "femtosecond",
+            "attosecond",
+            "zeptosecond",
+            "yoctosecond",
+            "s",
+            "ms",
+            "us",
+            "ps",
+            "fs",
+            "zs",
+            "ys",
+            "minute",
+            "hour",
+            "day",
+            "year",
+            "h",
+            "d",
+            "y",
+        ),
+    ),
+    (
+        frequency,
+        (
+            "hertz",
+            "kilohertz",
+            "megahertz",
+            "gigahertz",
+            "terahertz",
+            "Hz",
+            "kHz",
+            "MHz",
+            "GHz",
+            "THz",
+            "becquerel",
+            "kilobecquerel",
+            "megabecquerel",
+            "gigabecquerel",
+            "Bq",
+            "kBq",
+            "MBq",
+            "GBq",
+            "curie",
+            "millicurie",
+            "microcurie",
+            "nanocurie",
+            "Ci",
+            "mCi",
+            "uCi",
+            "nCi",
+        ),
+    ),
+    (
+        energy,
+        (
+            "megaelectronvolt",
+            "electronvolt",
+            "zettaelectronvolt",
+            "exaelectronvolt",
+            "petaelectronvolt",
+            "teraelectronvolt",
+            "gigaelectronvolt",
+            "kiloelectronvolt",
+            "ZeV",
+            "EeV",
+            "PeV",
+            "TeV",
+            "GeV",
+            "MeV",
+            "keV",
+            "eV",
+            "joule",
+            "gigajoule",
+            "megajoule",
+            "kilojoule",
+            "J",
+            "GJ",
+            "MJ",
+            "kJ",
+            "erg",
+        ),
+    ),
+    (energy**2, ("electronvolt2", "eV2")),
+    (charge, ("eplus", "eminus", "coulomb", "C")),
+    (charge**2, ("e_sq",)),
+    (temperature, ("kelvin", "K")),
+    (amount, ("mole", "mol")),
+    (luminous_intensity, ("candela", "cd", "lumen", "lm")),
+    (luminous_intensity / area, ("lux", "lx")),
+    (
+        current,
+        (
+            "ampere",
+            "milliampere",
+            "microampere",
+            "nanoampere",
+            "A",
+            "mA",
+            "uA",
+            "nA",
+        ),
+    ),
+    (
+        power,
+        ("watt", "gigawatt", "megawatt", "kilowatt", "W", "GW", "MW", "kW"),
+    ),
+    (force, ("newton", "N", "dyne")),
+    (
+        pressure,
+        ("pascal", "Pa", "bar", "millibar", "mbar", "atmosphere", "atm"),
+    ),
+    (
+        mass,
+        (
+            "kilogram",
+            "gram",
+            "quettagram",
+            "ronnagram",
+            "milligram",
+            "rontogram",
+            "Qg",
+            "Rg",
+            "kg",
+            "g",
+            "mg",
+            "rg",
+        ),
+    ),
+    (voltage, ("megavolt", "volt", "kilovolt", "MV", "kV", "V")),
+    (
+        charge / voltage,
+        (
+            "farad",
+            "millifarad",
+            "microfarad",
+            "nanofarad",
+            "picofarad",
+            "F",
+            "mF",
+            "uF",
+            "nF",
+            "pF",
+        ),
+    ),
+    (voltage / current, ("ohm",)),
+    (current / voltage, ("siemens", "S")),
+    (
+        voltage * time / area,
+        ("tesla", "T", "gauss", "kilogauss", "G", "Gs", "kG", "kGs"),
+    ),
+    (
+        voltage * time,
+        (
+            "weber",
+            "milliweber",
+            "microweber",
+            "nanoweber",
+            "Wb",
+            "mWb",
+            "uWb",
+            "nWb",
+            "maxwell",
+            "Mx",
+        ),
+    ),
+    (voltage * time / current, ("henry", "H")),
+    (
+        energy / mass,
+        (
+            "gray",
+            "megagray",
+            "kilogray",
+            "milligray",
+            "microgray",
+            "Gy",
+            "MGy",
+            "kGy",
+            "mGy",
+            "uGy",
+            "sievert",
+            "Sv",
+        ),
+    ),
+    (velocity, ("c_light",)),
+    (velocity**2, ("c_light_sq",)),
+    (energy * time, ("h_Planck", "hbar_Planck", "hbar")),
+    (energy * length, ("hbarc",)),
+    ((energy * length) ** 2, ("hbarc_sq",)),
+    (energy / temperature, ("k_Boltzmann",)),
+    (dimensionless / amount, ("Avogadro",)),
+)
+
+registry: MappingProxyType[str, Dimension] = MappingProxyType(
+    {name: dimension for dimension, names in _names for name in names}
+)
+"""Read-only mapping of the names of all units and constants to their dimensions."""
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
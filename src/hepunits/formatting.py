@@ -0,0 +1,274 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Human-readable formatting of arrays with SI prefixes, such as ``"12.4 GeV"``.
+
+Each value gets the SI prefix, among the powers of 1000 of `hepunits.units.prefixes`,
+that brings it between 1 and 1000. Prefixes are picked for whole arrays at once,
+with a search of the base-10 logarithms of the values among the exponents of the
+prefixes, and each distinct rounded value is formatted once with `numpy.char`,
+so that formatting a million values to a few significant digits takes a fraction
+of a second. Values out of the range of the prefixes are formatted without prefix,
+in scientific notation.
+
+Typical use cases::
+
+    >>> from hepunits import GeV, MeV, ps
+    >>> from hepunits.dimensions import energy
+    >>> format_with_prefixes([12.4 * GeV, 350 * MeV], energy).tolist()
+    ['12.4 GeV', '350 MeV']
+    >>> format_with_prefixes([0.35 * ps, 1500 * ps], "s").tolist()
+    ['350 fs', '1.50 ns']
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from . import dimensions
+from .dimensions import Dimension
+from .parsing import parse_unit
+from .units import prefixes
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+__all__ = ("format_with_prefixes", "with_prefixes")
+
+# Symbols of the SI prefixes that are powers of 1000, "u" standing for micro
+# as in the names of hepunits.units
+_symbols = {
+    "quecto": "q",
+    "ronto": "r",
+    "yocto": "y",
+    "zepto": "z",
+    "atto": "a",
+    "femto": "f",
+    "pico": "p",
+    "nano": "n",
+    "micro": "u",
+    "milli": "m",
+    "kilo": "k",
+    "mega": "M",
+    "giga": "G",
+    "tera": "T",
+    "peta": "P",
+    "exa": "E",
+    "zetta": "Z",
+    "yotta": "Y",
+    "ronna": "R",
+    "quetta": "Q",
+}
+
+# Unit symbols to prefix for common dimensions, with their unit expressions
+_default_units = {
+    dimensions.energy: ("eV", "eV"),
+    dimensions.mass: ("eV/c^2", "eV/c^2"),
+    dimensions.momentum: ("eV/c", "eV/c"),
+    dimensions.time: ("s", "s"),
+    dimensions.length: ("m", "m"),
+    dimensions.area: ("b", "barn"),
+    dimensions.frequency: ("Hz", "Hz"),
+    dimensions.charge: ("C", "C"),
+    dimensions.current: ("A", "A"),
+    dimensions.voltage: ("V", "V"),
+    dimensions.power: ("W", "W"),
+    dimensions.pressure: ("Pa", "Pa"),
+    dimensions.voltage * dimensions.time / dimensions.area: ("T", "T"),
+}
+
+
+# Prefixed values are between 1 and 1000, hence have up to 3 integer digits
+_integer_digits = 3
+
+# Significant digits of double-precision values
+_max_digits = 15
+
+
+@functools.cache
+def _prefix_table() -> tuple[NDArray[np.int64], NDArray[np.str_]]:
+    """The base-10 exponents of the prefixes, in increasing order, and their symbols."""
+    import numpy as np  # noqa: PLC0415
+
+    table = sorted(
+        [(0, "")]
+        + [
+            (round(math.log10(getattr(prefixes, name))), symbol)
+            for name, symbol in _symbols.items()
+        ]
+    )
+    exponents, symbols = zip(*table)
+    return np.array(exponents), np.array(symbols)
+
+
+def _unit(unit: str | Dimension) -> tuple[str, float]:
+    """The symbol to prefix and its value in the HEP system of units."""
+    if isinstance(unit, str):
+        return unit, parse_unit(unit)
+    if unit not in _default_units:
+        msg = f"No default unit for {unit}, give a unit expression instead"
+        raise ValueError(msg)
+    symbol, expression = _default_units[unit]
+    return symbol, parse_unit(expression)
+
+
+def _prefixes(exponents: NDArray[Any]) -> NDArray[np.intp]:
+    """
+    The indices in the prefix table for values of given exponents, clamped to the
+    smallest and largest prefixes.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    table = _prefix_table()[0]
+    index = np.searchsorted(table, exponents, side="right") - 1
+    return np.clip(index, 0, len(table) - 1)
+
+
+def _distinct(keys: NDArray[np.int64], size: int) -> tuple[NDArray[Any], NDArray[Any]]:
+    """The distinct keys, from 0 to size, in increasing order, and their indices."""
+    import numpy as np  # noqa: PLC0415
+
+    if size <= 8 * keys.size:
+        # Marking keys in a table of all keys is faster than sorting them
+        present = np.zeros(size, dtype=bool)
+        present[keys] = True
+        return np.flatnonzero(present), (np.cumsum(present) - 1)[keys]
+    distinct, inverse = np.unique(keys, return_inverse=True)
+    return distinct, inverse.ravel()
+
+
+def with_prefixes(
+    values: Iterable[float] | NDArray[Any], unit: str | Dimension
+) -> tuple[NDArray[np.float64], NDArray[np.str_]]:
+    """
+    Scale values in the HEP system of units to the best SI prefix of a unit.
+
+    Parameters
+    ----------
+    values : array_like
+        The values, in the HEP system of units.
+    unit : str or Dimension
+        The unit to prefix, e.g. ``"eV"`` or ``"s"``, or a dimension with a default
+        unit, such as `hepunits.dimensions.energy` (eV) or `hepunits.dimensions.area` (b).
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The scaled values, between 1 and 1000 unless they are out of the range of
+        the prefixes, which get the smallest or largest prefix, and the prefixed units.
+
+    Examples
+    --------
+    >>> from hepunits import GeV, MeV
+    >>> with_prefixes([12.4 * GeV, 350 * MeV], "eV")
+    (array([ 12.4, 350. ]), array(['GeV', 'MeV'], dtype='<U3'))
+    """
+    import numpy as np  # noqa: PLC0415
+
+    symbol, value = _unit(unit)
+    array = np.asarray(values, dtype=np.float64) / value
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponents = np.floor(np.log10(np.abs(array)))
+    # Zeros and non-finite values are not prefixed
+    exponents[~np.isfinite(exponents)] = 0
+    table, symbols = _prefix_table()
+    index = _prefixes(exponents)
+    return array / 10.0 ** table[index], np.char.add(symbols[index], symbol)
+
+
+def format_with_prefixes(
+    values: Iterable[float] | NDArray[Any], unit: str | Dimension, digits: int = 3
+) -> NDArray[np.str_]:
+    """
+    Format values in the HEP system of units with the best SI prefix of a unit.
+
+    Values are rounded to a number of significant digits, which can change their
+    prefix, and each distinct rounded value is formatted once with `numpy.char`.
+    Values out of the range of the prefixes are formatted without prefix,
+    in scientific notation.
+
+    Parameters
+    ----------
+    values : array_like
+        The values, in the HEP system of units.
+    unit : str or Dimension
+        The unit to prefix, see `with_prefixes`.
+    digits : int, optional
+        The number of significant digits, from 1 to 15, 3 by default.
+
+    Returns
+    -------
+    numpy.ndarray
+        The strings, e.g. ``"12.4 GeV"``, with the shape of the values.
+
+    Examples
+    --------
+    >>> from hepunits import eV, ps
+    >>> format_with_prefixes([25 * ps, -1.2345e-3 * ps], "s", digits=2).tolist()
+    ['25 ps', '-1.2 fs']
+    >>> format_with_prefixes([1e39 * eV], "eV").tolist()
+    ['1.00e+39 eV']
+    """
+    import numpy as np  # noqa: PLC0415
+
+    if not 1 <= digits <= _max_digits:
+        msg = f"Expected 1 to {_max_digits} significant digits, got {digits}"
+        raise ValueError(msg)
+    symbol, value = _unit(unit)
+    array = np.asarray(values, dtype=np.float64)
+    shape = array.shape
+    array = array.ravel() / value
+    magnitude = np.abs(array)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponents = np.floor(np.log10(magnitude))
+    finite = np.isfinite(exponents)
+    exponents[~finite] = 0
+
+    # Round to significant digits first, as rounding can change the prefix
+    with np.errstate(over="ignore", invalid="ignore"):
+        mantissa = np.rint(magnitude * 10.0 ** (digits - 1 - exponents))
+    carry = mantissa >= 10**digits
+    mantissa[carry] /= 10
+    exponents[carry] += 1
+
+    table, symbols = _prefix_table()
+    regular = finite & (exponents >= table[0]) & (exponents < table[-1] + 3)
+    rows = np.flatnonzero(regular)
+    index = _prefixes(exponents[rows])
+    integer_digits = (exponents[rows] - table[index] + 1).astype(np.int64)
+    negative = array[rows] < 0
+    # Formatted values are identified by their sign, prefix and rounded digits
+    keys = (negative * len(table) + index) * _integer_digits + integer_digits - 1
+    keys = keys * 10**digits + mantissa[rows].astype(np.int64)
+    keys, inverse = _distinct(keys, 2 * len(table) * _integer_digits * 10**digits)
+    keys, mantissa = np.divmod(keys, 10**digits)
+    keys, integer_digits = np.divmod(keys, _integer_digits)
+    negative, index = np.divmod(keys, len(table))
+    integer_digits += 1
+    decimals = np.maximum(digits - integer_digits, 0)
+    numbers = np.char.mod(
+        np.char.add("%.", np.char.add(decimals.astype(str), "f")),
+        np.where(negative, -1.0, 1.0) * mantissa * 10.0 ** (integer_digits - digits),
+    )
+    labels = np.char.add(" ", np.char.add(symbols[index], symbol))
+    formatted = np.char.add(numbers, labels)
+
+    # Zeros, non-finite values and values out of the range of the prefixes
+    special = np.flatnonzero(~regular)
+    scientific = np.char.add(
+        np.char.mod(
+            np.where(finite[special], f"%.{digits - 1}e", "%g"), array[special]
+        ),
+        f" {symbol}",
+    )
+    result = np.empty(array.size, np.result_type(formatted, scientific))
+    result[rows] = formatted[inverse]
+    result[special] = scientific
+    return result.reshape(shape)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
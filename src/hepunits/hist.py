@@ -0,0 +1,346 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units of the axes and contents of boost-histogram and hist histograms.
+
+The unit expression of an axis is stored in its ``unit`` attribute, and the one
+of the bin contents in the ``unit`` attribute of the histogram, which both travel
+with copies and pickles of the histogram. Histograms are converted to other units
+without refilling them: the edges of the axes are rescaled, and the contents and
+variances of the bins are rescaled with one vectorized multiply per field of the
+storage, in place, or while they are copied to the histogram with the new axes.
+
+Typical use cases::
+
+    >>> import boost_histogram as bh
+    >>> from hepunits.hist import to, with_units
+    >>> h = bh.Histogram(bh.axis.Regular(4, 0, 8000), storage=bh.storage.Weight())
+    >>> h = with_units(h, axes={0: "MeV"}, contents="pb")
+    >>> h.fill([1200.0, 4100.0])
+    Histogram(Regular(4, 0, 8000), storage=Weight()) # Sum: WeightedSum(value=2, variance=2)
+    >>> g = to(h, axes={0: "GeV"}, contents="fb")
+    >>> g.axes[0].edges
+    array([0., 2., 4., 6., 8.])
+    >>> g.view().value
+    array([1000.,    0., 1000.,    0.])
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, Union
+
+from .parsing import conversion_factor, parse_dimension
+
+try:
+    import boost_histogram as bh
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    msg = "boost-histogram is required to use hepunits.hist."
+    raise ImportError(msg) from exc
+
+__all__ = ("Units", "rescale", "to", "units", "with_units")
+
+# Name of the attribute holding the unit expression of an axis or the contents
+_attribute = "unit"
+
+# Fields of the storages scaled by the factor, and by its square
+_linear = ("value",)
+_quadratic = (
+    "variance",
+    "_sum_of_deltas_squared",
+    "_sum_of_weighted_deltas_squared",
+)
+
+# Number of bins per row of the multiplies of storages with several fields
+_row = 1024
+
+# An axis, by index or by name
+_Key = Union[int, str]
+
+_Histogram = TypeVar("_Histogram", bound="bh.Histogram[Any]")
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+class Units(NamedTuple):
+    """The units of the axes and bin contents of a histogram, None if unknown."""
+
+    axes: tuple[str | None, ...]
+    contents: str | None
+
+
+def _index(hist: bh.Histogram[Any], key: _Key) -> int:
+    """The index of an axis, given by index or by name."""
+    if isinstance(key, int):
+        if not -hist.ndim <= key < hist.ndim:
+            msg = f"No axis {key} in a histogram with {hist.ndim} axes"
+            raise IndexError(msg)
+        return key % hist.ndim
+    for index, axis in enumerate(hist.axes):
+        if getattr(axis, "name", None) == key:
+            return index
+    msg = f"No axis named {key!r}"
+    raise KeyError(msg)
+
+
+def _rescaled_axis(axis: Any, factor: float) -> Any:
+    """A copy of a continuous axis with its edges multiplied by a positive factor."""
+    result: Any
+    if isinstance(axis, bh.axis.Regular):
+        start, stop = axis.edges[0] * factor, axis.edges[-1] * factor
+        if axis.transform is not None:
+            result = type(axis)(axis.size, start, stop, transform=axis.transform)
+        else:
+            traits = axis.traits
+            result = type(axis)(
+                axis.size,
+                start,
+                stop,
+                underflow=traits.underflow,
+                overflow=traits.overflow,
+                growth=traits.growth,
+                circular=traits.circular,
+            )
+    elif isinstance(axis, bh.axis.Variable):
+        traits = axis.traits
+        result = type(axis)(
+            axis.edges * factor,
+            underflow=traits.underflow,
+            overflow=traits.overflow,
+            growth=traits.growth,
+            circular=traits.circular,
+        )
+    else:
+        msg = f"Cannot rescale the edges of {type(axis).__name__} axes"
+        raise TypeError(msg)
+    result.__dict__.update(axis.__dict__)
+    return result
+
+
+def _flat(view: Any) -> NDArray[Any]:
+    """The numbers of a contiguous view, in memory order, without copy."""
+    values = np.asarray(view).ravel(order="K")
+    return values if values.dtype.names is None else values.view(np.float64)
+
+
+def _multiply(source: NDArray[Any], scales: NDArray[Any], out: NDArray[Any]) -> None:
+    """Multiply the fields of the bins, interleaved in flat arrays, by their factors."""
+    # The fields are multiplied in rows of bins, for long contiguous inner loops
+    row = len(scales) * _row
+    head = len(source) // row * row
+    np.multiply(
+        source[:head].reshape(-1, row),
+        np.tile(scales, _row),
+        out=out[:head].reshape(-1, row),
+    )
+    np.multiply(
+        source[head:].reshape(-1, len(scales)),
+        scales,
+        out=out[head:].reshape(-1, len(scales)),
+    )
+
+
+def _scale_into(source: Any, destination: Any, factor: float) -> None:
+    """Write the bins of a view scaled by a factor into a view of the same storage."""
+    fields = source.dtype.names
+    if fields is None and factor != 1 and source.dtype.kind != "f":
+        msg = "Cannot rescale the contents of integer storages, use a Double storage"
+        raise TypeError(msg)
+    contiguous = source.strides == destination.strides and all(
+        view.flags.c_contiguous or view.flags.f_contiguous
+        for view in (source, destination)
+    )
+    if fields is None:
+        if contiguous:
+            source, destination = _flat(source), _flat(destination)
+        np.multiply(source, factor, out=destination, casting="unsafe")
+        return
+    scales = {
+        **dict.fromkeys(_linear, factor),
+        **dict.fromkeys(_quadratic, factor**2),
+    }
+    if contiguous:
+        _multiply(
+            _flat(source),
+            np.array([scales.get(field, 1.0) for field in fields]),
+            _flat(destination),
+        )
+    else:
+        for field in fields:
+            np.multiply(source[field], scales.get(field, 1.0), out=destination[field])
+
+
+def with_units(
+    hist: _Histogram,
+    axes: Mapping[_Key, str] | None = None,
+    contents: str | None = None,
+) -> _Histogram:
+    """
+    Tag the axes and bin contents of a histogram with their units, in place.
+
+    Parameters
+    ----------
+    hist : boost_histogram.Histogram
+        The histogram, possibly a `hist.Hist`.
+    axes : dict, optional
+        The unit expressions of the edges of axes, by index or by name, e.g. ``{0: "GeV"}``.
+    contents : str, optional
+        The unit expression of the bin contents, e.g. ``"pb"``.
+        The contents are numbers of events by default.
+
+    Returns
+    -------
+    boost_histogram.Histogram
+        The histogram, with its units.
+    """
+    for key, unit in (axes or {}).items():
+        parse_dimension(unit)
+        setattr(hist.axes[_index(hist, key)], _attribute, unit)
+    if contents is not None:
+        parse_dimension(contents)
+        setattr(hist, _attribute, contents)
+    return hist
+
+
+def units(hist: bh.Histogram[Any]) -> Units:
+    """
+    Get the units of the axes and bin contents of a histogram, see `with_units`.
+
+    Parameters
+    ----------
+    hist : boost_histogram.Histogram
+        The histogram.
+
+    Returns
+    -------
+    Units
+        The unit expressions of the axes and contents, None if they have no units.
+    """
+    return Units(
+        tuple(getattr(axis, _attribute, None) for axis in hist.axes),
+        getattr(hist, _attribute, None),
+    )
+
+
+def rescale(
+    hist: _Histogram,
+    axes: Mapping[_Key, float] | None = None,
+    contents: float = 1.0,
+    *,
+    inplace: bool = False,
+) -> _Histogram:
+    """
+    Multiply the edges of axes, and the contents of bins, by factors.
+
+    Values are multiplied by the factor, and variances by its square. The edges
+    of the axes of a histogram cannot change, hence histograms with rescaled
+    axes are new histograms, whose bins are rescaled while copied from the
+    original ones, in one pass.
+
+    Parameters
+    ----------
+    hist : boost_histogram.Histogram
+        The histogram, possibly a `hist.Hist`.
+    axes : dict, optional
+        Positive factors of the edges of continuous axes, by index or by name.
+    contents : float, optional
+        The factor of the contents of the bins.
+    inplace : bool, optional
+        Whether to rescale the contents of the histogram in place,
+        only if no axes are rescaled.
+
+    Returns
+    -------
+    boost_histogram.Histogram
+        The rescaled histogram.
+
+    Raises
+    ------
+    ValueError
+        If axes are rescaled in place, or a factor of axes is not positive.
+    TypeError
+        If the edges of a discrete axis, or the contents of an integer storage,
+        are rescaled.
+    """
+    factors = {_index(hist, key): factor for key, factor in (axes or {}).items()}
+    factors = {index: factor for index, factor in factors.items() if factor != 1}
+    if any(factor <= 0 for factor in factors.values()):
+        msg = f"The factors of axes must be positive, got {axes}"
+        raise ValueError(msg)
+    if inplace:
+        if factors:
+            msg = "The axes of a histogram cannot be rescaled in place"
+            raise ValueError(msg)
+        if contents != 1:
+            view = hist.view(flow=True)
+            _scale_into(view, view, contents)
+        return hist
+
+    new_axes = [
+        _rescaled_axis(axis, factors[index]) if index in factors else axis
+        for index, axis in enumerate(hist.axes)
+    ]
+    result = type(hist)(*new_axes, storage=hist.storage_type())
+    result.__dict__.update(hist.__dict__)
+    _scale_into(hist.view(flow=True), result.view(flow=True), contents)
+    return result
+
+
+def to(
+    hist: _Histogram,
+    axes: Mapping[_Key, str] | None = None,
+    contents: str | None = None,
+    *,
+    inplace: bool = False,
+) -> _Histogram:
+    """
+    Convert the axes and bin contents of a histogram to other units, see `with_units`.
+
+    Parameters
+    ----------
+    hist : boost_histogram.Histogram
+        The histogram with units.
+    axes : dict, optional
+        The unit expressions to convert the axes to, by index or by name.
+    contents : str, optional
+        The unit expression to convert the bin contents to.
+    inplace : bool, optional
+        Whether to convert the contents of the histogram in place,
+        only if no axes change units.
+
+    Returns
+    -------
+    boost_histogram.Histogram
+        The histogram in the given units, see `rescale`.
+
+    Raises
+    ------
+    ValueError
+        If an axis or the contents have no units, or if axes are converted in place.
+    DimensionError
+        If the units have different dimensions.
+    """
+    current = units(hist)
+    new_units: dict[_Key, str] = {}
+    factors: dict[_Key, float] = {}
+    for key, unit in (axes or {}).items():
+        index = _index(hist, key)
+        new_units[index] = unit
+        current_unit = current.axes[index]
+        if current_unit is None:
+            msg = f"Axis {index} has no units, see hepunits.hist.with_units"
+            raise ValueError(msg)
+        factors[index] = conversion_factor(current_unit, unit)
+    factor = 1.0
+    if contents is not None:
+        if current.contents is None:
+            msg = "The contents have no units, see hepunits.hist.with_units"
+            raise ValueError(msg)
+        factor = conversion_factor(current.contents, contents)
+    result = rescale(hist, factors, factor, inplace=inplace)
+    return with_units(result, new_units, contents)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,177 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Conversions of large files of values between units.
+
+Files are memory-mapped and converted chunk by chunk, so that files larger
+than the memory are converted with bounded memory. Chunks are independent,
+hence can be converted in parallel by a pool of threads, as NumPy releases
+the GIL while multiplying.
+
+Typical use cases::
+
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> import numpy as np
+    >>> from hepunits.io import convert_file
+    >>> directory = Path(tempfile.mkdtemp())
+    >>> np.save(directory / "times.npy", np.array([1.5, 0.25]))
+    >>> convert_file(directory / "times.npy", directory / "times_ps.npy", "ns", "ps").fraction
+    1.0
+    >>> np.load(directory / "times_ps.npy")
+    array([1500.,  250.])
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, Union
+
+from .parsing import conversion_factor
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import DTypeLike
+
+__all__ = ("Progress", "convert_file")
+
+_Path = Union[str, "os.PathLike[str]"]
+
+
+class Progress(NamedTuple):
+    """The progress of a conversion, see `convert_file`."""
+
+    done: int
+    """Number of bytes converted."""
+    total: int
+    """Number of bytes to convert."""
+    elapsed: float
+    """Time since the start of the conversion, in seconds."""
+
+    @property
+    def fraction(self) -> float:
+        """The fraction of the values converted."""
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """The number of bytes converted per second."""
+        return self.done / self.elapsed if self.elapsed else 0.0
+
+
+def _open(
+    source: _Path, destination: _Path | None, dtype: DTypeLike | None
+) -> tuple[np.memmap[Any, Any], np.memmap[Any, Any]]:
+    """Memory-map the input and output files, which are the same for in-place conversions."""
+    import numpy as np  # noqa: PLC0415
+
+    in_place = (
+        destination is None or Path(source).resolve() == Path(destination).resolve()
+    )
+    if dtype is None:
+        values = np.lib.format.open_memmap(source, mode="r+" if in_place else "r")
+    else:
+        values = np.memmap(source, dtype=dtype, mode="r+" if in_place else "r")
+    if not np.issubdtype(values.dtype, np.floating):
+        msg = f"Expected floating-point values, got {values.dtype}"
+        raise TypeError(msg)
+    if destination is None or in_place:
+        return values, values
+    if dtype is None:
+        result = np.lib.format.open_memmap(
+            destination,
+            mode="w+",
+            dtype=values.dtype,
+            shape=values.shape,
+            fortran_order=values.flags.f_contiguous and not values.flags.c_contiguous,
+        )
+    else:
+        result = np.memmap(
+            destination, dtype=values.dtype, mode="w+", shape=values.shape
+        )
+    return values, result
+
+
+def convert_file(  # noqa: PLR0913
+    source: _Path,
+    destination: _Path | None,
+    from_unit: str,
+    to_unit: str,
+    *,
+    chunk: int = 1 << 22,
+    dtype: DTypeLike | None = None,
+    workers: int = 1,
+    progress: Callable[[Progress], None] | None = None,
+) -> Progress:
+    """
+    Convert the values of a file from a unit to another one.
+
+    The files are memory-mapped, and the values converted in chunks,
+    so that only a few chunks are in memory at any time.
+
+    Parameters
+    ----------
+    source : str or os.PathLike
+        The path of the file, a ``.npy`` file or, if ``dtype`` is given,
+        a raw binary file of floating-point values.
+    destination : str or os.PathLike or None
+        The path of the converted file, of the same format and data type.
+        If None, or the path of the source, the values are converted in place.
+    from_unit, to_unit : str
+        The unit expressions, e.g. ``"ns"`` and ``"ps"``.
+    chunk : int, optional
+        The number of values per chunk.
+    dtype : numpy.dtype, optional
+        The data type of the values of a raw binary file.
+    workers : int, optional
+        The number of threads converting chunks in parallel.
+    progress : callable, optional
+        Called with the `Progress` of the conversion after each chunk.
+
+    Returns
+    -------
+    Progress
+        The final progress, with the total time and throughput.
+
+    Raises
+    ------
+    DimensionError
+        If the units have different dimensions.
+    TypeError
+        If the values are not floating-point numbers.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    if chunk < 1 or workers < 1:
+        msg = f"Expected positive chunk and workers, got {chunk} and {workers}"
+        raise ValueError(msg)
+    factor = conversion_factor(from_unit, to_unit)
+    start = time.perf_counter()
+    values, result = _open(source, destination, dtype)
+    flat_values = values.reshape(-1, order="A")
+    flat_result = result.reshape(-1, order="A")
+    total = values.nbytes
+
+    def convert(offset: int) -> int:
+        piece = flat_values[offset : offset + chunk]
+        np.multiply(piece, factor, out=flat_result[offset : offset + chunk])
+        return int(piece.nbytes)
+
+    # Values converted in place by a factor 1 are left as they are
+    skip = factor == 1 and values is result
+    offsets = range(0, 0 if skip else flat_values.size, chunk)
+    done = 0
+    with ThreadPoolExecutor(workers) as executor:
+        for nbytes in executor.map(convert, offsets):
+            done += nbytes
+            if progress is not None:
+                progress(Progress(done, total, time.perf_counter() - start))
+    result.flush()
+    return Progress(total, total, time.perf_counter() - start)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,662 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Static dimensional analysis of Python code using hepunits.
+
+The linter parses Python sources with `ast`, without running them, and resolves
+the names imported from `hepunits`, `hepunits.units`, `hepunits.constants` and
+`hepunits.systems` to their dimensions, see `hepunits.dimensions.registry`.
+Dimensions are propagated through arithmetic and through assignments to local
+names, which are unknown after branches assigning them different dimensions,
+and the following are flagged:
+
+* additions and subtractions of quantities of different dimensions,
+* comparisons of quantities of different dimensions,
+* additions, subtractions and comparisons of quantities and non-zero plain
+  numbers, which are implicitly in the HEP system of units.
+
+Values of unknown dimensions, such as function arguments, are never flagged.
+
+Files are analyzed in a pool of processes, and the findings of each file are
+cached by the hash of its content, so that only changed files are analyzed again.
+The ``hepunits-lint`` command runs the linter on files and directories.
+
+Typical use cases::
+
+    >>> source = '''
+    ... from hepunits import GeV, mm
+    ... window = 5 * GeV
+    ... if window > 2 * mm:
+    ...     pass
+    ... '''
+    >>> for finding in lint_source(source, "selection.py"):
+    ...     print(finding)
+    selection.py:4:3: comparison of [energy] and [length]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, Union
+
+from ._version import version
+from .dimensions import Dimension, DimensionError, dimensionless, registry
+
+__all__ = ("Finding", "lint_paths", "lint_source", "main")
+
+# Version of the rules, part of the keys of cached findings
+_rules_version = 2
+
+# Modules whose names are units and constants
+_modules = frozenset(
+    {
+        "hepunits",
+        "hepunits.units",
+        "hepunits.units.units",
+        "hepunits.units.prefixes",
+        "hepunits.constants",
+        "hepunits.constants.constants",
+        "hepunits.systems.geant3",
+        "hepunits.systems.hep",
+        "hepunits.systems.root",
+        "hepunits.systems.si",
+    }
+)
+
+# Functions of one argument whose result has the dimension of the argument
+# raised to a power
+_functions = {
+    "abs": 1,
+    "sqrt": 0.5,
+    "cbrt": 1 / 3,
+    "fabs": 1,
+    "square": 2,
+}
+
+
+class Finding(NamedTuple):
+    """A dimensional error found in a file."""
+
+    path: str
+    line: int
+    column: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}:{self.column}: {self.message}"
+
+
+class _Number:
+    """The dimension of plain numbers, compatible with any dimension if zero."""
+
+    def __init__(self, zero: bool) -> None:
+        self.zero = zero
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Number) and other.zero == self.zero
+
+    def __hash__(self) -> int:
+        return hash(self.zero)
+
+
+# The dimension of an expression: a Dimension, a plain number, or None if unknown
+_Inferred = Union[Dimension, _Number, None]
+
+
+def _dimension(value: _Inferred) -> Dimension | None:
+    if isinstance(value, _Number):
+        return dimensionless
+    return value
+
+
+class _Analyzer(ast.NodeVisitor):
+    """Infer the dimensions of expressions, and collect the dimensional errors."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.findings: list[Finding] = []
+        # Local names bound to hepunits modules, and to values of known dimensions,
+        # or to plain numbers, so that names bound to 0 stay compatible with any
+        self.modules: dict[str, str] = {}
+        self.names: dict[str, Dimension | _Number] = {}
+
+    # Scopes ---------------------------------------------------------------
+
+    def _scope(self, node: ast.AST, arguments: ast.arguments | None) -> None:
+        modules, names = dict(self.modules), dict(self.names)
+        if arguments is not None:
+            for argument in (
+                *arguments.posonlyargs,
+                *arguments.args,
+                *arguments.kwonlyargs,
+                arguments.vararg,
+                arguments.kwarg,
+            ):
+                if argument is not None:
+                    self._unbind(argument.arg)
+        self.generic_visit(node)
+        self.modules, self.names = modules, names
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._scope(node, node.args)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._scope(node, node.args)
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        self._scope(node, node.args)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        # The names bound in the body of a class are not visible in its methods
+        modules, names = dict(self.modules), dict(self.names)
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                inner = self.modules, self.names
+                self.modules, self.names = dict(modules), dict(names)
+                self.visit(child)
+                self.modules, self.names = inner
+            elif isinstance(child, ast.expr):
+                self.infer(child)
+            else:
+                self.visit(child)
+        self.modules, self.names = modules, names
+
+    # Bindings -------------------------------------------------------------
+
+    def _unbind(self, name: str) -> None:
+        self.modules.pop(name, None)
+        self.names.pop(name, None)
+
+    def _bind(self, target: ast.expr, value: _Inferred) -> None:
+        if isinstance(target, ast.Name):
+            self._unbind(target.id)
+            if value is not None:
+                self.names[target.id] = value
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self._bind(element, None)
+        elif isinstance(target, ast.Starred):
+            self._bind(target.value, None)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.asname is not None:
+                self._unbind(alias.asname)
+                if alias.name in _modules:
+                    self.modules[alias.asname] = alias.name
+            else:
+                top = alias.name.partition(".")[0]
+                self._unbind(top)
+                if top == "hepunits":
+                    self.modules[top] = top
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        for alias in node.names:
+            if alias.name == "*":
+                if module in _modules:
+                    self.names.update(_star(module))
+                continue
+            name = alias.asname or alias.name
+            self._unbind(name)
+            if f"{module}.{alias.name}" in _modules:
+                self.modules[name] = f"{module}.{alias.name}"
+            elif module in _modules and alias.name in registry:
+                self.names[name] = registry[alias.name]
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        value = self.infer(node.value)
+        for target in node.targets:
+            self._bind(target, value)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        value = None if node.value is None else self.infer(node.value)
+        self._bind(node.target, value)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        value = self.infer(ast.BinOp(node.target, node.op, node.value), node)
+        self._bind(node.target, value)
+
+    def visit_NamedExpr(self, node: ast.NamedExpr) -> None:
+        self._bind(node.target, self.infer(node.value))
+
+    def _branches(self, *bodies: Sequence[ast.AST]) -> None:
+        """
+        Visit alternative branches, all from the current bindings.
+
+        Only the names bound to the same module or dimension in all the branches
+        stay bound after them.
+        """
+        before = self.modules, self.names
+        after = []
+        for body in bodies:
+            self.modules, self.names = dict(before[0]), dict(before[1])
+            for statement in body:
+                self.visit(statement)
+            after.append((self.modules, self.names))
+        (modules, names), *others = after
+        self.modules = {
+            name: module
+            for name, module in modules.items()
+            if all(other[0].get(name) == module for other in others)
+        }
+        self.names = {
+            name: value
+            for name, value in names.items()
+            if all(other[1].get(name) == value for other in others)
+        }
+
+    def visit_If(self, node: ast.If) -> None:
+        self.infer(node.test)
+        self._branches(node.body, node.orelse)
+
+    def visit_While(self, node: ast.While) -> None:
+        self.infer(node.test)
+        # The body runs any number of times, including none
+        self._branches([*node.body, *node.orelse], node.orelse)
+
+    def _loop(self, node: ast.For | ast.AsyncFor) -> None:
+        self.infer(node.iter)
+        self._bind(node.target, None)
+        self._branches([*node.body, *node.orelse], node.orelse)
+
+    def visit_For(self, node: ast.For) -> None:
+        self._loop(node)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        self._loop(node)
+
+    def _try(self, node: ast.Try | ast.TryStar) -> None:
+        handlers = []
+        for handler in node.handlers:
+            if handler.type is not None:
+                self.infer(handler.type)
+            if handler.name is not None:
+                self._unbind(handler.name)
+            handlers.append(handler.body)
+        self._branches([*node.body, *node.orelse], *handlers)
+        for statement in node.finalbody:
+            self.visit(statement)
+
+    def visit_Try(self, node: ast.Try) -> None:
+        self._try(node)
+
+    def visit_TryStar(self, node: ast.TryStar) -> None:
+        self._try(node)
+
+    def visit_Match(self, node: ast.Match) -> None:
+        self.infer(node.subject)
+        cases = []
+        for case in node.cases:
+            # The names captured by patterns are unknown
+            for pattern in ast.walk(case.pattern):
+                name = getattr(pattern, "name", None) or getattr(pattern, "rest", None)
+                if name is not None:
+                    self._unbind(name)
+            if case.guard is not None:
+                self.infer(case.guard)
+            cases.append(case.body)
+        # No case may match
+        self._branches(*cases, [])
+
+    # Expressions ----------------------------------------------------------
+
+    def visit_Expr(self, node: ast.Expr) -> None:
+        self.infer(node.value)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Expressions are inferred from the statements that contain them
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                self.infer(child)
+            else:
+                self.visit(child)
+
+    def _report(self, node: ast.AST, message: str) -> None:
+        self.findings.append(
+            Finding(self.path, node.lineno, node.col_offset, message)  # type: ignore[attr-defined]
+        )
+
+    def _check(
+        self, node: ast.AST, what: str, left: _Inferred, right: _Inferred
+    ) -> _Inferred:
+        """Check that two operands are compatible, and return the known one."""
+        if left is None or right is None:
+            return None
+        if isinstance(left, _Number) and isinstance(right, _Number):
+            return _Number(left.zero and right.zero)
+        if isinstance(left, _Number) or isinstance(right, _Number):
+            number, dimension = (
+                (left, right) if isinstance(left, _Number) else (right, left)
+            )
+            assert isinstance(number, _Number)
+            assert isinstance(dimension, Dimension)
+            if not number.zero and dimension != dimensionless:
+                self._report(node, f"{what} of {dimension} and a plain number")
+            return dimension
+        if left != right:
+            self._report(node, f"{what} of {left} and {right}")
+            return None
+        return left
+
+    def _module(self, node: ast.expr) -> str | None:
+        """The hepunits module an expression refers to, if any."""
+        if isinstance(node, ast.Name):
+            return self.modules.get(node.id)
+        if isinstance(node, ast.Attribute):
+            parent = self._module(node.value)
+            if parent is not None and f"{parent}.{node.attr}" in _modules:
+                return f"{parent}.{node.attr}"
+        return None
+
+    def infer(self, node: ast.expr, location: ast.AST | None = None) -> _Inferred:  # noqa: PLR0911, PLR0912
+        """Infer the dimension of an expression, reporting errors on the way."""
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, (int, float)) and not isinstance(
+                node.value, bool
+            ):
+                return _Number(node.value == 0)
+            return None
+        if isinstance(node, ast.Name):
+            return self.names.get(node.id)
+        if isinstance(node, ast.Attribute):
+            module = self._module(node.value)
+            if module is not None:
+                return registry.get(node.attr)
+            self.infer(node.value)
+            return None
+        if isinstance(node, ast.UnaryOp):
+            operand = self.infer(node.operand)
+            return None if isinstance(node.op, ast.Not) else operand
+        if isinstance(node, ast.BinOp):
+            return self._binary(node, location or node)
+        if isinstance(node, ast.Compare):
+            left = self.infer(node.left)
+            for op, comparator in zip(node.ops, node.comparators):
+                right = self.infer(comparator)
+                if not isinstance(op, (ast.Is, ast.IsNot, ast.In, ast.NotIn)):
+                    self._check(node, "comparison", left, right)
+                left = right
+            return None
+        if isinstance(node, ast.IfExp):
+            self.infer(node.test)
+            body, orelse = self.infer(node.body), self.infer(node.orelse)
+            return body if _dimension(body) == _dimension(orelse) else None
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        if isinstance(node, ast.NamedExpr):
+            value = self.infer(node.value)
+            self._bind(node.target, value)
+            return value
+        if isinstance(node, ast.Lambda):
+            self.visit(node)
+            return None
+        if isinstance(
+            node, (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)
+        ):
+            self._comprehension(node)
+            return None
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                self.infer(child)
+        return None
+
+    def _comprehension(
+        self, node: ast.ListComp | ast.SetComp | ast.GeneratorExp | ast.DictComp
+    ) -> None:
+        modules, names = dict(self.modules), dict(self.names)
+        for generator in node.generators:
+            self.infer(generator.iter)
+            self._bind(generator.target, None)
+            for condition in generator.ifs:
+                self.infer(condition)
+        elements = (
+            (node.key, node.value) if isinstance(node, ast.DictComp) else (node.elt,)
+        )
+        for element in elements:
+            self.infer(element)
+        self.modules, self.names = modules, names
+
+    def _binary(self, node: ast.BinOp, location: ast.AST) -> _Inferred:
+        left = self.infer(node.left)
+        if isinstance(node.op, ast.Pow):
+            self.infer(node.right)
+            return _power(left, _exponent(node.right))
+        right = self.infer(node.right)
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            what = "addition" if isinstance(node.op, ast.Add) else "subtraction"
+            return self._check(location, what, left, right)
+        if not isinstance(node.op, (ast.Mult, ast.Div)):
+            return None
+        if isinstance(left, _Number) and isinstance(right, _Number):
+            return _Number(left.zero)
+        left, right = _dimension(left), _dimension(right)
+        if left is None or right is None:
+            return None
+        return left * right if isinstance(node.op, ast.Mult) else left / right
+
+    def _call(self, node: ast.Call) -> _Inferred:
+        arguments = [self.infer(argument) for argument in node.args]
+        for keyword in node.keywords:
+            self.infer(keyword.value)
+        function = node.func
+        name = function.attr if isinstance(function, ast.Attribute) else None
+        if isinstance(function, ast.Name):
+            name = function.id
+        else:
+            self.infer(function)
+        if name in _functions and len(arguments) == 1:
+            return _power(arguments[0], _functions[name])
+        return None
+
+
+def _exponent(node: ast.expr) -> float | None:
+    """The value of a literal exponent, None for other expressions."""
+    try:
+        value = ast.literal_eval(node)
+    except (TypeError, ValueError):
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _power(base: _Inferred, exponent: float | None) -> _Inferred:
+    if isinstance(base, _Number) or base is None:
+        return base
+    if exponent is None:
+        return None
+    try:
+        return base**exponent
+    except DimensionError:
+        return None
+
+
+def _star(module: str) -> dict[str, Dimension]:
+    """The dimensions of the names imported by ``from module import *``."""
+    import importlib  # noqa: PLC0415
+
+    names = importlib.import_module(module).__all__
+    return {name: registry[name] for name in names if name in registry}
+
+
+def lint_source(source: str, path: str = "<string>") -> list[Finding]:
+    """
+    Find the dimensional errors of Python code.
+
+    Parameters
+    ----------
+    source : str
+        The Python code.
+    path : str, optional
+        The path of the file, for the findings.
+
+    Returns
+    -------
+    list of Finding
+        The errors, in the order of the code.
+
+    Raises
+    ------
+    SyntaxError
+        If the code is not valid Python.
+    """
+    analyzer = _Analyzer(path)
+    analyzer.visit(ast.parse(source, path))
+    return sorted(analyzer.findings)
+
+
+def _files(paths: Iterable[str | os.PathLike[str]]) -> Iterator[Path]:
+    """The Python files in paths, skipping hidden directories."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            for root, directories, files in os.walk(path):
+                directories[:] = sorted(d for d in directories if not d.startswith("."))
+                for file in sorted(files):
+                    if file.endswith(".py"):
+                        yield Path(root) / file
+        else:
+            yield path
+
+
+def _lint_content(content: bytes) -> list[tuple[int, int, str]]:
+    """The findings of a file, without its path, as cached."""
+    try:
+        findings = lint_source(content.decode("utf-8"), "")
+    except (SyntaxError, UnicodeDecodeError, ValueError) as error:
+        line = getattr(error, "lineno", None) or 1
+        return [(line, 0, f"cannot parse: {error}")]
+    return [(finding.line, finding.column, finding.message) for finding in findings]
+
+
+def _key(content: bytes) -> str:
+    digest = hashlib.sha256(f"{version}:{_rules_version}:".encode())
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def lint_paths(
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    jobs: int | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> list[Finding]:
+    """
+    Find the dimensional errors of Python files.
+
+    Parameters
+    ----------
+    paths : iterable of str or os.PathLike
+        The files, and directories searched for ``.py`` files.
+    jobs : int, optional
+        The number of processes analyzing files, the number of CPUs by default.
+    cache_dir : str or os.PathLike, optional
+        The directory where the findings of files are cached by the hash of their
+        content. By default, files are analyzed every time.
+
+    Returns
+    -------
+    list of Finding
+        The errors, sorted by file and position.
+    """
+    files = list(_files(paths))
+    contents = [file.read_bytes() for file in files]
+    keys = [_key(content) for content in contents]
+    cache = None if cache_dir is None else Path(cache_dir)
+    results: dict[str, list[tuple[int, int, str]]] = {}
+    if cache is not None:
+        for key in set(keys):
+            entry = cache / f"{key}.json"
+            if entry.is_file():
+                results[key] = [
+                    (line, column, message)
+                    for line, column, message in json.loads(entry.read_text())
+                ]
+
+    pending = {
+        key: content for key, content in zip(keys, contents) if key not in results
+    }
+    workers = min(jobs or os.cpu_count() or 1, len(pending))
+    if workers > 1:
+        # Files are sent in batches, a few per worker, to amortize the transfers
+        chunksize = max(1, len(pending) // (4 * workers))
+        with ProcessPoolExecutor(workers) as executor:
+            analyzed = executor.map(
+                _lint_content, pending.values(), chunksize=chunksize
+            )
+            results.update(zip(pending, analyzed))
+    else:
+        results.update(
+            (key, _lint_content(content)) for key, content in pending.items()
+        )
+
+    if cache is not None and pending:
+        cache.mkdir(parents=True, exist_ok=True)
+        (cache / ".gitignore").write_text("*\n")
+        for key in pending:
+            entry = cache / f"{key}.json"
+            temporary = entry.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_text(json.dumps(results[key]))
+            temporary.replace(entry)
+
+    return [
+        Finding(str(file), line, column, message)
+        for file, key in zip(files, keys)
+        for line, column, message in results[key]
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the ``hepunits-lint`` command.
+
+    Parameters
+    ----------
+    argv : sequence of str, optional
+        The command-line arguments, ``sys.argv[1:]`` by default.
+
+    Returns
+    -------
+    int
+        The exit status: 1 if errors were found, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="hepunits-lint",
+        description="Find dimensional errors in Python code using hepunits.",
+    )
+    parser.add_argument("paths", nargs="+", help="files and directories to analyze")
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="number of processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".hepunits_lint_cache",
+        help="directory of the cached findings (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="analyze all files again"
+    )
+    arguments = parser.parse_args(argv)
+    findings = lint_paths(
+        arguments.paths,
+        jobs=arguments.jobs,
+        cache_dir=None if arguments.no_cache else arguments.cache_dir,
+    )
+    for finding in findings:
+        sys.stdout.write(f"{finding}\n")
+    return 1 if findings else 0
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Conversions between natural units, with hbar = c = 1, and the HEP system of units.
+
+In natural units, all dimensions are powers of an energy: lengths and times are
+in GeV^-1, cross sections in GeV^-2, masses and momenta in GeV. A quantity of
+dimension ``length ** a * time ** b * energy ** c`` is the product of
+``energy ** (c - a - b)``, ``hbar ** (a + b)`` and ``c_light ** a``. These powers
+are solved once per dimension, and the conversion factors are cached, so that
+arrays are converted in a single multiply.
+
+Typical use cases::
+
+    >>> from hepunits.natural import from_natural, to_natural
+    >>> round(from_natural(1.0, "mb"), 4)  # 1 GeV^-2 in millibarn
+    0.3894
+    >>> round(to_natural(1.0, "fm"), 4)  # 1 fm in GeV^-1
+    5.0677
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, TypeVar
+
+from .constants import c_light, hbar
+from .dimensions import Dimension, DimensionError
+from .parsing import parse_dimension, parse_unit
+
+__all__ = ("factor", "from_natural", "powers", "to_natural")
+
+_T = TypeVar("_T")
+
+
+@functools.lru_cache(maxsize=1024)
+def powers(dimension: Dimension) -> tuple[int, int, int]:
+    """
+    Get the powers of an energy, hbar and c_light making up a dimension.
+
+    Parameters
+    ----------
+    dimension : Dimension
+        The dimension, which can only involve length, time and energy.
+
+    Returns
+    -------
+    tuple of int
+        The powers of the energy, i.e. the dimension in natural units,
+        of hbar and of c_light.
+
+    Raises
+    ------
+    DimensionError
+        If the dimension involves other base quantities.
+
+    Examples
+    --------
+    >>> from hepunits.dimensions import area
+    >>> powers(area)
+    (-2, 2, 2)
+    """
+    if any(dimension[3:]):
+        msg = f"Cannot express {dimension} in natural units"
+        raise DimensionError(msg)
+    return (
+        dimension.energy - dimension.length - dimension.time,
+        dimension.length + dimension.time,
+        dimension.length,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def factor(unit: str, energy: str = "GeV") -> float:
+    """
+    Get the factor converting values from natural units to a unit.
+
+    Parameters
+    ----------
+    unit : str
+        The unit expression, e.g. ``"pb"``.
+    energy : str, optional
+        The unit of energy of natural units, GeV by default.
+
+    Returns
+    -------
+    float
+        The value, in the unit, of the power of the energy of the same dimension.
+
+    Raises
+    ------
+    DimensionError
+        If the unit cannot be expressed in natural units, or ``energy``
+        is not a unit of energy.
+
+    Examples
+    --------
+    >>> factor("GeV^-1", "GeV")
+    1.0
+    """
+    if parse_dimension(energy) != Dimension(energy=1):
+        msg = f"Expected a unit of energy, got {energy!r}"
+        raise DimensionError(msg)
+    n, p, q = powers(parse_dimension(unit))
+    return parse_unit(energy) ** n * hbar**p * c_light**q / parse_unit(unit)
+
+
+def from_natural(values: _T, unit: str, energy: str = "GeV") -> _T:
+    """
+    Convert values in natural units to a unit, see `factor`.
+
+    Parameters
+    ----------
+    values : float or array_like
+        The values, in powers of ``energy``, e.g. GeV^-2 for cross sections.
+    unit : str
+        The unit expression to convert to, e.g. ``"pb"``.
+    energy : str, optional
+        The unit of energy of natural units, GeV by default.
+
+    Returns
+    -------
+    float or array_like
+        The values in the unit.
+
+    Examples
+    --------
+    >>> round(from_natural(1.0, "pb"), -4)
+    389380000.0
+    """
+    scale: Any = factor(unit, energy)
+    return values * scale  # type: ignore[no-any-return]
+
+
+def to_natural(values: _T, unit: str, energy: str = "GeV") -> _T:
+    """
+    Convert values in a unit to natural units, see `factor`.
+
+    Parameters
+    ----------
+    values : float or array_like
+        The values, in the unit.
+    unit : str
+        The unit expression of the values, e.g. ``"fm"``.
+    energy : str, optional
+        The unit of energy of natural units, GeV by default.
+
+    Returns
+    -------
+    float or array_like
+        The values in powers of ``energy``, e.g. GeV^-1 for lengths.
+    """
+    scale: Any = 1 / factor(unit, energy)
+    return values * scale  # type: ignore[no-any-return]
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,135 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units, constants and conversions for Numba-compiled kernels.
+
+Numba freezes global variables at compile time. This module exposes the units and
+constants of `hepunits` as named tuples of floats, `units` and `constants`, which
+Numba treats as compile-time constants: their values are folded into the compiled
+code as literals, and no attribute is looked up when a kernel runs.
+
+Conversions between two units are available as compiled functions from `converter`,
+which checks the dimensions of the units once, when the converter is created.
+Values in the HEP system of units are in millimeter, nanosecond, MeV, etc.
+
+Typical use cases::
+
+    >>> import numba
+    >>> from hepunits.numba import converter, units
+    >>> @numba.njit
+    ... def pt_threshold(pt):
+    ...     return pt > 20 * units.GeV
+    >>> pt_threshold(25_000.0)
+    True
+    >>> to_ps = converter("ns", "ps")
+    >>> @numba.njit
+    ... def time_in_ps(t):
+    ...     return to_ps(t)
+    >>> time_in_ps(1.5)
+    1500.0
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import namedtuple
+from types import ModuleType
+from typing import Any
+
+from . import constants as _constants
+from . import units as _units
+from .parsing import conversion_factor
+
+try:
+    import numba
+except ImportError as exc:  # pragma: no cover
+    msg = "Numba is required to use hepunits.numba."
+    raise ImportError(msg) from exc
+
+__all__ = ("constants", "converter", "factor", "units")
+
+
+def _table(name: str, module: ModuleType) -> Any:
+    values = {
+        key: float(value)
+        for key in module.__all__
+        if isinstance(value := getattr(module, key), (int, float))
+    }
+    return namedtuple(name, values)(**values)
+
+
+units = _table("Units", _units)
+"""The units of `hepunits.units`, as a named tuple of floats."""
+
+constants = _table("Constants", _constants)
+"""The constants of `hepunits.constants`, as a named tuple of floats."""
+
+
+def factor(from_unit: str, to_unit: str) -> float:
+    """
+    Get the factor converting values from a unit to another one.
+
+    See `hepunits.parsing.conversion_factor`.
+
+    Parameters
+    ----------
+    from_unit, to_unit : str
+        The unit expressions, e.g. ``"MeV"`` and ``"GeV"``.
+
+    Returns
+    -------
+    float
+        The conversion factor.
+
+    Raises
+    ------
+    DimensionError
+        If the units have different dimensions.
+
+    Examples
+    --------
+    >>> factor("GeV", "MeV")
+    1000.0
+    """
+    return conversion_factor(from_unit, to_unit)
+
+
+@functools.lru_cache(maxsize=1024)
+def converter(from_unit: str, to_unit: str) -> Any:
+    """
+    Get a compiled function converting values from a unit to another one.
+
+    The function is inlined in the kernels that call it, with the conversion
+    factor as a literal, see `factor`. It converts scalars as well as arrays.
+
+    Parameters
+    ----------
+    from_unit, to_unit : str
+        The unit expressions, e.g. ``"MeV"`` and ``"GeV"``.
+
+    Returns
+    -------
+    numba.core.registry.CPUDispatcher
+        The conversion function, usable in and out of Numba-compiled kernels.
+
+    Raises
+    ------
+    DimensionError
+        If the units have different dimensions.
+
+    Examples
+    --------
+    >>> to_GeV = converter("MeV", "GeV")
+    >>> to_GeV(1500.0)
+    1.5
+    """
+    value = factor(from_unit, to_unit)
+
+    @numba.njit(inline="always")
+    def convert(x: Any) -> Any:
+        return x * value
+
+    return convert
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
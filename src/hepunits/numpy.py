@@ -0,0 +1,626 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Dimension-checked NumPy arrays in the HEP system of units.
+
+A `QuantityArray` stores a plain float64 array in the HEP system of units,
+and a single dimension for the whole array, see `hepunits.dimensions`.
+It implements the ``__array_ufunc__`` and ``__array_function__`` protocols,
+so that NumPy ufuncs and functions such as ``np.sqrt``, ``np.sum`` or
+``np.histogram`` work on it directly. Dimensions are checked and propagated
+once per call, then NumPy runs on the underlying array, hence the overhead
+does not grow with the number of elements.
+
+Ufuncs follow the same rules as `hepunits.Quantity`: plain numbers and arrays
+are dimensionless. In NumPy functions, arguments that are not quantities,
+such as indices, shapes or bin counts, are passed through unchanged.
+
+Typical use cases::
+
+    >>> import numpy as np
+    >>> from hepunits import GeV
+    >>> from hepunits.numpy import QuantityArray
+    >>> E = QuantityArray([10.0, 20.0], "GeV")
+    >>> p = QuantityArray([6.0, 12.0], "GeV/c")
+    >>> m = np.sqrt(E**2 - (p * QuantityArray(1, "c")) ** 2)
+    >>> m.to(GeV)
+    array([ 8., 16.])
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from .dimensions import Dimension, DimensionError, dimensionless
+from .quantity import Quantity
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    msg = "NumPy is required to use hepunits.numpy."
+    raise ImportError(msg) from exc
+
+__all__ = ("QuantityArray",)
+
+# --------------------------------------------------------------------
+# Dimensions of ufunc results
+# --------------------------------------------------------------------
+_kinds: dict[np.ufunc, str] = {
+    **dict.fromkeys(
+        (
+            np.add,
+            np.subtract,
+            np.maximum,
+            np.minimum,
+            np.fmax,
+            np.fmin,
+            np.hypot,
+            np.remainder,
+            np.fmod,
+            np.nextafter,
+        ),
+        "same",
+    ),
+    **dict.fromkeys(
+        (
+            np.equal,
+            np.not_equal,
+            np.less,
+            np.less_equal,
+            np.greater,
+            np.greater_equal,
+        ),
+        "comparison",
+    ),
+    **dict.fromkeys((np.isnan, np.isinf, np.isfinite, np.signbit), "comparison"),
+    **dict.fromkeys((np.multiply, np.matmul), "multiply"),
+    **dict.fromkeys((np.divide, np.floor_divide), "divide"),
+    **dict.fromkeys((np.power, np.float_power), "power"),
+    np.arctan2: "angle",
+}
+
+# Unary ufuncs, whose result has the dimension of the operand to a given power
+_exponents: dict[np.ufunc, float] = {
+    **dict.fromkeys(
+        (
+            np.negative,
+            np.positive,
+            np.absolute,
+            np.fabs,
+            np.rint,
+            np.floor,
+            np.ceil,
+            np.trunc,
+            np.conjugate,
+            np.spacing,
+            np.copysign,
+        ),
+        1,
+    ),
+    np.sign: 0,
+    np.reciprocal: -1,
+    np.square: 2,
+    np.sqrt: 1 / 2,
+    np.cbrt: 1 / 3,
+}
+
+
+def _matching(func: Callable[..., Any], dimensions: list[Dimension]) -> Dimension:
+    first = dimensions[0] if dimensions else dimensionless
+    for other in dimensions[1:]:
+        if other != first:
+            msg = f"Cannot apply {func.__name__} to {first} and {other}"
+            raise DimensionError(msg)
+    return first
+
+
+def _power(base: Dimension, exponent: Any, exponent_dimension: Dimension) -> Dimension:
+    if exponent_dimension != dimensionless:
+        msg = f"Exponent with dimension {exponent_dimension}"
+        raise DimensionError(msg)
+    if base == dimensionless:
+        return dimensionless
+    if np.ndim(exponent) != 0:
+        msg = f"Cannot raise {base} to an array of exponents"
+        raise DimensionError(msg)
+    return base ** float(exponent)
+
+
+def _result_dimension(
+    ufunc: np.ufunc, method: str, operands: tuple[Any, ...]
+) -> Dimension | None:
+    """Get the dimension of the result of a ufunc, or None for boolean results."""
+    dimensions = [
+        x.dimension if isinstance(x, Quantity) else dimensionless for x in operands
+    ]
+    if ufunc in _exponents:
+        return dimensions[0] ** _exponents[ufunc]
+    kind = _kinds.get(ufunc)
+    if kind in {"same", "angle", "comparison"}:
+        first = _matching(ufunc, dimensions)
+        return {"same": first, "angle": dimensionless}.get(kind)
+    if kind == "power":
+        exponent = getattr(operands[1], "magnitude", operands[1])
+        return _power(dimensions[0], exponent, dimensions[1])
+    # Reductions of products multiply a number of elements that depends on the data
+    if kind in {"multiply", "divide"} and method in {"__call__", "outer", "at"}:
+        if kind == "multiply":
+            return dimensions[0] * dimensions[1]
+        return dimensions[0] / dimensions[1]
+    # Other ufuncs, e.g. exp or sin, only apply to dimensionless quantities
+    for dimension in dimensions:
+        if dimension != dimensionless:
+            msg = f"Cannot apply {ufunc.__name__} to {dimension}"
+            raise DimensionError(msg)
+    return dimensionless
+
+
+class QuantityArray(Quantity):
+    """
+    A float64 array in the HEP system of units, and its dimension.
+
+    Parameters
+    ----------
+    magnitude : array_like
+        The magnitudes, in the units given by ``unit``.
+    unit : str or Dimension, optional
+        Either a unit expression, e.g. ``"GeV"``, the magnitudes being in that unit,
+        or the dimension of the magnitudes, already in the HEP system of units.
+        Defaults to dimensionless magnitudes.
+
+    Examples
+    --------
+    >>> QuantityArray([1, 2], "cm")
+    QuantityArray(array([10., 20.]), Dimension(length=1))
+    >>> import numpy as np
+    >>> print(np.sum(QuantityArray([1, 2], "cm")).to("mm"))
+    30.0
+    """
+
+    __slots__ = ()
+
+    def __init__(self, magnitude: Any, unit: str | Dimension = dimensionless) -> None:
+        super().__init__(np.asarray(magnitude, dtype=np.float64), unit)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """The shape of the array."""
+        return np.shape(self.magnitude)
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of the array, not to be confused with its unit."""
+        return np.ndim(self.magnitude)
+
+    @property
+    def size(self) -> int:
+        """The number of elements of the array."""
+        return np.size(self.magnitude)
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """The data type of the array."""
+        return np.asarray(self.magnitude).dtype
+
+    def __len__(self) -> int:
+        return len(self.magnitude)
+
+    def __getitem__(self, key: Any) -> QuantityArray:
+        return self._new(self.magnitude[key], self.dimension)  # type: ignore[return-value]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.magnitude[key] = self._check(value, "assign")
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        if self.dimension != dimensionless:
+            msg = f"Cannot convert {self.dimension} to a plain array"
+            raise DimensionError(msg)
+        return np.asarray(self.magnitude, dtype=dtype)
+
+    def __array_ufunc__(  # type: ignore[override]
+        self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any
+    ) -> Any:
+        # The indices of ufunc.at are not operands
+        operands = inputs[:1] + inputs[2:] if method == "at" else inputs
+        dimension = _result_dimension(ufunc, method, operands)
+
+        inputs = tuple(x.magnitude if isinstance(x, Quantity) else x for x in inputs)
+        out = kwargs.get("out")
+        if out is not None:
+            kwargs["out"] = tuple(
+                x.magnitude if isinstance(x, Quantity) else x for x in out
+            )
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+
+        if method == "at":
+            return None
+        if out is not None:
+            for x in out:
+                if isinstance(x, Quantity) and dimension is not None:
+                    x.dimension = dimension
+            return out[0] if len(out) == 1 else out
+        if dimension is None:
+            return result
+        if isinstance(result, tuple):
+            return tuple(self._new(x, dimension) for x in result)
+        return self._new(result, dimension)
+
+    def __array_function__(
+        self,
+        func: Callable[..., Any],
+        types: tuple[type, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        handler = _functions.get(func)
+        if handler is not None:
+            return handler(*args, **kwargs)
+        # Other functions are only supported for dimensionless quantities
+        dimensions: list[Dimension] = []
+        args = _unwrap(args, dimensions)
+        kwargs = _unwrap(kwargs, dimensions)
+        if any(dimension != dimensionless for dimension in dimensions):
+            return NotImplemented
+        return func(*args, **kwargs)
+
+    # Arithmetic and comparisons go through the ufuncs, as for NumPy arrays.
+    # Binary operators are defined below, since the mixin of NumPy would defer
+    # to hepunits.Quantity, which opts out of ufuncs
+    def __neg__(self) -> Any:
+        return np.negative(self)
+
+    def __pos__(self) -> Any:
+        return np.positive(self)
+
+    def __abs__(self) -> Any:
+        return np.absolute(self)
+
+
+def _operand(value: Any) -> Any:
+    # hepunits.Quantity opts out of ufuncs, hence is promoted to a QuantityArray
+    if isinstance(value, Quantity) and not isinstance(value, QuantityArray):
+        return QuantityArray._new(value.magnitude, value.dimension)
+    return value
+
+
+def _operators(ufunc: np.ufunc) -> tuple[Callable[..., Any], ...]:
+    def forward(self: QuantityArray, other: Any) -> Any:
+        return ufunc(self, _operand(other))
+
+    def reflected(self: QuantityArray, other: Any) -> Any:
+        return ufunc(_operand(other), self)
+
+    def inplace(self: QuantityArray, other: Any) -> Any:
+        if not isinstance(self.magnitude, np.ndarray):
+            return forward(self, other)
+        return ufunc(self, _operand(other), out=(self,))
+
+    return forward, reflected, inplace
+
+
+_ufunc: np.ufunc
+for _name, _ufunc in (
+    ("add", np.add),
+    ("sub", np.subtract),
+    ("mul", np.multiply),
+    ("matmul", np.matmul),
+    ("truediv", np.true_divide),
+    ("floordiv", np.floor_divide),
+    ("mod", np.remainder),
+    ("pow", np.power),
+):
+    _forward, _reflected, _inplace = _operators(_ufunc)
+    setattr(QuantityArray, f"__{_name}__", _forward)
+    setattr(QuantityArray, f"__r{_name}__", _reflected)
+    setattr(QuantityArray, f"__i{_name}__", _inplace)
+
+for _name, _ufunc in (
+    ("eq", np.equal),
+    ("ne", np.not_equal),
+    ("lt", np.less),
+    ("le", np.less_equal),
+    ("gt", np.greater),
+    ("ge", np.greater_equal),
+):
+    setattr(QuantityArray, f"__{_name}__", _operators(_ufunc)[0])
+
+
+# --------------------------------------------------------------------
+# NumPy functions
+# --------------------------------------------------------------------
+_functions: dict[Callable[..., Any], Callable[..., Any]] = {}
+
+
+def _implements(*funcs: Callable[..., Any]) -> Callable[..., Any]:
+    def decorator(handler: Callable[..., Any]) -> Callable[..., Any]:
+        for func in funcs:
+            _functions[func] = handler
+        return handler
+
+    return decorator
+
+
+def _is_plain_number(value: Any) -> bool:
+    """Whether a value is plain numbers, not all zeros, which are the same in all units."""
+    if value is None or isinstance(value, (bool, str)):
+        return False
+    array = np.asarray(value)
+    return array.dtype.kind in "iufc" and bool(np.any(array != 0))
+
+
+def _unwrap(value: Any, dimensions: list[Dimension], plain: bool = False) -> Any:
+    """
+    Replace quantities by their magnitudes, collecting their dimensions.
+
+    With ``plain``, plain numbers other than zeros are dimensionless values.
+    """
+    if isinstance(value, Quantity):
+        dimensions.append(value.dimension)
+        return value.magnitude
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unwrap(x, dimensions, plain) for x in value)
+    if isinstance(value, dict):
+        return {key: _unwrap(x, dimensions, plain) for key, x in value.items()}
+    if plain and _is_plain_number(value):
+        dimensions.append(dimensionless)
+    return value
+
+
+def _unwrap_matching(
+    func: Callable[..., Any], value: Any, plain: bool = False
+) -> tuple[Any, Dimension]:
+    """Replace quantities by their magnitudes, checking they have the same dimension."""
+    dimensions: list[Dimension] = []
+    value = _unwrap(value, dimensions, plain)
+    return value, _matching(func, dimensions)
+
+
+def _unwrap_arguments(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    values: tuple[int | str, ...],
+) -> tuple[list[Any], dict[str, Any], Dimension]:
+    """
+    Replace quantities by their magnitudes, checking they have the same dimension.
+
+    The arguments at the positions, or with the names, of ``values`` are values,
+    among which plain numbers other than zeros are dimensionless.
+    """
+    dimensions: list[Dimension] = []
+    arguments = [*args]
+    kwargs = {**kwargs}
+    for key in values:
+        if isinstance(key, str) and key in kwargs:
+            kwargs[key] = _unwrap(kwargs[key], dimensions, plain=True)
+        elif isinstance(key, int) and key < len(arguments):
+            arguments[key] = _unwrap(arguments[key], dimensions, plain=True)
+    arguments, kwargs = _unwrap((arguments, kwargs), dimensions)
+    return arguments, kwargs, _matching(func, dimensions)
+
+
+def _wrap(value: Any, dimension: Dimension) -> Any:
+    if isinstance(value, (list, tuple)):
+        return type(value)(_wrap(x, dimension) for x in value)
+    return QuantityArray._new(value, dimension)
+
+
+def _same_dimension(
+    func: Callable[..., Any], values: tuple[int | str, ...] = ()
+) -> Callable[..., Any]:
+    def handler(*args: Any, **kwargs: Any) -> Any:
+        arguments, kwargs, dimension = _unwrap_arguments(func, args, kwargs, values)
+        return _wrap(func(*arguments, **kwargs), dimension)
+
+    return handler
+
+
+def _plain_result(
+    func: Callable[..., Any], values: tuple[int | str, ...] = ()
+) -> Callable[..., Any]:
+    def handler(*args: Any, **kwargs: Any) -> Any:
+        arguments, kwargs, _ = _unwrap_arguments(func, args, kwargs, values)
+        return func(*arguments, **kwargs)
+
+    return handler
+
+
+def _squared(func: Callable[..., Any]) -> Callable[..., Any]:
+    def handler(*args: Any, **kwargs: Any) -> Any:
+        (args, kwargs), dimension = _unwrap_matching(func, (args, kwargs))
+        return _wrap(func(*args, **kwargs), dimension**2)
+
+    return handler
+
+
+def _product(func: Callable[..., Any]) -> Callable[..., Any]:
+    def handler(a: Any, b: Any, *args: Any, **kwargs: Any) -> Any:
+        (a,), first = _unwrap_matching(func, (a,))
+        (b,), second = _unwrap_matching(func, (b,))
+        return _wrap(func(a, b, *args, **kwargs), first * second)
+
+    return handler
+
+
+_func: Callable[..., Any]
+for _func in (
+    np.sum,
+    np.nansum,
+    np.cumsum,
+    np.nancumsum,
+    np.mean,
+    np.nanmean,
+    np.median,
+    np.nanmedian,
+    np.std,
+    np.nanstd,
+    np.min,
+    np.max,
+    np.amin,
+    np.amax,
+    np.nanmin,
+    np.nanmax,
+    np.ptp,
+    np.percentile,
+    np.nanpercentile,
+    np.quantile,
+    np.nanquantile,
+    np.round,
+    np.around,
+    np.diff,
+    np.ediff1d,
+    np.sort,
+    np.partition,
+    np.delete,
+    np.reshape,
+    np.ravel,
+    np.transpose,
+    np.swapaxes,
+    np.moveaxis,
+    np.squeeze,
+    np.expand_dims,
+    np.broadcast_to,
+    np.atleast_1d,
+    np.atleast_2d,
+    np.atleast_3d,
+    np.copy,
+    np.flip,
+    np.fliplr,
+    np.flipud,
+    np.roll,
+    np.take,
+    np.repeat,
+    np.tile,
+    np.resize,
+    np.trim_zeros,
+    np.zeros_like,
+    np.empty_like,
+    np.linalg.norm,
+):
+    _functions[_func] = _same_dimension(_func)
+
+for _func in (
+    np.argsort,
+    np.argmin,
+    np.argmax,
+    np.nanargmin,
+    np.nanargmax,
+    np.argpartition,
+    np.nonzero,
+    np.flatnonzero,
+    np.count_nonzero,
+    np.shape,
+    np.ndim,
+    np.size,
+):
+    _functions[_func] = _plain_result(_func)
+
+# Functions of several values, by the positions and names of the values,
+# among which plain numbers other than zeros are dimensionless
+_func_values: tuple[int | str, ...]
+for _func, _func_values in (
+    (np.clip, (0, 1, 2, "a_min", "a_max", "min", "max")),
+    (np.where, (1, 2)),
+    (np.concatenate, (0, "arrays")),
+    (np.stack, (0, "arrays")),
+    (np.vstack, (0, "tup")),
+    (np.hstack, (0, "tup")),
+    (np.dstack, (0, "tup")),
+    (np.column_stack, (0, "tup")),
+    (np.append, (0, 1, "values")),
+    (np.insert, (0, 2, "values")),
+):
+    _functions[_func] = _same_dimension(_func, _func_values)
+
+for _func, _func_values in (
+    (np.searchsorted, (0, 1, "v")),
+    (np.digitize, (0, 1, "bins")),
+    (np.isclose, (0, 1, "atol")),
+    (np.allclose, (0, 1, "atol")),
+    (np.array_equal, (0, 1)),
+):
+    _functions[_func] = _plain_result(_func, _func_values)
+
+for _func in (np.var, np.nanvar):
+    _functions[_func] = _squared(_func)
+
+for _func in (np.dot, np.inner, np.outer, np.cross, np.kron):
+    _functions[_func] = _product(_func)
+
+
+@_implements(np.unique)
+def _unique(ar: Any, *args: Any, **kwargs: Any) -> Any:
+    result = np.unique(ar.magnitude, *args, **kwargs)
+    if isinstance(result, tuple):
+        # The indices and counts are plain arrays
+        return (QuantityArray._new(result[0], ar.dimension), *result[1:])
+    return QuantityArray._new(result, ar.dimension)
+
+
+@_implements(np.average)
+def _average(a: Any, axis: Any = None, weights: Any = None, **kwargs: Any) -> Any:
+    # The dimension of the weights cancels out
+    weights = weights.magnitude if isinstance(weights, Quantity) else weights
+    result = np.average(a.magnitude, axis=axis, weights=weights, **kwargs)
+    return _wrap(result, a.dimension)
+
+
+@_implements(np.interp)
+def _interp(
+    x: Any, xp: Any, fp: Any, left: Any = None, right: Any = None, **kwargs: Any
+) -> Any:
+    (x, xp), _ = _unwrap_matching(np.interp, (x, xp), plain=True)
+    (fp, left, right), dimension = _unwrap_matching(
+        np.interp, (fp, left, right), plain=True
+    )
+    result = np.interp(x, xp, fp, left=left, right=right, **kwargs)
+    return _wrap(result, dimension)
+
+
+def _histogram_args(
+    func: Callable[..., Any], a: Any, bins: Any, range: Any
+) -> tuple[Any, Any, Any, Dimension]:
+    dimensions: list[Dimension] = []
+    a = _unwrap(a, dimensions, plain=True)
+    # Numbers of bins and names of binning methods are not edges
+    bins = _unwrap(bins, dimensions, plain=not isinstance(bins, (int, str)))
+    range = _unwrap(range, dimensions, plain=True)
+    return a, bins, range, _matching(func, dimensions)
+
+
+@_implements(np.histogram)
+def _histogram(
+    a: Any,
+    bins: Any = 10,
+    range: Any = None,
+    density: bool | None = None,
+    weights: Any = None,
+) -> tuple[Any, Any]:
+    a, bins, range, dimension = _histogram_args(np.histogram, a, bins, range)
+    weights_dimension = getattr(weights, "dimension", dimensionless)
+    weights = getattr(weights, "magnitude", weights)
+    counts, edges = np.histogram(
+        a, bins=bins, range=range, density=density, weights=weights
+    )
+    # Densities are normalized per unit of the histogrammed quantity
+    counts_dimension = dimensionless / dimension if density else weights_dimension
+    if counts_dimension != dimensionless:
+        counts = _wrap(counts, counts_dimension)
+    return counts, _wrap(edges, dimension)
+
+
+@_implements(np.histogram_bin_edges)
+def _histogram_bin_edges(
+    a: Any,
+    bins: Any = 10,
+    range: Any = None,
+    weights: Any = None,
+) -> Any:
+    a, bins, range, dimension = _histogram_args(np.histogram_bin_edges, a, bins, range)
+    weights = getattr(weights, "magnitude", weights)
+    edges = np.histogram_bin_edges(a, bins=bins, range=range, weights=weights)
+    return _wrap(edges, dimension)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,468 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units of pandas columns, as an extension dtype.
+
+Columns of dtype ``"hep[<unit>]"``, e.g. ``"hep[GeV]"``, hold their values in a
+plain float64 NumPy array, and their unit in their dtype, hence keep it through
+copies, selections, merges and concatenations. Conversions are one vectorized
+multiply of the values, and columns of compatible units are concatenated in the
+unit of the first one. Arithmetic checks the dimensions of its operands,
+like `hepunits.Quantity`.
+
+The ``hep`` accessor of Series and DataFrames converts columns to other units.
+
+Typical use cases::
+
+    >>> import pandas as pd
+    >>> import hepunits.pandas
+    >>> pt = pd.Series([1200.0, 4100.0], dtype="hep[MeV]")
+    >>> pt.hep.to("GeV").tolist()
+    [1.2, 4.1]
+    >>> pd.concat([pt, pd.Series([2.5], dtype="hep[GeV]")]).tolist()
+    [1200.0, 4100.0, 2500.0]
+    >>> pt + pd.Series([1.0, 2.0], dtype="hep[ns]")
+    Traceback (most recent call last):
+        ...
+    hepunits.dimensions.DimensionError: Cannot add [energy] and [time]
+"""
+
+from __future__ import annotations
+
+import builtins
+import operator
+import re
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from .dimensions import Dimension, DimensionError
+from .parsing import conversion_factor, parse_dimension
+
+try:
+    import numpy as np
+    import pandas as pd
+    from pandas.api.extensions import (
+        ExtensionArray,
+        ExtensionDtype,
+        register_dataframe_accessor,
+        register_extension_dtype,
+        register_series_accessor,
+        take,
+    )
+    from pandas.api.indexers import check_array_indexer
+except ImportError as exc:  # pragma: no cover
+    msg = "pandas is required to use hepunits.pandas."
+    raise ImportError(msg) from exc
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+__all__ = ("DataFrameAccessor", "HepArray", "HepDtype", "SeriesAccessor")
+
+_dimensionless = Dimension()
+
+
+@register_extension_dtype
+class HepDtype(ExtensionDtype):  # type: ignore[misc]
+    """
+    The dtype of float64 values in a unit, named ``"hep[<unit>]"``.
+
+    Parameters
+    ----------
+    unit : str
+        The unit expression of the values, e.g. ``"GeV"`` or ``"GeV/c^2"``.
+
+    Raises
+    ------
+    ValueError
+        If the unit is not a valid unit expression.
+    """
+
+    _metadata = ("unit",)
+    _match = re.compile(r"^hep\[(?P<unit>.+)\]$")
+
+    type = float
+    kind = "f"
+    na_value = np.nan
+
+    def __init__(self, unit: str) -> None:
+        self.unit = unit
+        self.dimension = parse_dimension(unit)
+
+    @property
+    def name(self) -> str:
+        return f"hep[{self.unit}]"
+
+    @property
+    def _is_numeric(self) -> bool:
+        return True
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> HepDtype:
+        match = cls._match.match(string)
+        if match is None:
+            msg = f"Cannot construct a 'HepDtype' from '{string}'"
+            raise TypeError(msg)
+        return cls(match["unit"])
+
+    @classmethod
+    def construct_array_type(cls) -> builtins.type[HepArray]:
+        return HepArray
+
+    def _get_common_dtype(self, dtypes: list[Any]) -> HepDtype | None:
+        """Concatenations of the same dimensions are in the unit of the first values."""
+        if all(
+            isinstance(dtype, HepDtype) and dtype.dimension == self.dimension
+            for dtype in dtypes
+        ):
+            return self
+        return None
+
+
+def _binary(
+    method: Callable[[Any, Any], Any], name: str, *, reflected: bool = False
+) -> Callable[[HepArray, Any], Any]:
+    """An arithmetic or comparison operator, see `HepArray._operate`."""
+
+    def operate(self: HepArray, other: Any) -> Any:
+        return self._operate(other, method, name, reflected=reflected)
+
+    return operate
+
+
+class HepArray(ExtensionArray):  # type: ignore[misc]
+    """
+    Float64 values in a unit, the array of columns of dtype `HepDtype`.
+
+    Parameters
+    ----------
+    values : array_like
+        The values, in the unit. Float64 arrays are not copied.
+    dtype : HepDtype or str
+        The dtype, e.g. ``"hep[GeV]"``, or the unit expression of the values.
+    """
+
+    __array_priority__ = 1000
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, values: Any, dtype: HepDtype | str) -> None:
+        self._data = np.asarray(values, dtype=np.float64)
+        if self._data.ndim != 1:
+            msg = f"Expected one-dimensional values, got {self._data.ndim} dimensions"
+            raise ValueError(msg)
+        if isinstance(dtype, str) and not HepDtype._match.match(dtype):
+            dtype = HepDtype(dtype)
+        self._dtype = pd.api.types.pandas_dtype(dtype)
+        if not isinstance(self._dtype, HepDtype):
+            msg = f"Expected a hep[<unit>] dtype, got {dtype!r}"
+            raise TypeError(msg)
+
+    # Construction
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars: Any, *, dtype: Any = None, copy: bool = False
+    ) -> HepArray:
+        if dtype is None:
+            if isinstance(scalars, HepArray):
+                return scalars.copy() if copy else scalars
+            msg = "Values of hepunits.pandas.HepArray require a hep[<unit>] dtype"
+            raise TypeError(msg)
+        if isinstance(scalars, HepArray):
+            return scalars.astype(dtype, copy=copy)  # type: ignore[no-any-return]
+        values = np.array(scalars, dtype=np.float64, copy=copy or None)
+        return cls(values, dtype)
+
+    @classmethod
+    def _from_factorized(cls, values: NDArray[Any], original: HepArray) -> HepArray:
+        return cls(values, original.dtype)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[HepArray]) -> HepArray:
+        unit = to_concat[0].unit
+        return cls(
+            np.concatenate([array._in(unit) for array in to_concat]), to_concat[0].dtype
+        )
+
+    # Properties
+
+    @property
+    def dtype(self) -> HepDtype:
+        return self._dtype  # type: ignore[no-any-return]
+
+    @property
+    def unit(self) -> str:
+        """The unit expression of the values."""
+        return self.dtype.unit
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> NDArray[Any]:
+        if copy is False:
+            return np.asarray(self._data, dtype=dtype)
+        return np.array(self._data, dtype=dtype, copy=copy)
+
+    # Selection
+
+    def __getitem__(self, item: Any) -> Any:
+        if not isinstance(item, tuple):
+            item = check_array_indexer(self, item)
+        values = self._data[item]
+        if np.ndim(values) == 0:
+            return float(values)
+        return type(self)(values, self.dtype)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = check_array_indexer(self, key)
+        if isinstance(value, (pd.Series, pd.Index)):
+            value = value.array
+        if isinstance(value, HepArray):
+            value = value._in(self.unit)
+        self._data[key] = value
+
+    def isna(self) -> NDArray[np.bool_]:
+        return np.isnan(self._data)
+
+    def take(
+        self,
+        indices: Sequence[int],
+        *,
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> HepArray:
+        if fill_value is None:
+            fill_value = np.nan
+        values = take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value)
+        return type(self)(values, self.dtype)
+
+    def copy(self) -> HepArray:
+        return type(self)(self._data.copy(), self.dtype)
+
+    def _values_for_factorize(self) -> tuple[NDArray[np.float64], float]:
+        return self._data, np.nan
+
+    # Conversions
+
+    def _in(self, unit: str) -> NDArray[np.float64]:
+        """The values in a unit, with one multiply if it is not the unit of the values."""
+        factor = conversion_factor(self.unit, unit)
+        return self._data if factor == 1 else self._data * factor
+
+    def astype(self, dtype: Any, copy: bool = True) -> Any:
+        """
+        Cast to a dtype, or convert to the unit of a `HepDtype` with one multiply.
+
+        Raises
+        ------
+        DimensionError
+            If the unit of the dtype has another dimension.
+        """
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, HepDtype):
+            factor = conversion_factor(self.unit, dtype.unit)
+            if factor != 1:
+                return type(self)(self._data * factor, dtype)
+            values = self._data.copy() if copy else self._data
+            return type(self)(values, dtype)
+        if isinstance(dtype, np.dtype):
+            return self._data.astype(dtype, copy=copy)
+        return super().astype(dtype, copy=copy)
+
+    # Operations
+
+    def _unit(self, unit: str, name: str, reflected: bool) -> str:
+        """The unit of the product or ratio of the values with values in a unit."""
+        if name == "multiply":
+            return self.unit if unit == "1" else f"({self.unit})*({unit})"
+        if reflected:
+            return f"({unit})/({self.unit})"
+        return self.unit if unit == "1" else f"({self.unit})/({unit})"
+
+    def _operate(
+        self,
+        other: Any,
+        method: Callable[[Any, Any], Any],
+        name: str,
+        *,
+        reflected: bool = False,
+    ) -> Any:
+        """
+        Apply an operator, checking the dimensions of its operands.
+
+        Values of the same dimensions are added, subtracted and compared in the
+        unit of this array, and products and ratios have the product and ratio
+        of the units. Plain numbers are dimensionless.
+        """
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, HepArray):
+            unit, dimension, values = other.unit, other.dtype.dimension, other._data
+        else:
+            unit, dimension, values = "1", _dimensionless, np.asarray(other)
+        operands = (values, self._data) if reflected else (self._data, values)
+        if name in {"multiply", "divide"}:
+            return type(self)(
+                method(*operands), HepDtype(self._unit(unit, name, reflected))
+            )
+        if dimension != self.dtype.dimension:
+            if method in {operator.eq, operator.ne}:
+                return np.full(len(self), method is operator.ne)
+            what = "a dimensionless number" if unit == "1" else dimension
+            msg = f"Cannot {name} {self.dtype.dimension} and {what}"
+            raise DimensionError(msg)
+        if isinstance(other, HepArray):
+            values = other._in(self.unit)
+            operands = (values, self._data) if reflected else (self._data, values)
+        result = method(*operands)
+        return result if name == "compare" else type(self)(result, self.dtype)
+
+    __add__ = _binary(operator.add, "add")
+    __radd__ = _binary(operator.add, "add", reflected=True)
+    __sub__ = _binary(operator.sub, "subtract")
+    __rsub__ = _binary(operator.sub, "subtract", reflected=True)
+    __mul__ = _binary(operator.mul, "multiply")
+    __rmul__ = _binary(operator.mul, "multiply", reflected=True)
+    __truediv__ = _binary(operator.truediv, "divide")
+    __rtruediv__ = _binary(operator.truediv, "divide", reflected=True)
+    __eq__ = _binary(operator.eq, "compare")
+    __ne__ = _binary(operator.ne, "compare")
+    __lt__ = _binary(operator.lt, "compare")
+    __le__ = _binary(operator.le, "compare")
+    __gt__ = _binary(operator.gt, "compare")
+    __ge__ = _binary(operator.ge, "compare")
+
+    def __neg__(self) -> HepArray:
+        return type(self)(-self._data, self.dtype)
+
+    def __pos__(self) -> HepArray:
+        return self.copy()
+
+    def __abs__(self) -> HepArray:
+        return type(self)(np.abs(self._data), self.dtype)
+
+    def _reduce(
+        self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs: Any
+    ) -> Any:
+        """Reductions keeping the unit, computed by pandas on the float64 values."""
+        if name not in {"sum", "mean", "median", "min", "max", "std", "sem"}:
+            msg = f"Cannot perform {name} with type {self.dtype}"
+            raise TypeError(msg)
+        result = getattr(pd.Series(self._data, copy=False), name)(
+            skipna=skipna, **kwargs
+        )
+        return type(self)([result], self.dtype) if keepdims else result
+
+    def _quantile(self, qs: NDArray[np.float64], interpolation: str) -> HepArray:
+        series = pd.Series(self._data, copy=False)
+        result = series.quantile(qs, interpolation=interpolation)
+        return type(self)(result.to_numpy(), self.dtype)
+
+
+@register_series_accessor("hep")
+class SeriesAccessor:
+    """
+    The ``hep`` accessor of Series of dtype `HepDtype`.
+
+    Raises
+    ------
+    AttributeError
+        If the Series has no units.
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        if not isinstance(series.dtype, HepDtype):
+            msg = "Can only use the .hep accessor with hep[<unit>] values"
+            raise AttributeError(msg)  # noqa: TRY004
+        self._series = series
+
+    @property
+    def unit(self) -> str:
+        """The unit expression of the values."""
+        return self._series.dtype.unit  # type: ignore[no-any-return]
+
+    @property
+    def magnitude(self) -> NDArray[np.float64]:
+        """The float64 values in the unit, without copy."""
+        return self._series.array._data  # type: ignore[no-any-return]
+
+    def to(self, unit: str) -> pd.Series:
+        """
+        Convert the values to another unit, with one vectorized multiply.
+
+        Parameters
+        ----------
+        unit : str
+            The unit expression to convert to, e.g. ``"GeV"``.
+
+        Returns
+        -------
+        pandas.Series
+            The values in the unit, with the same index and name.
+
+        Raises
+        ------
+        DimensionError
+            If the units have different dimensions.
+        """
+        array = self._series.array.astype(HepDtype(unit), copy=False)
+        return pd.Series(
+            array, index=self._series.index, name=self._series.name, copy=False
+        )
+
+
+@register_dataframe_accessor("hep")
+class DataFrameAccessor:
+    """The ``hep`` accessor of DataFrames with columns of dtype `HepDtype`."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self._frame = frame
+
+    @property
+    def units(self) -> dict[Any, str]:
+        """The unit expressions of the columns with units."""
+        return {
+            name: dtype.unit
+            for name, dtype in self._frame.dtypes.items()
+            if isinstance(dtype, HepDtype)
+        }
+
+    def to(self, units: Mapping[Any, str]) -> pd.DataFrame:
+        """
+        Convert columns to other units, with one vectorized multiply per column.
+
+        Parameters
+        ----------
+        units : dict
+            The unit expressions to convert to, e.g. ``{"pt": "GeV", "t": "ps"}``.
+            Columns not in the mapping are left as is.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The columns in the given units.
+
+        Raises
+        ------
+        ValueError
+            If a column is not in the DataFrame.
+        AttributeError
+            If a column has no units.
+        DimensionError
+            If the units have different dimensions.
+        """
+        unknown = set(units) - set(self._frame.columns)
+        if unknown:
+            msg = f"No columns {sorted(unknown)} in {list(self._frame.columns)}"
+            raise ValueError(msg)
+        frame = self._frame.copy(deep=False)
+        for name, unit in units.items():
+            frame[name] = self._frame[name].hep.to(unit)
+        return frame
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
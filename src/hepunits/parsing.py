@@ -0,0 +1,409 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Parsing of quantities written as strings, such as ``"3.5 GeV/c^2"``.
+
+Expressions are built from the names of the units and constants of `hepunits`,
+numbers, the operators ``*``, ``/``, ``^`` (or ``**``) and parentheses.
+Whitespace between two factors means multiplication, and ``c`` stands for the
+speed of light.
+
+The unit part of an expression is tokenized and evaluated once, then memoized,
+so that parsing many values with the same units is cheap.
+Columns of such strings are parsed into NumPy arrays with `parse_array`.
+The dimension of a unit expression is given by `parse_dimension`, and the factor
+converting values from a unit to another one by `conversion_factor`.
+
+Typical use cases::
+
+    >>> from hepunits import GeV, parse
+    >>> parse("25 ns")
+    25.0
+    >>> parse("3.5 GeV") / GeV
+    3.5
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from . import constants, units
+from .dimensions import Dimension, DimensionError, dimensionless, registry
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+__all__ = ("conversion_factor", "parse", "parse_array", "parse_dimension", "parse_unit")
+
+# Leading number of an expression
+_number = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*")
+
+_token = re.compile(
+    r"\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_][A-Za-z_0-9]*)"
+    r"|(?P<op>\*\*|[*/^()+-]))"
+)
+
+# Common names that are not units nor constants of hepunits
+_aliases = {"c": "c_light"}
+
+# Parsed expressions are nested tuples, e.g. ("div", ("name", "GeV"), ("name", "c"))
+_Node = tuple[Any, ...]
+
+
+def _names() -> dict[str, float]:
+    names = {}
+    for module in (units, constants):
+        for name in module.__all__:
+            value = getattr(module, name)
+            if isinstance(value, float):
+                names[name] = value
+    for alias, name in _aliases.items():
+        names[alias] = names[name]
+    return names
+
+
+_values = _names()
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    tokens = []
+    pos = 0
+    end = len(text.rstrip())
+    while pos < end:
+        match = _token.match(text, pos)
+        if match is None:
+            msg = f"Invalid character {text[pos:].lstrip()[0]!r} in {text!r}"
+            raise ValueError(msg)
+        kind = match.lastgroup
+        assert kind is not None
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser of unit expressions."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _error(self) -> ValueError:
+        token = self._peek()
+        where = f"unexpected {token[1]!r}" if token else "unexpected end"
+        return ValueError(f"Invalid unit expression {self.text!r}: {where}")
+
+    def _expect(self, op: str) -> None:
+        if self._peek() != ("op", op):
+            raise self._error()
+        self.pos += 1
+
+    def parse(self) -> _Node:
+        node = self._product()
+        if self._peek() is not None:
+            raise self._error()
+        return node
+
+    def _product(self) -> _Node:
+        node = self._unary()
+        while (token := self._peek()) is not None:
+            if token in {("op", "*"), ("op", "/")}:
+                self.pos += 1
+                op = "mul" if token[1] == "*" else "div"
+                node = (op, node, self._unary())
+            elif token[0] != "op" or token[1] == "(":
+                # Implicit multiplication, as in "kg m"
+                node = ("mul", node, self._unary())
+            else:
+                break
+        return node
+
+    def _unary(self) -> _Node:
+        token = self._peek()
+        if token in {("op", "-"), ("op", "+")}:
+            self.pos += 1
+            node = self._unary()
+            return ("neg", node) if token[1] == "-" else node
+        return self._power()
+
+    def _power(self) -> _Node:
+        node = self._atom()
+        if self._peek() in {("op", "^"), ("op", "**")}:
+            self.pos += 1
+            # Exponentiation is right-associative and binds tighter than a sign
+            node = ("pow", node, self._unary())
+        return node
+
+    def _atom(self) -> _Node:
+        token = self._peek()
+        if token is None:
+            raise self._error()
+        kind, text = token
+        if kind == "number":
+            self.pos += 1
+            return ("number", float(text))
+        if kind == "name":
+            if text not in _values:
+                msg = f"Unknown unit or constant {text!r} in {self.text!r}"
+                raise ValueError(msg)
+            self.pos += 1
+            return ("name", text)
+        if text == "(":
+            self.pos += 1
+            node = self._product()
+            self._expect(")")
+            return node
+        raise self._error()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_tree(text: str) -> _Node:
+    return _Parser(text).parse()
+
+
+def _evaluate(node: _Node) -> float:
+    kind = node[0]
+    if kind == "number":
+        return float(node[1])
+    if kind == "name":
+        return _values[node[1]]
+    if kind == "neg":
+        return -_evaluate(node[1])
+    left = _evaluate(node[1])
+    right = _evaluate(node[2])
+    if kind == "mul":
+        return left * right
+    if kind == "div":
+        return left / right
+    if left < 0 and not right.is_integer():
+        msg = "negative number to a non-integer power"
+        raise ArithmeticError(msg)
+    return left**right  # type: ignore[no-any-return]
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_unit(unit: str) -> float:
+    """
+    Evaluate a unit expression in the HEP system of units.
+
+    Results are memoized, hence each distinct expression is tokenized only once.
+
+    Parameters
+    ----------
+    unit : str
+        The unit expression, e.g. ``"GeV/c^2"`` or ``"1/fb"``.
+
+    Returns
+    -------
+    float
+        The value of the unit in the HEP system of units.
+
+    Raises
+    ------
+    ValueError
+        If the expression is invalid, contains unknown names, or cannot be
+        evaluated to a finite number, e.g. ``"1/0"``.
+
+    Examples
+    --------
+    >>> parse_unit("GeV")
+    1000.0
+    >>> parse_unit("mm^2")
+    1.0
+    """
+    try:
+        value = _evaluate(_parse_tree(unit))
+    except ArithmeticError as exc:
+        msg = f"Cannot evaluate {unit!r}: {exc}"
+        raise ValueError(msg) from exc
+    if not math.isfinite(value):
+        msg = f"Cannot evaluate {unit!r}: the value is not finite"
+        raise ValueError(msg)
+    return value
+
+
+def _dimension(node: _Node) -> Dimension:
+    kind = node[0]
+    if kind == "number":
+        return dimensionless
+    if kind == "name":
+        name: str = node[1]
+        return registry[_aliases.get(name, name)]
+    if kind == "neg":
+        return _dimension(node[1])
+    left = _dimension(node[1])
+    right = _dimension(node[2])
+    if kind == "mul":
+        return left * right
+    if kind == "div":
+        return left / right
+    if right != dimensionless:
+        msg = f"Exponent with dimension {right}"
+        raise DimensionError(msg)
+    return left ** _evaluate(node[2])
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_dimension(unit: str) -> Dimension:
+    """
+    Get the dimension of a unit expression, see `hepunits.dimensions`.
+
+    Results are memoized, hence each distinct expression is tokenized only once.
+
+    Parameters
+    ----------
+    unit : str
+        The unit expression, e.g. ``"GeV/c^2"``.
+
+    Returns
+    -------
+    Dimension
+        The integer exponents of the base quantities of the HEP system of units.
+
+    Raises
+    ------
+    ValueError
+        If the expression is invalid or has non-integer exponents.
+
+    Examples
+    --------
+    >>> parse_dimension("GeV/c^2")
+    Dimension(length=-2, time=2, energy=1)
+    """
+    try:
+        return _dimension(_parse_tree(unit))
+    except ArithmeticError as exc:
+        msg = f"Cannot evaluate {unit!r}: {exc}"
+        raise ValueError(msg) from exc
+
+
+@functools.lru_cache(maxsize=4096)
+def conversion_factor(from_unit: str, to_unit: str) -> float:
+    """
+    Get the factor converting values from a unit to another one.
+
+    Results are memoized, hence each distinct pair of units is checked only once.
+
+    Parameters
+    ----------
+    from_unit, to_unit : str
+        The unit expressions, e.g. ``"MeV"`` and ``"GeV"``.
+
+    Returns
+    -------
+    float
+        The conversion factor.
+
+    Raises
+    ------
+    DimensionError
+        If the units have different dimensions.
+
+    Examples
+    --------
+    >>> conversion_factor("GeV", "MeV")
+    1000.0
+    """
+    from_dimension = parse_dimension(from_unit)
+    to_dimension = parse_dimension(to_unit)
+    if from_dimension != to_dimension:
+        msg = f"Cannot convert {from_unit!r} ({from_dimension}) to {to_unit!r} ({to_dimension})"
+        raise DimensionError(msg)
+    return parse_unit(from_unit) / parse_unit(to_unit)
+
+
+def parse(expr: str) -> float:
+    """
+    Evaluate a quantity expression, such as ``"3.5 GeV/c^2"``, in the HEP system of units.
+
+    A leading number is split from the rest of the expression,
+    whose value is memoized, see `parse_unit`.
+
+    Parameters
+    ----------
+    expr : str
+        The quantity, as a number followed by a unit expression.
+
+    Returns
+    -------
+    float
+        The value of the quantity in the HEP system of units.
+
+    Raises
+    ------
+    ValueError
+        If the expression is invalid or contains unknown names.
+
+    Examples
+    --------
+    >>> parse("25 ns")
+    25.0
+    >>> parse("3 cm")
+    30.0
+    """
+    match = _number.match(expr)
+    rest = expr[match.end() :].rstrip() if match else expr
+    if match and not rest:
+        return float(match.group(1))
+    if match and (rest[0].isalpha() or rest[0] in "_("):
+        return float(match.group(1)) * parse_unit(rest)
+    # Not a number followed by a unit, e.g. "1/fb", evaluated as a whole
+    return parse_unit(expr.strip())
+
+
+def parse_array(values: Iterable[str] | NDArray[Any]) -> NDArray[np.float64]:
+    """
+    Evaluate an array of ``"value unit"`` strings in the HEP system of units.
+
+    The numbers and the units are split with vectorized string operations,
+    the rows are grouped by unit, and each distinct unit is parsed once,
+    see `parse_unit`. The numbers are then scaled in a single pass.
+    Contrary to `parse`, the number and the unit must be separated by a space,
+    and rows without a unit are plain numbers.
+
+    Parameters
+    ----------
+    values : sequence of str or numpy.ndarray
+        The quantities, e.g. a column of a CSV file.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values in the HEP system of units, as float64, with the input shape.
+
+    Raises
+    ------
+    ValueError
+        If a number or a unit is invalid.
+
+    Examples
+    --------
+    >>> parse_array(["12.3 keV", "4.1 MeV", "2"])
+    array([0.0123, 4.1   , 2.    ])
+    """
+    import numpy as np  # noqa: PLC0415
+
+    array = np.asarray(values, dtype=np.str_)
+    if array.size == 0:
+        return np.zeros(array.shape)
+    parts = np.char.partition(np.char.strip(array.ravel()), " ")
+    unit_strings, inverse = np.unique(np.char.strip(parts[:, 2]), return_inverse=True)
+    factors = np.array(
+        [parse_unit(unit) if unit else 1.0 for unit in unit_strings.tolist()]
+    )
+    result = parts[:, 0].astype(np.float64)
+    result *= factors[inverse.ravel()]
+    return result.reshape(array.shape)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -7,16 +7,31 @@ system, effectively dimensionless. Pint offers to store both the magnitude and
 the dimensionality of the unit, which is helpful in deducing and/or validating
 the resulting unit of formulas. This module offers conversion routines between
 Pint's default base unit system and CLHEP.
+
+The scale factor between a Pint unit and CLHEP base units is computed once,
+on first use, and cached, see `cache_info` and `cache_clear`.
+
+A shared registry knowing all units of `hepunits.units`, with a "clhep" system
+as default, is available from `get_registry`.
 """
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING, Any
+
+from . import dimensions
+
 try:
     import pint
 except ImportError as exc:  # pragma: no cover
     msg = "Pint is required to use hepunits.pint."
     raise ImportError(msg) from exc
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 # TODO: support more unit conversions
 _clhep_base_units = {
     "[length]": "millimeter",
@@ -25,6 +40,107 @@ _clhep_base_units = {
     "[current]": "elementary_charge / nanosecond",
 }
 
+# Definitions of hepunits units that are missing from, or differ from, Pint's defaults,
+# and of the CLHEP system of units, see `get_registry`
+_clhep_definitions = (
+    "eplus = elementary_charge",
+    "e_SI = 1.602176634e-19",
+    "electronvolt = electron_volt",
+    "electronvolt2 = electronvolt ** 2 = eV2",
+    "gauss = 1e-4 * tesla = G = Gs",
+    "kGs = kilogauss",
+    "maxwell = 1e-8 * weber = Mx",
+    "y = year",
+    "millimeter2 = millimeter ** 2 = mm2",
+    "millimeter3 = millimeter ** 3 = mm3",
+    "centimeter2 = centimeter ** 2 = cm2",
+    "centimeter3 = centimeter ** 3 = cm3",
+    "meter2 = meter ** 2 = m2",
+    "meter3 = meter ** 3 = m3",
+    "kilometer2 = kilometer ** 2 = km2",
+    "kilometer3 = kilometer ** 3 = km3",
+    "fm2 = femtometer ** 2",
+    "fm3 = femtometer ** 3",
+    "invmb = 1 / millibarn",
+    "invub = 1 / microbarn",
+    "invnb = 1 / nanobarn",
+    "invpb = 1 / picobarn",
+    "invfb = 1 / femtobarn",
+    "invab = 1 / attobarn",
+    "@system clhep using international",
+    "    millimeter",
+    "    nanosecond",
+    "    kelvin",
+    "    mole",
+    "    candela",
+    "@end",
+)
+
+# Pint's system definitions cannot express mass and current in terms of derived units,
+# hence the base units in the "clhep" system are set explicitly for those
+_clhep_system_base_units = {
+    "gram": {"megaelectron_volt": 1, "millimeter": -2, "nanosecond": 2},
+    "ampere": {"eplus": 1, "nanosecond": -1},
+}
+
+
+@functools.cache
+def get_registry() -> pint.UnitRegistry:
+    """
+    Get the shared Pint unit registry of hepunits.
+
+    The registry knows all units of `hepunits.units`, and defaults to the
+    "clhep" system (mm, ns, MeV, eplus, K, mol, cd) for base units.
+    It is built on first use only, and Pint caches its parsed definitions on disk,
+    hence subsequent processes avoid most of the startup cost.
+
+    Returns
+    -------
+    pint.UnitRegistry
+        The shared registry.
+
+    Examples
+    --------
+    >>> ureg = get_registry()
+    >>> (1 * ureg.tesla).to_base_units()
+    <Quantity(0.001, 'megaelectron_volt * nanosecond / millimeter ** 2 / eplus')>
+    >>> from_clhep(hepunits.invfb, ureg.invpb)
+    <Quantity(1000.0, 'invpb')>
+    """
+    registry = pint.UnitRegistry(cache_folder=":auto:", on_redefinition="ignore")
+    registry.load_definitions(list(_clhep_definitions))
+    registry.get_system("clhep").base_units.update(_clhep_system_base_units)  # type: ignore[arg-type]
+    registry.default_system = "clhep"
+    return registry
+
+
+# Dimensions of hepunits corresponding to the supported Pint dimensions
+_clhep_dimensions = {
+    "[length]": dimensions.length,
+    "[time]": dimensions.time,
+    "[mass]": dimensions.mass,
+    "[current]": dimensions.current,
+}
+
+
+def dimension_of(val: pint.Quantity | pint.Unit) -> dimensions.Dimension:
+    """
+    Get the dimension of a Pint Quantity or Unit, see `hepunits.dimensions`.
+
+    Examples
+    --------
+    >>> ureg = pint.UnitRegistry()
+    >>> dimension_of(ureg.tesla)
+    Dimension(length=-2, time=1, energy=1, charge=-1)
+    """
+    out = dimensions.dimensionless
+    for dim, exponent in val.dimensionality.items():
+        if dim not in _clhep_dimensions:
+            msg = f"Unsupported dimension {dim} in {val}"
+            raise ValueError(msg)
+        out *= _clhep_dimensions[dim] ** float(exponent)
+    return out
+
 
 def _unit_from(val: pint.Quantity | pint.Unit) -> pint.Unit:
     """Extract the dimensionality from a Pint Quantity or Unit."""
@@ -41,6 +157,41 @@ def _unit_from(val: pint.Quantity | pint.Unit) -> pint.Unit:
     return out  # type: ignore[return-value]
 
 
+@functools.lru_cache(maxsize=1024)
+def _conversion_factors(
+    registry: pint.UnitRegistry, units: pint.util.UnitsContainer
+) -> tuple[float, float]:
+    """
+    Scale factors from a Pint unit to CLHEP base units, and back.
+
+    The factors are cached per (registry, unit) in a bounded LRU cache,
+    so that repeated conversions reduce to a single multiplication.
+    """
+    unit = registry.Unit(units)
+    clhep_unit = _unit_from(unit)
+    to_factor = (1.0 * unit).to(clhep_unit).magnitude
+    from_factor = (1.0 * clhep_unit).to(unit).magnitude
+    return to_factor, from_factor
+
+
+def cache_info() -> functools._CacheInfo:
+    """
+    Report the hits, misses and size of the conversion-factor cache
+    used by `to_clhep` and `from_clhep`.
+
+    Examples
+    --------
+    >>> cache_info()
+    CacheInfo(hits=0, misses=0, maxsize=1024, currsize=0)
+    """
+    return _conversion_factors.cache_info()
+
+
+def cache_clear() -> None:
+    """Clear the conversion-factor cache and its statistics."""
+    _conversion_factors.cache_clear()
+
+
 def to_clhep(val: pint.Quantity | pint.Unit) -> float:
     """
     Convert a Pint Quantity or Unit to CLHEP base units.
@@ -64,9 +215,10 @@ def to_clhep(val: pint.Quantity | pint.Unit) -> float:
     >>> to_clhep(g)
     9.800000000000001e-15
     """
-    clhep_unit = _unit_from(val)
-    q = (1.0 * val) if isinstance(val, pint.Unit) else val
-    return q.to(clhep_unit).magnitude  # type: ignore[no-any-return]
+    factor, _ = _conversion_factors(val._REGISTRY, val._units)
+    if isinstance(val, pint.Unit):
+        return factor
+    return val.magnitude * factor  # type: ignore[no-any-return]
 
 
 def from_clhep(val: float, unit: pint.Unit) -> pint.Quantity:
@@ -91,5 +243,73 @@ def from_clhep(val: float, unit: pint.Unit) -> pint.Quantity:
     >>> from_clhep(hepunits.c_light, ureg.meter / ureg.second)
     <Quantity(299792458.0, 'meter / second')>
     """
-    clhep_unit = _unit_from(unit)
-    return (val * clhep_unit).to(unit)  # type: ignore[no-any-return]
+    _, factor = _conversion_factors(unit._REGISTRY, unit._units)
+    return unit._REGISTRY.Quantity(val * factor, unit)
+
+
+def to_clhep_array(
+    val: pint.Quantity, out: NDArray[Any] | None = None
+) -> NDArray[np.floating]:
+    """
+    Convert a Pint Quantity wrapping a NumPy array to CLHEP base units.
+
+    The unit is resolved once and the magnitude is scaled with a single
+    multiplication, without intermediate copies.
+
+    Parameters
+    ----------
+    val : pint.Quantity
+        The array quantity to convert.
+    out : numpy.ndarray, optional
+        Array to store the result in, e.g. ``val.magnitude`` to convert in place.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values in CLHEP base units (dimensionless).
+
+    Examples
+    --------
+    >>> ureg = pint.UnitRegistry()
+    >>> to_clhep_array(ureg.Quantity(np.array([1.0, 2.5]), "GeV"))
+    array([1000., 2500.])
+    """
+    import numpy as np  # noqa: PLC0415
+
+    factor, _ = _conversion_factors(val._REGISTRY, val._units)
+    return np.multiply(val.magnitude, factor, out=out)
+
+
+def from_clhep_array(
+    val: NDArray[Any], unit: pint.Unit, out: NDArray[Any] | None = None
+) -> pint.Quantity:
+    """
+    Convert a NumPy array in CLHEP base units to a Pint Quantity.
+
+    The unit is resolved once and the values are scaled with a single
+    multiplication; the returned Quantity wraps the result without copying it.
+
+    Parameters
+    ----------
+    val : numpy.ndarray
+        The values in CLHEP base units (dimensionless).
+    unit : pint.Unit
+        The desired output unit.
+    out : numpy.ndarray, optional
+        Array to store the magnitude in, e.g. ``val`` to convert in place.
+
+    Returns
+    -------
+    pint.Quantity
+        The array quantity in the desired unit.
+
+    Examples
+    --------
+    >>> ureg = pint.UnitRegistry()
+    >>> from_clhep_array(np.array([1000.0, 2500.0]), ureg.GeV)
+    <Quantity([1.  2.5], 'gigaelectron_volt')>
+    """
+    import numpy as np  # noqa: PLC0415
+
+    _, factor = _conversion_factors(unit._REGISTRY, unit._units)
+    return unit._REGISTRY.Quantity(np.multiply(val, factor, out=out), unit)
@@ -0,0 +1,242 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Ranges of the units and constants in reduced floating-point precision.
+
+In the HEP system of units, some units are far from 1, e.g. ``kilogram`` is about
+6e24 and ``attobarn`` 1e-40, which float16 and float32 cannot represent.
+`check` flags the units and constants that overflow, underflow or become
+subnormal numbers in a given floating-point type.
+
+`profile` is a system of units fitted so that the magnitudes of all units are
+as close as possible to 1, with a power of ten per base quantity. It gives the
+reference scale of every dimension: arrays are moved to the profile, e.g. to be
+stored in float32, and back to the HEP system of units with `to_profile` and
+`from_profile`.
+
+Typical use cases::
+
+    >>> from hepunits.precision import check, profile
+    >>> sorted({issue.name for issue in check("float32")} & {"ab", "kg"})
+    ['ab']
+    >>> [issue.name for issue in check("float32", system=profile())]
+    ['googol']
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from . import systems
+from .dimensions import Dimension, registry
+from .parsing import parse_dimension
+from .scaling import scale
+from .systems import System
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+__all__ = ("Issue", "check", "from_profile", "profile", "report", "to_profile")
+
+
+class Issue(NamedTuple):
+    """A unit or constant that is not represented exactly enough, see `check`."""
+
+    name: str
+    """The name of the unit or constant."""
+    value: float
+    """Its value in the system of units that is checked."""
+    problem: str
+    """``"overflow"``, ``"underflow"`` (to zero) or ``"subnormal"``."""
+
+
+def check(
+    dtype: DTypeLike = "float32", *, system: System | None = None, headroom: float = 1.0
+) -> list[Issue]:
+    """
+    Find the units and constants out of the range of normal numbers of a type.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype, optional
+        The floating-point type, float32 by default.
+    system : System, optional
+        The system of units, the HEP system of units by default,
+        e.g. `profile` or one of `hepunits.systems.systems`.
+    headroom : float, optional
+        The factor by which values must stay within the range, so that they
+        can be multiplied or divided by numbers up to ``headroom``.
+
+    Returns
+    -------
+    list of Issue
+        The problems, sorted by name.
+
+    Examples
+    --------
+    >>> check("float32", headroom=1e3)[0]
+    Issue(name='Qg', value=6.241509074460762e+51, problem='overflow')
+    """
+    import numpy as np  # noqa: PLC0415
+
+    table = systems.values(system or System())
+    names = sorted(name for name in table if table[name])
+    magnitudes = np.abs([table[name] for name in names])
+    info = np.finfo(dtype)
+    problems = np.select(
+        [
+            magnitudes * headroom > float(info.max),
+            magnitudes / headroom < float(info.smallest_subnormal) / 2,
+            magnitudes / headroom < float(info.smallest_normal),
+        ],
+        ["overflow", "underflow", "subnormal"],
+        default="",
+    )
+    return [
+        Issue(names[index], table[names[index]], str(problems[index]))
+        for index in np.flatnonzero(problems)
+    ]
+
+
+def report(dtype: DTypeLike = "float32", *, system: System | None = None) -> str:
+    """
+    Describe the units and constants out of the range of a floating-point type.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype, optional
+        The floating-point type, float32 by default.
+    system : System, optional
+        The system of units, see `check`.
+
+    Returns
+    -------
+    str
+        One line per problem, see `check`.
+
+    Examples
+    --------
+    >>> print(report("float32", system=profile()))
+    float32: 0 underflow, 1 overflow, 0 subnormal
+      googol = 1e+100: overflow
+    """
+    import numpy as np  # noqa: PLC0415
+
+    issues = check(dtype, system=system)
+    counts = dict.fromkeys(("underflow", "overflow", "subnormal"), 0)
+    for issue in issues:
+        counts[issue.problem] += 1
+    lines = [
+        f"{np.dtype(dtype).name}: "
+        + ", ".join(f"{count} {problem}" for problem, count in counts.items())
+    ]
+    lines.extend(
+        f"  {issue.name} = {issue.value:.2g}: {issue.problem}" for issue in issues
+    )
+    return "\n".join(lines)
+
+
+@functools.cache
+def profile() -> System:
+    """
+    Get a system of units in which units are as close as possible to 1.
+
+    The base unit of each base quantity is the power of ten that minimizes the sum
+    of squares of the base-10 logarithms of the magnitudes of the units and
+    constants, not counting the dimensionless ones.
+
+    Returns
+    -------
+    System
+        The base units of the profile, in the HEP system of units.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    table = {
+        name: value
+        for name, value in systems.values("hep").items()
+        if any(registry[name])
+    }
+    exponents = np.array([registry[name] for name in table], dtype=np.float64)
+    magnitudes = np.log10(np.abs(list(table.values())))
+    solution, *_ = np.linalg.lstsq(exponents, magnitudes, rcond=None)
+    return System(*(10.0 ** int(power) for power in np.rint(solution)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _reference(dimension: str | Dimension) -> float:
+    """The reference scale of a dimension in the profile, in the HEP system of units."""
+    if isinstance(dimension, str):
+        dimension = parse_dimension(dimension)
+    result = 1.0
+    for base, exponent in zip(profile(), dimension):
+        if exponent:
+            result *= base**exponent
+    return result
+
+
+def to_profile(
+    values: ArrayLike,
+    dimension: str | Dimension,
+    out: NDArray[Any] | None = None,
+    dtype: DTypeLike = "float32",
+) -> NDArray[Any]:
+    """
+    Convert values in the HEP system of units to the profile, see `profile`.
+
+    Parameters
+    ----------
+    values : array_like
+        The values, in the HEP system of units.
+    dimension : str or Dimension
+        The dimension of the values, or a unit expression of this dimension.
+    out : numpy.ndarray, optional
+        The array to write the result to, see `hepunits.scale`.
+    dtype : numpy.dtype, optional
+        The data type of the result, float32 by default. Only the result is
+        rounded to it: float64 values are scaled in float64, see `hepunits.scale`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values in the profile.
+
+    Examples
+    --------
+    >>> from hepunits import GeV
+    >>> to_profile([1.5 * GeV], "GeV")
+    array([1.5], dtype=float32)
+    """
+    return scale(values, 1.0, _reference(dimension), out=out, dtype=dtype)
+
+
+def from_profile(
+    values: ArrayLike,
+    dimension: str | Dimension,
+    out: NDArray[Any] | None = None,
+    dtype: DTypeLike = "float64",
+) -> NDArray[Any]:
+    """
+    Convert values in the profile back to the HEP system of units, see `profile`.
+
+    Parameters
+    ----------
+    values : array_like
+        The values, in the profile.
+    dimension : str or Dimension
+        The dimension of the values, or a unit expression of this dimension.
+    out : numpy.ndarray, optional
+        The array to write the result to, see `hepunits.scale`.
+    dtype : numpy.dtype, optional
+        The data type of the result, float64 by default.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values in the HEP system of units.
+    """
+    return scale(values, _reference(dimension), 1.0, out=out, dtype=dtype)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,252 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Lightweight quantities in the HEP system of units
+=================================================
+
+A `Quantity` pairs a magnitude in the HEP system of units, a float or a NumPy array,
+with its dimension, see `hepunits.dimensions`. Arithmetic on quantities acts on the
+magnitudes as on plain numbers, and on the dimensions with integer arithmetic,
+hence dimensions are checked at a small cost compared to a full-featured units
+library such as Pint.
+
+Typical use cases::
+
+    >>> from hepunits import GeV, MeV, Quantity
+    >>> E = Quantity(2.5, "GeV") + Quantity(500, "MeV")
+    >>> E
+    Quantity(3000.0, Dimension(energy=1))
+    >>> E.to(GeV)
+    3.0
+    >>> E.to("ns")
+    Traceback (most recent call last):
+        ...
+    hepunits.dimensions.DimensionError: Cannot convert [energy] to 'ns' ([time])
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .dimensions import Dimension, DimensionError, dimensionless
+from .parsing import parse_dimension, parse_unit
+
+if TYPE_CHECKING:
+    import pint
+
+__all__ = ("Quantity",)
+
+
+class Quantity:
+    """
+    A magnitude in the HEP system of units, and its dimension.
+
+    Parameters
+    ----------
+    magnitude : float or numpy.ndarray
+        The magnitude, in the units given by ``unit``.
+    unit : str or Dimension, optional
+        Either a unit expression, e.g. ``"GeV"``, the magnitude being in that unit,
+        or the dimension of the magnitude, already in the HEP system of units.
+        Defaults to a dimensionless magnitude.
+
+    Examples
+    --------
+    >>> Quantity(3, "cm")
+    Quantity(30.0, Dimension(length=1))
+    >>> from hepunits.dimensions import length
+    >>> Quantity(30.0, length)
+    Quantity(30.0, Dimension(length=1))
+    """
+
+    __slots__ = ("dimension", "magnitude")
+
+    # Let NumPy defer to the reflected operators of Quantity
+    __array_ufunc__ = None
+
+    magnitude: Any
+    dimension: Dimension
+
+    def __init__(self, magnitude: Any, unit: str | Dimension = dimensionless) -> None:
+        if isinstance(unit, str):
+            self.magnitude = magnitude * parse_unit(unit)
+            self.dimension = parse_dimension(unit)
+        else:
+            self.magnitude = magnitude
+            self.dimension = unit
+
+    @classmethod
+    def _new(cls, magnitude: Any, dimension: Dimension) -> Quantity:
+        out = object.__new__(cls)
+        out.magnitude = magnitude
+        out.dimension = dimension
+        return out
+
+    def to(self, unit: float | str | Quantity) -> Any:
+        """
+        Get the magnitude in the given unit.
+
+        Parameters
+        ----------
+        unit : float, str or Quantity
+            The unit, either as a value from `hepunits.units`, which is not checked,
+            or as a unit expression or a quantity, whose dimension is checked.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            The magnitude in the given unit.
+
+        Examples
+        --------
+        >>> from hepunits import TeV
+        >>> Quantity(500, "GeV").to(TeV)
+        0.5
+        >>> Quantity(500, "GeV").to("TeV")
+        0.5
+        """
+        if isinstance(unit, str):
+            dimension = parse_dimension(unit)
+            if dimension != self.dimension:
+                msg = f"Cannot convert {self.dimension} to {unit!r} ({dimension})"
+                raise DimensionError(msg)
+            return self.magnitude / parse_unit(unit)
+        if isinstance(unit, Quantity):
+            return self.magnitude / self._check(unit, "convert")
+        return self.magnitude / unit
+
+    @classmethod
+    def from_pint(cls, val: pint.Quantity) -> Quantity:
+        """
+        Convert a Pint Quantity, see `hepunits.pint.to_clhep`.
+
+        Examples
+        --------
+        >>> import pint
+        >>> ureg = pint.UnitRegistry()
+        >>> Quantity.from_pint(2 * ureg.GeV / ureg.c)
+        Quantity(6.67128190396304, Dimension(length=-1, time=1, energy=1))
+        """
+        from .pint import dimension_of, to_clhep  # noqa: PLC0415
+
+        return cls._new(to_clhep(val), dimension_of(val))
+
+    def to_pint(self, unit: pint.Unit) -> pint.Quantity:
+        """
+        Convert to a Pint Quantity in the given unit, see `hepunits.pint.from_clhep`.
+
+        Examples
+        --------
+        >>> import pint
+        >>> ureg = pint.UnitRegistry()
+        >>> Quantity(3, "GeV").to_pint(ureg.MeV)
+        <Quantity(3000.0, 'megaelectron_volt')>
+        """
+        from .pint import dimension_of, from_clhep  # noqa: PLC0415
+
+        dimension = dimension_of(unit)
+        if dimension != self.dimension:
+            msg = f"Cannot convert {self.dimension} to {unit} ({dimension})"
+            raise DimensionError(msg)
+        return from_clhep(self.magnitude, unit)
+
+    def _check(self, other: Any, operation: str) -> Any:
+        """Get the magnitude of another operand with the same dimension."""
+        if isinstance(other, Quantity):
+            if other.dimension != self.dimension:
+                msg = f"Cannot {operation} {self.dimension} and {other.dimension}"
+                raise DimensionError(msg)
+            return other.magnitude
+        if self.dimension != dimensionless:
+            msg = f"Cannot {operation} {self.dimension} and a dimensionless number"
+            raise DimensionError(msg)
+        return other
+
+    def __add__(self, other: Any) -> Quantity:
+        return self._new(self.magnitude + self._check(other, "add"), self.dimension)
+
+    def __radd__(self, other: Any) -> Quantity:
+        return self._new(self._check(other, "add") + self.magnitude, self.dimension)
+
+    def __sub__(self, other: Any) -> Quantity:
+        return self._new(
+            self.magnitude - self._check(other, "subtract"), self.dimension
+        )
+
+    def __rsub__(self, other: Any) -> Quantity:
+        return self._new(
+            self._check(other, "subtract") - self.magnitude, self.dimension
+        )
+
+    def __mul__(self, other: Any) -> Quantity:
+        if isinstance(other, Quantity):
+            return self._new(
+                self.magnitude * other.magnitude, self.dimension * other.dimension
+            )
+        return self._new(self.magnitude * other, self.dimension)
+
+    def __rmul__(self, other: Any) -> Quantity:
+        return self._new(other * self.magnitude, self.dimension)
+
+    def __truediv__(self, other: Any) -> Quantity:
+        if isinstance(other, Quantity):
+            return self._new(
+                self.magnitude / other.magnitude, self.dimension / other.dimension
+            )
+        return self._new(self.magnitude / other, self.dimension)
+
+    def __rtruediv__(self, other: Any) -> Quantity:
+        return self._new(other / self.magnitude, dimensionless / self.dimension)
+
+    def __pow__(self, exponent: float) -> Quantity:
+        return self._new(self.magnitude**exponent, self.dimension**exponent)
+
+    def __neg__(self) -> Quantity:
+        return self._new(-self.magnitude, self.dimension)
+
+    def __pos__(self) -> Quantity:
+        return self
+
+    def __abs__(self) -> Quantity:
+        return self._new(abs(self.magnitude), self.dimension)
+
+    def _same_dimension(self, other: object) -> bool:
+        if isinstance(other, Quantity):
+            return other.dimension == self.dimension
+        return self.dimension == dimensionless
+
+    def __eq__(self, other: object) -> Any:
+        if not self._same_dimension(other):
+            return False
+        return self.magnitude == getattr(other, "magnitude", other)
+
+    def __ne__(self, other: object) -> Any:
+        if not self._same_dimension(other):
+            return True
+        return self.magnitude != getattr(other, "magnitude", other)
+
+    def __lt__(self, other: Any) -> Any:
+        return self.magnitude < self._check(other, "compare")
+
+    def __le__(self, other: Any) -> Any:
+        return self.magnitude <= self._check(other, "compare")
+
+    def __gt__(self, other: Any) -> Any:
+        return self.magnitude > self._check(other, "compare")
+
+    def __ge__(self, other: Any) -> Any:
+        return self.magnitude >= self._check(other, "compare")
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __float__(self) -> float:
+        if self.dimension != dimensionless:
+            msg = f"Cannot convert {self.dimension} to a float"
+            raise DimensionError(msg)
+        return float(self.magnitude)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.magnitude!r}, {self.dimension!r})"
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,112 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Conversions of NumPy arrays between units without temporary arrays.
+
+An expression such as ``values * MeV / GeV`` allocates one array per operation.
+`scale` multiplies by the combined factor once, writing into a new array,
+into a buffer given by the caller, or in place, and keeps the precision of
+float32 and float16 arrays.
+
+Typical use cases::
+
+    >>> import numpy as np
+    >>> from hepunits import scale
+    >>> pt = np.array([1500.0, 4250.0], dtype=np.float32)
+    >>> scale(pt, "MeV", "GeV", out=pt)
+    array([1.5 , 4.25], dtype=float32)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .parsing import conversion_factor, parse_unit
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+__all__ = ("scale",)
+
+
+def _value(unit: str | float) -> float:
+    return parse_unit(unit) if isinstance(unit, str) else unit
+
+
+def scale(
+    values: ArrayLike,
+    from_unit: str | float,
+    to_unit: str | float,
+    out: NDArray[Any] | None = None,
+    dtype: DTypeLike | None = None,
+) -> NDArray[Any]:
+    """
+    Convert values from a unit to another one, with a single multiply.
+
+    Parameters
+    ----------
+    values : array_like
+        The values, in ``from_unit``.
+    from_unit, to_unit : str or float
+        The units, as unit expressions, e.g. ``"MeV"``, whose dimensions are
+        checked, or as values in the HEP system of units, e.g. `hepunits.MeV`.
+    out : numpy.ndarray, optional
+        The array to write the result to, which can be ``values`` itself.
+    dtype : numpy.dtype, optional
+        The data type of the result. By default, the one of ``out`` if given,
+        the one of floating-point values, and float64 otherwise. Only the result
+        is rounded to it, values of higher precision are scaled in theirs.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values in ``to_unit``, i.e. ``out`` if given.
+
+    Raises
+    ------
+    DimensionError
+        If the unit expressions have different dimensions.
+
+    Examples
+    --------
+    >>> from hepunits import GeV, MeV
+    >>> scale([1.5, 0.25], GeV, MeV)
+    array([1500.,  250.])
+    """
+    import numpy as np  # noqa: PLC0415
+
+    if isinstance(from_unit, str) and isinstance(to_unit, str):
+        factor = conversion_factor(from_unit, to_unit)
+    else:
+        factor = _value(from_unit) / _value(to_unit)
+    array = np.asanyarray(values)
+    if dtype is None:
+        if out is not None:
+            dtype = out.dtype
+        elif np.issubdtype(array.dtype, np.floating):
+            dtype = array.dtype
+        else:
+            dtype = np.float64
+    # Dividing by an integer, such as 1000 from MeV to GeV, is exact in any precision
+    inverse = 1 / factor
+    exact = inverse.is_integer()
+    # The operation runs in the precision of the values if it is higher, and in
+    # float64 if the factor is out of the range of the data type, e.g. 1e-6 in
+    # float16, so that only the result is rounded
+    compute = np.result_type(array.dtype, dtype)
+    if np.issubdtype(compute, np.floating):
+        info = np.finfo(compute)
+        if not float(info.tiny) <= abs(inverse if exact else factor) <= float(info.max):
+            compute = np.dtype(np.float64)
+    if out is None and compute != dtype:
+        out = np.empty(array.shape, dtype=dtype)
+    if exact:
+        return np.divide(  # type: ignore[no-any-return]
+            array, inverse, out=out, dtype=compute, casting="same_kind"
+        )
+    return np.multiply(  # type: ignore[no-any-return]
+        array, factor, out=out, dtype=compute, casting="same_kind"
+    )
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
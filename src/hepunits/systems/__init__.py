@@ -0,0 +1,205 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Alternative systems of units
+============================
+
+The units and constants of `hepunits` are in the HEP system of units, with
+millimeter = nanosecond = MeV = 1. Other systems are available as modules
+exposing the same names, with values precomputed for their base units:
+
+    ==========   ==========   ===========   ======   =======
+    Module       Length       Time          Energy   Charge
+    ==========   ==========   ===========   ======   =======
+    ``hep``      millimeter   nanosecond    MeV      eplus
+    ``root``     centimeter   second        GeV      eplus
+    ``geant3``   centimeter   second        GeV      eplus
+    ``si``       meter        second        joule    coulomb
+    ==========   ==========   ===========   ======   =======
+
+All systems share kelvin, mole and candela. The ``root`` system is the one of
+the ROOT geometry package (TGeo).
+
+Values are converted between systems with one multiply per dimension,
+by a factor derived from the `matrix` of the base units of systems in each other:
+
+    >>> from hepunits.systems import convert, root
+    >>> root.GeV, root.cm, root.second
+    (1.0, 1.0, 1.0)
+    >>> convert(1500.0, "MeV", "hep", "root")
+    1.5
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypeVar
+
+from .. import constants as _constants
+from .. import units as _units
+from ..dimensions import Dimension, registry
+from ..parsing import parse_dimension
+
+__all__ = ("System", "convert", "factor", "matrix", "systems", "values")
+
+_T = TypeVar("_T")
+
+
+class System(NamedTuple):
+    """
+    The base units of a system of units, one per field of `hepunits.dimensions.Dimension`.
+
+    Examples
+    --------
+    >>> systems["root"].length
+    10.0
+    """
+
+    length: float = 1.0
+    time: float = 1.0
+    energy: float = 1.0
+    charge: float = 1.0
+    temperature: float = 1.0
+    amount: float = 1.0
+    luminous_intensity: float = 1.0
+
+
+systems: Mapping[str, System] = MappingProxyType(
+    {
+        "hep": System(),
+        "root": System(length=_units.cm, time=_units.s, energy=_units.GeV),
+        "geant3": System(length=_units.cm, time=_units.s, energy=_units.GeV),
+        "si": System(
+            length=_units.m,
+            time=_units.s,
+            energy=_units.joule,
+            charge=_units.coulomb,
+        ),
+    }
+)
+"""Read-only mapping of the names of systems to their base units, in the HEP system."""
+
+matrix: Mapping[tuple[str, str], System] = MappingProxyType(
+    {
+        (source, target): System(
+            *(value / base for value, base in zip(systems[source], systems[target]))
+        )
+        for source in systems
+        for target in systems
+    }
+)
+"""
+Read-only mapping of pairs of systems to the base units of the first one
+in the second one, i.e. the factors converting each base quantity.
+"""
+
+
+def _dimension(dimension: str | Dimension) -> Dimension:
+    return parse_dimension(dimension) if isinstance(dimension, str) else dimension
+
+
+def _system(name: str) -> System:
+    if name not in systems:
+        msg = f"Unknown system {name!r}, expected one of {sorted(systems)}"
+        raise ValueError(msg)
+    return systems[name]
+
+
+@functools.lru_cache(maxsize=1024)
+def factor(
+    dimension: str | Dimension, from_system: str = "hep", to_system: str = "hep"
+) -> float:
+    """
+    Get the factor converting values of a dimension between systems of units.
+
+    Parameters
+    ----------
+    dimension : str or Dimension
+        The dimension of the values, or a unit expression of this dimension,
+        e.g. ``"GeV"``.
+    from_system, to_system : str
+        The names of the systems, see `systems`.
+
+    Returns
+    -------
+    float
+        The conversion factor.
+
+    Examples
+    --------
+    >>> factor("GeV", "hep", "root")
+    0.001
+    """
+    _system(from_system)
+    _system(to_system)
+    result = 1.0
+    for value, exponent in zip(matrix[from_system, to_system], _dimension(dimension)):
+        if exponent:
+            result *= value**exponent
+    return result
+
+
+def convert(
+    values: _T, dimension: str | Dimension, from_system: str, to_system: str
+) -> _T:
+    """
+    Convert values of a dimension between systems of units, see `factor`.
+
+    Parameters
+    ----------
+    values : float or array_like
+        The values, e.g. a NumPy array, scaled in one multiply.
+    dimension : str or Dimension
+        The dimension of the values, or a unit expression of this dimension.
+    from_system, to_system : str
+        The names of the systems, see `systems`.
+
+    Returns
+    -------
+    float or array_like
+        The values in the other system.
+    """
+    scale: Any = factor(dimension, from_system, to_system)
+    return values * scale  # type: ignore[no-any-return]
+
+
+def values(system: str | System) -> dict[str, float]:
+    """
+    Get the units and constants in a system of units.
+
+    Parameters
+    ----------
+    system : str or System
+        The name of the system, see `systems`, or its base units.
+
+    Returns
+    -------
+    dict
+        The values of the units and constants, by name.
+
+    Examples
+    --------
+    >>> values("si")["GeV"]
+    1.602176634e-10
+    """
+    base = system if isinstance(system, System) else _system(system)
+    result = {}
+    for module in (_units, _constants):
+        for key in module.__all__:
+            if key in registry:
+                scale = 1.0
+                for unit, exponent in zip(base, registry[key]):
+                    if exponent:
+                        scale *= unit**exponent
+                result[key] = getattr(module, key) / scale
+    return result
+
+
+def _names() -> tuple[str, ...]:
+    """The names of the units and constants of all systems."""
+    return tuple(sorted(values("hep")))
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,19 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units and constants in the system of units of Geant3: centimeter, second, GeV and eplus.
+
+Note that Geant3 gives magnetic fields in kilogauss, which is not a unit of this system.
+
+The values are generated at import, see `hepunits.systems`.
+"""
+
+from . import _names
+from . import values as _values
+
+__all__ = _names()  # noqa: PLE0605
+
+globals().update(_values("geant3"))
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,18 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units and constants in the HEP system of units: millimeter, nanosecond, MeV and eplus.
+The values are the ones of `hepunits.units` and `hepunits.constants`.
+
+The values are generated at import, see `hepunits.systems`.
+"""
+
+from . import _names
+from . import values as _values
+
+__all__ = _names()  # noqa: PLE0605
+
+globals().update(_values("hep"))
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,18 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units and constants in the system of units of the ROOT geometry package (TGeo):
+centimeter, second, GeV and eplus.
+
+The values are generated at import, see `hepunits.systems`.
+"""
+
+from . import _names
+from . import values as _values
+
+__all__ = _names()  # noqa: PLE0605
+
+globals().update(_values("root"))
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
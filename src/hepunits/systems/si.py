@@ -0,0 +1,17 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units and constants in the SI system of units: meter, second, joule and coulomb.
+
+The values are generated at import, see `hepunits.systems`.
+"""
+
+from . import _names
+from . import values as _values
+
+__all__ = _names()  # noqa: PLE0605
+
+globals().update(_values("si"))
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
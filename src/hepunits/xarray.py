@@ -0,0 +1,198 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Units of xarray variables, lazy for variables backed by Dask arrays.
+
+The unit expression of a variable is stored in its ``"units"`` attribute, which
+travels with it through selections and to netCDF and Zarr files. The ``hep``
+accessor of DataArrays and Datasets converts variables with one multiply each.
+
+Conversions of variables backed by Dask arrays are lazy: they add a single
+elementwise layer to the graph, which Dask fuses with the layers around it. The
+conversion of values that are themselves the result of a conversion, with their
+units attribute unchanged since, replaces it, so that chained conversions of
+datasets larger than the memory run in one pass, with a single multiply.
+
+Typical use cases::
+
+    >>> import xarray as xr
+    >>> import hepunits.xarray
+    >>> t = xr.DataArray([1.5, 0.5], dims="hit", attrs={"units": "ns"})
+    >>> t.hep.to("ps").values
+    array([1500.,  500.])
+    >>> ds = xr.Dataset({"t": t, "e": ("hit", [12.0, 3.0], {"units": "MeV"})})
+    >>> ds.hep.to({"t": "ps", "e": "keV"}).hep.units
+    {'t': 'ps', 'e': 'keV'}
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Mapping
+from typing import Any
+
+from .parsing import conversion_factor
+
+try:
+    import xarray as xr
+except ImportError as exc:  # pragma: no cover
+    msg = "xarray is required to use hepunits.xarray."
+    raise ImportError(msg) from exc
+
+__all__ = ("DataArrayAccessor", "DatasetAccessor")
+
+# Name of the attribute holding the unit expression of a variable
+_attribute = "units"
+
+
+# The values and units that lazy conversions started from, and the units they
+# converted to, by the name of the Dask array of their result
+_sources: dict[str, tuple[weakref.ref[Any], Any, str, str]] = {}
+
+
+def _is_lazy(data: Any) -> bool:
+    return hasattr(data, "__dask_graph__")
+
+
+def _source(data: Any, unit: str) -> tuple[Any, str]:
+    """The values and unit that the lazy conversion to these values started from."""
+    entry = _sources.get(data.name)
+    if entry is not None and entry[0]() is data and entry[3] == unit:
+        return entry[1], entry[2]
+    return data, unit
+
+
+def _register(result: Any, source: Any, from_unit: str, to_unit: str) -> None:
+    name = result.name
+
+    def forget(reference: weakref.ref[Any]) -> None:
+        if _sources.get(name, (None,))[0] is reference:
+            del _sources[name]
+
+    _sources[name] = (weakref.ref(result, forget), source, from_unit, to_unit)
+
+
+def _unit(variable: xr.Variable, name: Any) -> str:
+    unit = variable.attrs.get(_attribute)
+    if unit is None:
+        msg = f"Variable {name!r} has no units attribute"
+        raise ValueError(msg)
+    return unit  # type: ignore[no-any-return]
+
+
+def _convert(variable: xr.Variable, name: Any, unit: str) -> xr.Variable:
+    """Convert a variable with one multiply, lazily for Dask arrays."""
+    data, current = variable.data, _unit(variable, name)
+    lazy = _is_lazy(data)
+    if lazy:
+        source, source_unit = _source(data, current)
+        if source.dtype == data.dtype:
+            data, current = source, source_unit
+    factor = conversion_factor(current, unit)
+    if factor != 1:
+        converted = data * factor
+        if lazy:
+            _register(converted, data, current, unit)
+        data = converted
+    attrs = {**variable.attrs, _attribute: unit}
+    return xr.Variable(variable.dims, data, attrs, variable.encoding, fastpath=True)
+
+
+@xr.register_dataarray_accessor("hep")  # type: ignore[no-untyped-call]
+class DataArrayAccessor:
+    """The ``hep`` accessor of DataArrays with a ``"units"`` attribute."""
+
+    def __init__(self, array: xr.DataArray) -> None:
+        self._array = array
+
+    @property
+    def unit(self) -> str | None:
+        """The unit expression of the values, None for values without units."""
+        return self._array.attrs.get(_attribute)
+
+    def to(self, unit: str) -> xr.DataArray:
+        """
+        Convert the values to another unit, with one multiply.
+
+        Values backed by a Dask array are converted lazily, see the module.
+
+        Parameters
+        ----------
+        unit : str
+            The unit expression to convert to, e.g. ``"ps"``.
+
+        Returns
+        -------
+        xarray.DataArray
+            The values in the unit, with the same coordinates.
+
+        Raises
+        ------
+        ValueError
+            If the values have no units.
+        DimensionError
+            If the units have different dimensions.
+        """
+        variable = _convert(self._array.variable, self._array.name, unit)
+        return self._array.copy(deep=False, data=variable.data).assign_attrs(
+            {_attribute: unit}
+        )
+
+
+@xr.register_dataset_accessor("hep")  # type: ignore[no-untyped-call]
+class DatasetAccessor:
+    """The ``hep`` accessor of Datasets with variables with a ``"units"`` attribute."""
+
+    def __init__(self, dataset: xr.Dataset) -> None:
+        self._dataset = dataset
+
+    @property
+    def units(self) -> dict[Any, str]:
+        """The unit expressions of the data variables and coordinates with units."""
+        return {
+            name: variable.attrs[_attribute]
+            for name, variable in self._dataset.variables.items()
+            if _attribute in variable.attrs
+        }
+
+    def to(self, units: Mapping[Any, str]) -> xr.Dataset:
+        """
+        Convert data variables and coordinates to other units, with one multiply each.
+
+        Variables backed by Dask arrays are converted lazily, see the module.
+
+        Parameters
+        ----------
+        units : dict
+            The unit expressions to convert to, e.g. ``{"t": "ps", "e": "keV"}``.
+            Variables not in the mapping are left as is.
+
+        Returns
+        -------
+        xarray.Dataset
+            The variables in the given units.
+
+        Raises
+        ------
+        ValueError
+            If a variable is not in the Dataset, or has no units.
+        DimensionError
+            If the units have different dimensions.
+        """
+        variables = self._dataset.variables
+        unknown = set(units) - set(variables)
+        if unknown:
+            msg = f"No variables {sorted(map(str, unknown))} in {list(variables)}"
+            raise ValueError(msg)
+        converted = {
+            name: _convert(variables[name], name, unit) for name, unit in units.items()
+        }
+        data_vars = self._dataset.data_vars
+        return self._dataset.assign_coords(
+            {name: value for name, value in converted.items() if name not in data_vars}
+        ).assign(
+            {name: value for name, value in converted.items() if name in data_vars}
+        )
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
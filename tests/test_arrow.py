@@ -0,0 +1,80 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.arrow module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits.dimensions import DimensionError
+
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from hepunits.arrow import to_numpy, to_units, units, with_units
+
+
+@pytest.fixture
+def table():
+    table = pa.table({"pt": [1200.0, 4100.0], "t": [1.5, 0.5], "n": [3, 1]})
+    return with_units(
+        table.replace_schema_metadata({"run": "42"}), {"pt": "MeV", "t": "ns"}
+    )
+
+
+def test_with_units(table):
+    assert units(table) == {"pt": "MeV", "t": "ns"}
+    assert units(table.schema) == units(table)
+    assert table.schema.metadata == {b"run": b"42"}
+    assert units(with_units(table, {"pt": "GeV"})) == {"pt": "GeV", "t": "ns"}
+    with pytest.raises(ValueError, match="No columns"):
+        with_units(table, {"eta": "rad"})
+    with pytest.raises(ValueError, match="Unknown unit"):
+        with_units(table, {"pt": "GeW"})
+
+
+def test_record_batch(table):
+    batch = table.to_batches()[0]
+    assert isinstance(with_units(batch, {"n": "1"}), pa.RecordBatch)
+    converted = to_units(batch, {"pt": "GeV"})
+    assert isinstance(converted, pa.RecordBatch)
+    assert converted.column("pt").to_pylist() == approx([1.2, 4.1])
+
+
+def test_to_numpy(table):
+    pt = to_numpy(table, "pt", "MeV")
+    # Same unit: a view of the Arrow buffer
+    assert not pt.flags.writeable
+    assert pt.ctypes.data == table.column("pt").chunk(0).buffers()[1].address
+    assert to_numpy(table, "pt").ctypes.data == pt.ctypes.data
+    assert to_numpy(table, "pt", "GeV") == approx([1.2, 4.1])
+    assert to_numpy(pa.concat_tables([table, table]), "t", "ps") == approx(
+        [1500, 500, 1500, 500]
+    )
+    assert to_numpy(table, "n").tolist() == [3, 1]
+    with pytest.raises(ValueError, match="no units"):
+        to_numpy(table, "n", "GeV")
+    with pytest.raises(DimensionError):
+        to_numpy(table, "pt", "ns")
+
+
+def test_to_units(table):
+    converted = to_units(table, {"pt": "GeV", "t": "ns"})
+    assert units(converted) == {"pt": "GeV", "t": "ns"}
+    assert converted.column("pt").to_pylist() == approx([1.2, 4.1])
+    # Columns already in the requested units are reused
+    assert converted.column("t").chunk(0).buffers()[1].address == (
+        table.column("t").chunk(0).buffers()[1].address
+    )
+    assert converted.column("n") == table.column("n")
+    assert converted.schema.metadata == {b"run": b"42"}
+    with pytest.raises(DimensionError):
+        to_units(table, {"t": "GeV"})
+
+
+def test_parquet(table, tmp_path):
+    pq.write_table(table, tmp_path / "tracks.parquet")
+    read = pq.read_table(tmp_path / "tracks.parquet")
+    assert units(read) == {"pt": "MeV", "t": "ns"}
+    assert to_numpy(read, "pt", "GeV") == approx([1.2, 4.1])
@@ -0,0 +1,69 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.awkward module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits.dimensions import DimensionError
+
+ak = pytest.importorskip("awkward")
+np = pytest.importorskip("numpy")
+
+from hepunits.awkward import to, units, with_units
+
+
+@pytest.fixture
+def events():
+    tracks = ak.Array(
+        [
+            [
+                {"pt": 1200.0, "eta": 0.5, "t": 1.0},
+                {"pt": 800.0, "eta": -1.0, "t": 2.0},
+            ],
+            [],
+            [{"pt": 4100.0, "eta": 2.0, "t": 0.5}],
+        ]
+    )
+    return with_units(tracks, {"pt": "MeV", "t": "ns"})
+
+
+def test_with_units(events):
+    assert units(events) == {"pt": "MeV", "eta": None, "t": "ns"}
+    assert units(events.pt) == "MeV"
+    assert units(events.pt[events.pt > 1000]) == "MeV"
+    assert units(ak.concatenate([events, events])) == units(events)
+    with pytest.raises(ValueError, match="Unknown unit"):
+        with_units(events, {"pt": "GeVV"})
+
+
+def test_to(events):
+    pt = to(events.pt, "GeV")
+    assert units(pt) == "GeV"
+    assert ak.flatten(pt).tolist() == approx([1.2, 0.8, 4.1])
+    assert ak.num(pt).tolist() == [2, 0, 1]
+
+    converted = to(events, {"pt": "GeV", "t": "ps"})
+    assert units(converted) == {"pt": "GeV", "eta": None, "t": "ps"}
+    assert ak.flatten(converted.t).tolist() == approx([1000.0, 2000.0, 500.0])
+    assert ak.flatten(converted.eta).tolist() == ak.flatten(events.eta).tolist()
+
+
+def test_to_reuses_offsets(events):
+    pt = to(events.pt, "GeV")
+    assert np.shares_memory(
+        ak.to_layout(pt).offsets.data, ak.to_layout(events.pt).offsets.data
+    )
+    assert ak.to_layout(to(pt, "GeV")).content.data is ak.to_layout(pt).content.data
+
+
+def test_to_errors(events):
+    with pytest.raises(DimensionError):
+        to(events.pt, "ns")
+    with pytest.raises(ValueError, match="without units"):
+        to(events.eta, "rad")
+    with pytest.raises(ValueError, match="one unit per field"):
+        to(events, "GeV")
+    with pytest.raises(ValueError, match="No fields"):
+        to(events, {"E": "GeV"})
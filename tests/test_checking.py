@@ -0,0 +1,82 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.checking module.
+"""
+
+import inspect
+import subprocess
+import sys
+
+import pytest
+from pytest import approx
+
+from hepunits import GeV, Quantity, checked
+from hepunits import dimensions as dim
+from hepunits.dimensions import DimensionError
+
+
+def _momentum(energy, mass):
+    c = Quantity(1, "c")
+    return (energy**2 - (mass * c**2) ** 2) ** 0.5 / c
+
+
+def test_checked():
+    momentum = checked(energy="GeV", mass=dim.mass, returns="GeV/c")(_momentum)
+    p = momentum(Quantity(10, "GeV"), Quantity(6, "GeV/c^2"))
+    assert p.to("GeV/c") == approx(8.0)
+    assert momentum(Quantity(10, "GeV"), mass=Quantity(6, "GeV/c^2")).dimension == (
+        dim.momentum
+    )
+
+    with pytest.raises(DimensionError, match="Argument 'mass'"):
+        momentum(Quantity(10, "GeV"), Quantity(6, "GeV"))
+
+    # Plain numbers are not checked
+    energy = checked(energy="GeV")(lambda energy: energy)
+    assert energy(10 * GeV) == 10 * GeV
+
+
+def test_checked_result():
+    wrong = checked(returns="GeV")(_momentum)
+    with pytest.raises(DimensionError, match="Result"):
+        wrong(Quantity(10, "GeV"), Quantity(6, "GeV/c^2"))
+
+
+def test_checked_once_per_dimensions(monkeypatch):
+    momentum = checked(energy="GeV", returns="GeV/c")(_momentum)
+    momentum(Quantity(10, "GeV"), Quantity(6, "GeV/c^2"))
+
+    calls = []
+    bind = inspect.Signature.bind
+    monkeypatch.setattr(
+        inspect.Signature, "bind", lambda *args, **_: calls.append(args)
+    )
+    for energy in (10, 20, 30):
+        momentum(Quantity(energy, "GeV"), Quantity(6, "GeV/c^2"))
+    assert calls == []
+
+    monkeypatch.setattr(inspect.Signature, "bind", bind)
+    with pytest.raises(DimensionError):
+        momentum(Quantity(10, "GeV/c"), Quantity(6, "GeV/c^2"))
+
+
+def test_unknown_argument():
+    with pytest.raises(TypeError, match="no arguments"):
+        checked(momentum="GeV/c")(_momentum)
+
+
+def test_disabled(monkeypatch):
+    monkeypatch.setenv("HEPUNITS_CHECKS", "0")
+    assert checked(energy="GeV")(_momentum) is _momentum
+
+
+def test_disabled_with_optimizations():
+    code = (
+        "from hepunits import checked\n"
+        "def f(x): return x\n"
+        "print(checked(x='GeV')(f) is f)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-O", "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "True"
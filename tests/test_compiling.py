@@ -0,0 +1,143 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.compiling module.
+"""
+
+import pytest
+from pytest import approx
+
+import hepunits
+from hepunits.constants import c_light, eplus, hbarc
+from hepunits.dimensions import DimensionError
+from hepunits.units import GeV, MeV, T, m, mm
+
+np = pytest.importorskip("numpy")
+
+from hepunits.compiling import compile
+
+
+def _return(function):
+    return function.__doc__.splitlines()[-1].strip()
+
+
+def test_values():
+    rng = np.random.default_rng(42)
+    pt, b = rng.uniform(1, 100, 1000), rng.uniform(0.5, 4, 1000)
+    radius = compile("pt / (eplus * c_light * B)", {"pt": "GeV", "B": "T"}, "m")
+    assert radius(pt, b) == approx(pt * GeV / (eplus * c_light * b * T) / m)
+
+    e, p = rng.uniform(5, 10, 1000), rng.uniform(0, 5, 1000)
+    mass = compile(
+        "sqrt(E^2 - (p * c_light)^2) / c_light_sq",
+        {"E": "MeV", "p": "MeV / c_light"},
+        "GeV / c_light_sq",
+    )
+    assert mass(e, p) == approx(np.sqrt(e**2 - p**2) * MeV / GeV)
+
+    t = rng.uniform(0, 10, 1000)
+    decay = compile("exp(-t / tau) + abs(log10(t / ns))", {"t": "ns", "tau": "ps"})
+    assert decay(t, 1500.0) == approx(np.exp(-t / 1.5) + np.abs(np.log10(t)))
+
+
+def test_folding():
+    radius = compile("pt / (eplus * c_light * B)", {"pt": "GeV", "B": "T"}, "m")
+    code, constant = _return(radius).rsplit(" * ", 1)
+    assert code == "return pt / B"
+    assert float(constant) == approx(GeV / (eplus * c_light * T) / m)
+    compton = compile("hbarc / (m * c_light_sq)", {"m": "GeV"}, "m * ns^2 / m^2")
+    assert _return(compton).endswith("/ m")
+    assert _return(compton).count(".") == 1
+    assert _return(compile("2 * x + 3 * x - x", {"x": "mm"}, "m")) == "return x * 0.004"
+    mass = compile(
+        "sqrt(E^2 - (p * c_light)^2)", {"E": "GeV", "p": "GeV / c_light"}, "MeV"
+    )
+    assert _return(mass) == "return (E ** 2 - p ** 2) ** 0.5 * 1000.0"
+    assert _return(compile("x + 2 * y + 2 * z", dict.fromkeys("xyz", "m"), "mm")) == (
+        "return (x * 0.5 + y + z) * 2000.0"
+    )
+
+
+def test_negative_factors():
+    inputs = dict.fromkeys("abcd", "GeV")
+    root = compile("sqrt((a - b) * (c - d))", inputs, "GeV")
+    assert root(1.0, 2.0, 1.0, 3.0) == approx(np.sqrt(2.0))
+    product = compile("sqrt(x * y)", dict.fromkeys("xy", "GeV"), "MeV")
+    assert product(np.array([-1.0, 4.0]), np.array([-1.0, 9.0])) == approx([1e3, 6e3])
+    assert _return(product) == "return (x * y) ** 0.5 * 1000.0"
+
+
+def test_merged_powers_domain():
+    root = compile("sqrt(x) * sqrt(x)", {"x": "1"})
+    with np.errstate(invalid="ignore"):
+        assert np.isnan(root(-2.0))
+    assert root(2.0) == approx(2.0)
+    scaled = compile("(2 * x)^0.5 * (2 * x)^0.5", {"x": "1"})
+    assert _return(scaled).startswith("return (x ** 0.5) ** 2")
+    with np.errstate(invalid="ignore"):
+        assert np.isnan(scaled(-2.0))
+    assert _return(compile("sqrt(x^2)", {"x": "1"})) == "return (x ** 2) ** 0.5"
+
+
+def test_abs_coefficients():
+    assert _return(compile("abs(x) * GeV", {"x": "GeV"}, "GeV^2")) == (
+        "return _np.abs(x)"
+    )
+    assert _return(compile("abs(-3 * x)", {"x": "GeV"}, "GeV")) == (
+        "return _np.abs(x) * 3.0"
+    )
+    difference = compile("abs(x - 2 * y)", dict.fromkeys("xy", "GeV"), "MeV")
+    assert _return(difference) == "return _np.abs(x - y * 2.0) * 1000.0"
+    assert difference(1.0, 1.0) == approx(1000.0)
+
+
+def test_constant_domain_errors():
+    with pytest.raises(ValueError, match="non-integer power"):
+        compile("sqrt(-1)")
+    with pytest.raises(ValueError, match="domain of log"):
+        compile("log(-1)")
+    assert compile("(-2)^3")() == approx(-8.0)
+    with pytest.raises(ValueError, match="Division by zero"):
+        compile("x / (y - y)", dict.fromkeys("xy", "mm"))
+
+
+def test_constant_result():
+    ratio = compile("x / x * hbarc", {"x": "mm"}, "MeV * fm")
+    assert ratio(np.ones((2, 3))).shape == (2, 3)
+    assert ratio(np.ones(4)) == approx(hbarc / (MeV * 1e-12 * mm))
+    assert compile("2 * GeV", output="MeV")() == approx(2000.0)
+
+
+def test_inputs_shadow_units():
+    energy = compile("m * c_light_sq", {"m": "GeV / c_light_sq"}, "MeV")
+    assert energy(np.array([1.0, 2.0])) == approx([1000.0, 2000.0])
+
+
+def test_dimension_errors():
+    with pytest.raises(DimensionError, match="Cannot add"):
+        compile("x + y", {"x": "mm", "y": "ns"})
+    with pytest.raises(DimensionError, match="Argument of exp"):
+        compile("exp(t)", {"t": "ns"})
+    with pytest.raises(DimensionError, match="Variable exponent"):
+        compile("x ^ n", {"x": "mm", "n": "1"})
+    with pytest.raises(DimensionError, match="expected"):
+        compile("x * y", {"x": "mm", "y": "mm"}, "m")
+    with pytest.raises(ValueError, match="Unknown unit"):
+        compile("x * foo", {"x": "mm"})
+
+
+def test_invalid_inputs():
+    for name in ("1x", "lambda", "_np"):
+        with pytest.raises(ValueError, match="Invalid input name"):
+            compile(name, {name: "mm"})
+
+
+def test_cache():
+    inputs = {"pt": "GeV", "B": "T"}
+    assert compile("pt / B", inputs) is compile("pt / B", dict(inputs))
+    assert compile("pt / B", inputs) is not compile("pt / B", inputs, "GeV / T")
+
+
+def test_lazy_attribute():
+    assert hepunits.compile is compile
+    assert "compile" not in hepunits.__all__
+    assert "compile" in dir(hepunits)
@@ -0,0 +1,95 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.dimensions module.
+"""
+
+import pytest
+
+import hepunits
+from hepunits import dimensions as dim
+from hepunits.dimensions import Dimension, registry
+from hepunits.parsing import parse_dimension
+
+
+def test_algebra():
+    assert dim.length * dim.length == dim.area
+    assert dim.area / dim.length == dim.length
+    assert dim.volume ** (1 / 3) == dim.length
+    assert dim.velocity**-2 == Dimension(length=-2, time=2)
+    assert dim.mass * dim.velocity**2 == dim.energy
+    assert dim.energy / dim.energy == dim.dimensionless
+    assert dim.momentum == Dimension(length=-1, time=1, energy=1)
+
+
+def test_non_integer_power():
+    with pytest.raises(ValueError, match="Non-integer exponents"):
+        dim.length**0.5
+
+
+def test_str_and_repr():
+    assert str(dim.dimensionless) == "dimensionless"
+    assert str(dim.velocity) == "[length] / [time]"
+    assert str(dim.frequency) == "1 / [time]"
+    assert str(dim.mass) == "[time] ** 2 * [energy] / [length] ** 2"
+    assert repr(dim.dimensionless) == "Dimension()"
+    assert repr(dim.velocity) == "Dimension(length=1, time=-1)"
+
+
+def test_registry_complete():
+    names = set()
+    for module in (hepunits.units, hepunits.constants):
+        names |= {
+            name for name in module.__all__ if isinstance(getattr(module, name), float)
+        }
+    assert set(registry) == names
+
+
+def test_registry_consistent():
+    assert registry["GeV"] == dim.energy
+    assert registry["tesla"] == registry["volt"] * registry["s"] / registry["m2"]
+    assert registry["hbarc"] == registry["hbar"] * registry["c_light"]
+    assert registry["joule"] == registry["kg"] * registry["m"] ** 2 / registry["s"] ** 2
+    assert registry["invfb"] == dim.dimensionless / registry["fb"]
+
+
+def test_registry_matches_pint():
+    hepunits_pint = pytest.importorskip("hepunits.pint")
+
+    ureg = hepunits_pint.get_registry()
+    pint_dimensions = {
+        "[length]": dim.length,
+        "[time]": dim.time,
+        "[mass]": dim.mass,
+        "[current]": dim.current,
+        "[temperature]": dim.temperature,
+        "[substance]": dim.amount,
+        "[luminosity]": dim.luminous_intensity,
+    }
+    for name in hepunits.units.units.__all__:
+        expected = dim.dimensionless
+        for pint_dimension, exponent in getattr(ureg, name).dimensionality.items():
+            expected *= pint_dimensions[pint_dimension] ** exponent
+        assert registry[name] == expected, name
+
+
+@pytest.mark.parametrize(
+    ("expr", "expected"),
+    [
+        ("GeV/c^2", dim.mass),
+        ("GeV/c", dim.momentum),
+        ("T*m", registry["tesla"] * dim.length),
+        ("1/fb", dim.dimensionless / dim.area),
+        ("mm2^0.5", dim.length),
+        ("2 pi", dim.dimensionless),
+        ("-ns", dim.time),
+    ],
+)
+def test_parse_dimension(expr, expected):
+    assert parse_dimension(expr) == expected
+
+
+def test_parse_dimension_invalid():
+    with pytest.raises(ValueError, match="Non-integer exponents"):
+        parse_dimension("m^(1/2)")
+    with pytest.raises(ValueError, match="Exponent with dimension"):
+        parse_dimension("GeV^m")
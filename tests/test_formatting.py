@@ -0,0 +1,98 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.formatting module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits import GeV, MeV, TeV, barn, c_light, eV, fb, keV, ns, ps
+from hepunits import dimensions as dim
+
+np = pytest.importorskip("numpy")
+
+from hepunits.formatting import _prefix_table, format_with_prefixes, with_prefixes
+
+
+def test_with_prefixes():
+    values, labels = with_prefixes([12.4 * GeV, 350 * MeV, 2 * eV], "eV")
+    assert values == approx([12.4, 350.0, 2.0])
+    assert labels.tolist() == ["GeV", "MeV", "eV"]
+
+    values, labels = with_prefixes([0.0, np.inf], "eV")
+    assert labels.tolist() == ["eV", "eV"]
+
+
+def test_format_with_prefixes():
+    values = [1 * TeV, -500 * keV, 12.4 * GeV, 1.5 * ns, 25 * ps]
+    assert format_with_prefixes(values[:3], "eV").tolist() == [
+        "1.00 TeV",
+        "-500 keV",
+        "12.4 GeV",
+    ]
+    assert format_with_prefixes(values[3:], "s").tolist() == ["1.50 ns", "25.0 ps"]
+
+
+def test_rounding():
+    # Rounding to the significant digits can change the prefix
+    assert format_with_prefixes([999.96 * MeV, -999.4 * MeV], "eV").tolist() == [
+        "1.00 GeV",
+        "-999 MeV",
+    ]
+    assert format_with_prefixes([12.345 * GeV], "eV", digits=1).tolist() == ["10 GeV"]
+    assert format_with_prefixes([12.345 * GeV], "eV", digits=5).tolist() == [
+        "12.345 GeV"
+    ]
+
+
+def test_digits():
+    values = np.random.default_rng(42).lognormal(0, 10, 1000)
+    prefixes = {
+        symbol + "eV": 10.0**exponent for exponent, symbol in zip(*_prefix_table())
+    }
+    for digits in (2, 3, 4):
+        for value, formatted in zip(values, format_with_prefixes(values, "eV", digits)):
+            number, unit = formatted.split()
+            assert float(number) * prefixes[unit] * eV == approx(
+                value, rel=0.5 * 10 ** (1 - digits)
+            )
+
+    for digits in (0, 16):
+        with pytest.raises(ValueError, match="significant digits"):
+            format_with_prefixes([1.0], "eV", digits=digits)
+
+
+def test_special_values():
+    assert format_with_prefixes([0.0, np.nan, -np.inf], "eV").tolist() == [
+        "0 eV",
+        "nan eV",
+        "-inf eV",
+    ]
+    # Out of the range of the prefixes
+    values = [1e-10 * eV * 1e-30, 1e39 * eV, -999.9996e30 * eV, 999.4e30 * eV]
+    assert format_with_prefixes(values, "eV").tolist() == [
+        "1.00e-40 eV",
+        "1.00e+39 eV",
+        "-1.00e+33 eV",
+        "999 QeV",
+    ]
+
+
+def test_dimensions():
+    assert format_with_prefixes([30 * barn, 1 * fb], dim.area).tolist() == [
+        "30.0 b",
+        "1.00 fb",
+    ]
+    assert format_with_prefixes([5 * GeV / c_light**2], dim.mass).tolist() == [
+        "5.00 GeV/c^2"
+    ]
+    with pytest.raises(ValueError, match="No default unit"):
+        format_with_prefixes([1.0], dim.energy**2)
+
+
+def test_shape():
+    values = np.full((2, 3), 1.5 * GeV)
+    result = format_with_prefixes(values, dim.energy)
+    assert result.shape == (2, 3)
+    assert (result == "1.50 GeV").all()
+    assert format_with_prefixes([], "eV").shape == (0,)
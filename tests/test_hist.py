@@ -0,0 +1,128 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.hist module.
+"""
+
+import pickle
+
+import pytest
+from pytest import approx
+
+from hepunits.dimensions import DimensionError
+
+np = pytest.importorskip("numpy")
+bh = pytest.importorskip("boost_histogram")
+
+from hepunits.hist import Units, rescale, to, units, with_units
+
+
+@pytest.fixture
+def hist():
+    h = bh.Histogram(
+        bh.axis.Regular(4, 0, 8000, metadata="pt"),
+        bh.axis.Variable([0.0, 1.0, 10.0], underflow=False),
+        bh.axis.Integer(0, 3),
+        storage=bh.storage.Weight(),
+    )
+    h.axes[1].name = "t"
+    h.fill([1200.0, 4100.0, 9000.0], [0.5, 5.0, 2.0], [1, 2, 0], weight=[2.0, 3.0, 1.0])
+    return with_units(h, axes={0: "MeV", "t": "ns"}, contents="pb")
+
+
+def test_units(hist):
+    assert units(hist) == Units(("MeV", "ns", None), "pb")
+    assert units(pickle.loads(pickle.dumps(hist))) == units(hist)
+    assert units(bh.Histogram(bh.axis.Regular(2, 0, 1))) == Units((None,), None)
+    with pytest.raises(KeyError, match="No axis named"):
+        with_units(hist, axes={"x": "GeV"})
+    with pytest.raises(IndexError, match="No axis 3"):
+        with_units(hist, axes={3: "GeV"})
+    with pytest.raises(ValueError, match="Unknown unit"):
+        with_units(hist, contents="foo")
+
+
+def test_to(hist):
+    converted = to(hist, axes={0: "GeV", 1: "ps"}, contents="fb")
+    assert units(converted) == Units(("GeV", "ps", None), "fb")
+    assert converted.axes[0].edges == approx([0, 2, 4, 6, 8])
+    assert converted.axes[0].metadata == "pt"
+    assert converted.axes[1].edges == approx([0, 1000, 10000])
+    assert converted.axes[1].name == "t"
+    assert converted.axes[1].traits == hist.axes[1].traits
+    assert converted.axes[2] == hist.axes[2]
+    view, original = converted.view(flow=True), hist.view(flow=True)
+    assert view.value == approx(original.value * 1000)
+    assert view.variance == approx(original.variance * 1000**2)
+
+    # The original histogram is unchanged
+    assert units(hist) == Units(("MeV", "ns", None), "pb")
+    assert hist.axes[0].edges[-1] == 8000
+    assert hist.sum(flow=True).value == 6.0
+
+    with pytest.raises(DimensionError, match="Cannot convert"):
+        to(hist, axes={0: "ns"})
+    with pytest.raises(ValueError, match="Axis 2 has no units"):
+        to(hist, axes={2: "GeV"})
+
+
+def test_inplace(hist):
+    view = hist.view(flow=True)
+    assert to(hist, contents="fb", inplace=True) is hist
+    assert units(hist).contents == "fb"
+    assert hist.sum(flow=True).value == approx(6000.0)
+    assert hist.sum(flow=True).variance == approx(14e6)
+    assert np.shares_memory(hist.view(flow=True), view)
+    with pytest.raises(ValueError, match="in place"):
+        to(hist, axes={0: "GeV"}, inplace=True)
+
+
+@pytest.mark.parametrize(
+    "storage", [bh.storage.Double(), bh.storage.Unlimited(), bh.storage.Int64()]
+)
+def test_storages(storage):
+    h = bh.Histogram(bh.axis.Regular(2, 0, 1), storage=storage)
+    h.fill([0.2, 0.3, 0.7])
+    result = rescale(h, {0: 10.0})
+    assert result.axes[0].edges == approx([0, 5, 10])
+    assert result.values().tolist() == [2, 1]
+    if storage == bh.storage.Int64():
+        with pytest.raises(TypeError, match="integer storages"):
+            rescale(h, contents=0.5)
+    else:
+        assert rescale(h, contents=0.5).values().tolist() == [1.0, 0.5]
+
+
+@pytest.mark.parametrize("storage", [bh.storage.Mean(), bh.storage.WeightedMean()])
+def test_mean_storages(storage):
+    h = bh.Histogram(bh.axis.Regular(2, 0, 1), storage=storage)
+    h.fill([0.2, 0.3], sample=[1.0, 3.0])
+    result = rescale(h, contents=1000.0)
+    assert result.values().tolist() == [2000.0, 0.0]
+    assert result.variances()[0] == approx(h.variances()[0] * 1e6)
+    assert result.counts().tolist() == h.counts().tolist()
+
+
+def test_axes():
+    h = bh.Histogram(
+        bh.axis.Regular(3, 1, 100, transform=bh.axis.transform.log),
+        bh.axis.Regular(4, 0, 360, circular=True),
+        bh.axis.StrCategory(["a", "b"]),
+    )
+    result = rescale(h, {0: 1000.0, 1: 2.0})
+    assert result.axes[0].edges == approx(h.axes[0].edges * 1000)
+    assert result.axes[0].transform is not None
+    assert result.axes[1].traits.circular
+    with pytest.raises(TypeError, match="StrCategory"):
+        rescale(h, {2: 2.0})
+    with pytest.raises(ValueError, match="positive"):
+        rescale(h, {0: -1.0})
+
+
+def test_hist():
+    hist = pytest.importorskip("hist")
+    h = hist.Hist.new.Reg(4, 0, 8000, name="pt", label="pT").Double()
+    h.fill(pt=[1200.0, 4100.0])
+    result = to(with_units(h, axes={"pt": "MeV"}), axes={"pt": "GeV"})
+    assert isinstance(result, hist.Hist)
+    assert result.axes["pt"].label == "pT"
+    assert result.axes["pt"].edges[-1] == 8.0
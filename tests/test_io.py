@@ -0,0 +1,75 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.io module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits.dimensions import DimensionError
+
+np = pytest.importorskip("numpy")
+
+from hepunits.io import Progress, convert_file
+
+
+@pytest.fixture
+def times(tmp_path):
+    path = tmp_path / "times.npy"
+    np.save(path, np.arange(1000.0).reshape(10, 100))
+    return path
+
+
+def test_convert_npy(times, tmp_path):
+    result = convert_file(times, tmp_path / "times_ps.npy", "ns", "ps", chunk=64)
+    assert result.done == result.total == 8000
+    assert result.fraction == 1
+    converted = np.load(tmp_path / "times_ps.npy")
+    assert converted.shape == (10, 100)
+    assert converted == approx(np.load(times) * 1000)
+
+
+def test_convert_fortran_order(tmp_path):
+    values = np.asfortranarray(np.arange(12.0).reshape(3, 4))
+    np.save(tmp_path / "values.npy", values)
+    convert_file(tmp_path / "values.npy", tmp_path / "result.npy", "GeV", "MeV")
+    result = np.load(tmp_path / "result.npy")
+    assert result.flags.f_contiguous
+    assert result == approx(values * 1000)
+
+
+def test_convert_in_place(times):
+    convert_file(times, None, "ns", "us", chunk=300, workers=3)
+    assert np.load(times).ravel() == approx(np.arange(1000.0) / 1000)
+    convert_file(times, times, "us", "ns")
+    assert np.load(times).ravel() == approx(np.arange(1000.0))
+
+
+def test_convert_raw(tmp_path):
+    np.arange(100, dtype=np.float32).tofile(tmp_path / "values.bin")
+    convert_file(
+        tmp_path / "values.bin", tmp_path / "result.bin", "m", "cm", dtype=np.float32
+    )
+    result = np.fromfile(tmp_path / "result.bin", dtype=np.float32)
+    assert result == approx(np.arange(100) * 100)
+
+
+def test_progress(times, tmp_path):
+    reports = []
+    convert_file(
+        times, tmp_path / "result.npy", "ns", "ps", chunk=100, progress=reports.append
+    )
+    assert [report.done for report in reports] == list(range(800, 8001, 800))
+    assert all(isinstance(report, Progress) for report in reports)
+    assert reports[-1].fraction == 1
+    assert reports[-1].throughput > 0
+
+
+def test_errors(times, tmp_path):
+    with pytest.raises(DimensionError):
+        convert_file(times, tmp_path / "result.npy", "ns", "GeV")
+    with pytest.raises(ValueError, match="positive"):
+        convert_file(times, tmp_path / "result.npy", "ns", "ps", chunk=0)
+    np.save(tmp_path / "counts.npy", np.arange(10))
+    with pytest.raises(TypeError, match="floating-point"):
+        convert_file(tmp_path / "counts.npy", None, "ns", "ps")
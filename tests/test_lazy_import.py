@@ -0,0 +1,61 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the lazy loading of the top-level hepunits namespace.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import hepunits
+
+
+def _loaded_modules(code: str) -> set[str]:
+    code += "\nimport sys\nprint(' '.join(sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(out.stdout.split())
+
+
+def test_import_is_lazy():
+    modules = _loaded_modules("import hepunits")
+    assert "hepunits" in modules
+    assert "hepunits.units" not in modules
+    assert "hepunits.constants" not in modules
+    assert "pint" not in modules
+
+
+def test_star_import_does_not_import_pint():
+    modules = _loaded_modules("from hepunits import *")
+    assert "hepunits.units.units" in modules
+    assert "hepunits.constants.constants" in modules
+    assert "hepunits.pint" not in modules
+    assert "pint" not in modules
+
+
+def test_star_import_only_imports_units_and_constants():
+    namespace = {}
+    exec("from hepunits import *", namespace)  # noqa: S102
+    assert "GeV" in namespace
+    for name in ("Quantity", "checked", "compile", "parse", "parse_array", "scale"):
+        assert name not in namespace
+        assert name in dir(hepunits)
+        assert getattr(hepunits, name) is not None
+
+
+def test_lazy_attributes():
+    assert hepunits.GeV is hepunits.units.GeV
+    assert hepunits.c_light is hepunits.constants.c_light
+    assert hepunits.kilo is hepunits.units.prefixes.kilo
+    assert hepunits.units is sys.modules["hepunits.units"]
+    assert "GeV" in vars(hepunits)
+
+    for name in hepunits.__all__:
+        assert getattr(hepunits, name) is not None
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'nonsense'"):
+        hepunits.nonsense  # noqa: B018
@@ -0,0 +1,232 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.lint module.
+"""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from hepunits import lint
+from hepunits.lint import Finding, lint_paths, lint_source, main
+
+
+def _messages(source):
+    return [
+        (finding.line, finding.message)
+        for finding in lint_source(textwrap.dedent(source))
+    ]
+
+
+def test_imports():
+    source = """
+    import hepunits
+    import hepunits.units as u
+    from hepunits import constants, units
+    from hepunits.units import GeV as G
+    from hepunits.systems.root import cm
+    hepunits.GeV + hepunits.ns
+    u.GeV + units.mm
+    G < constants.c_light
+    G + cm
+    hepunits.units.GeV + hepunits.units.MeV
+    """
+    assert _messages(source) == [
+        (7, "addition of [energy] and [time]"),
+        (8, "addition of [energy] and [length]"),
+        (9, "comparison of [energy] and [length] / [time]"),
+        (10, "addition of [energy] and [length]"),
+    ]
+
+
+def test_star_import():
+    source = """
+    from hepunits.units import *
+    x = 1 * GeV - 2 * ns
+    """
+    assert _messages(source) == [(3, "subtraction of [energy] and [time]")]
+
+
+def test_propagation():
+    source = """
+    from hepunits import GeV, c_light, kg, mm, ns
+    E = 5 * GeV
+    p = 3 * GeV / c_light
+    m = (E**2 - (p * c_light) ** 2) ** 0.5 / c_light**2
+    m > 1 * kg
+    m > 1 * GeV
+    E / GeV + 1
+    E > 0
+    E > 20
+    t = 2 * ns
+    t += 3 * mm
+    t = "reassigned"
+    t + E
+    """
+    assert _messages(source) == [
+        (7, "comparison of [time] ** 2 * [energy] / [length] ** 2 and [energy]"),
+        (10, "comparison of [energy] and a plain number"),
+        (12, "addition of [time] and [length]"),
+    ]
+
+
+def test_zero_bindings():
+    source = """
+    from hepunits import GeV, ns
+    total = 0
+    total += 5 * GeV
+    total + 1 * ns
+    count = 1
+    count + 2 * GeV
+    """
+    assert _messages(source) == [
+        (5, "addition of [energy] and [time]"),
+        (7, "addition of [energy] and a plain number"),
+    ]
+
+
+def test_branches():
+    source = """
+    from hepunits import GeV, mm, ns
+    if c:
+        x = 1 * GeV
+    else:
+        x = 2 * mm
+    x + 3 * GeV
+    if c:
+        y = 1 * GeV
+    elif d:
+        y = 2 * GeV
+    else:
+        y = 3 * GeV
+    y + 1 * ns
+    z = 1 * GeV
+    for i in range(3):
+        z = 1 * mm
+    z + 1 * GeV
+    try:
+        w = 1 * GeV
+    except ValueError:
+        w = 1 * ns
+    w + 1 * mm
+    """
+    assert _messages(source) == [(14, "addition of [energy] and [time]")]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="match statements")
+def test_match():
+    source = """
+    from hepunits import GeV, ns
+    match c:
+        case 1:
+            v = 1 * GeV
+        case (v, *rest):
+            pass
+    v + 1 * ns
+    """
+    assert _messages(source) == []
+
+
+def test_scopes():
+    source = """
+    from hepunits import GeV, ns
+    E = 1 * GeV
+    def f(E, t):
+        return E + t
+    def g():
+        E = 1 * ns
+        return E + 1 * ns
+    class A:
+        E = 1 * ns
+        def h(self):
+            return E + 1 * ns
+    [E + 1 * ns for E in range(3)]
+    E + 1 * ns
+    """
+    assert _messages(source) == [
+        (12, "addition of [energy] and [time]"),
+        (14, "addition of [energy] and [time]"),
+    ]
+
+
+def test_unknown():
+    source = """
+    import math
+    from hepunits import GeV, mm
+    from other import x
+    x + 1 * GeV
+    math.sqrt(1 * GeV) + 1 * mm
+    abs(1 * GeV) + 1 * mm
+    (1 * GeV) ** y + 1 * mm
+    """
+    assert _messages(source) == [(7, "addition of [energy] and [length]")]
+
+
+@pytest.fixture
+def sources(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "good.py").write_text("from hepunits import GeV\nx = GeV\n")
+    (tmp_path / "pkg" / "bad.py").write_text(
+        "from hepunits import GeV, mm\nx = GeV + mm\n"
+    )
+    (tmp_path / "pkg" / "copy.py").write_text(
+        "from hepunits import GeV, mm\nx = GeV + mm\n"
+    )
+    (tmp_path / "pkg" / "broken.py").write_text("x = (\n")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "bad.py").write_text(
+        "from hepunits import GeV, mm\nGeV + mm\n"
+    )
+    return tmp_path
+
+
+def test_lint_paths(sources):
+    findings = lint_paths([sources], jobs=2)
+    assert [(finding.path, finding.line) for finding in findings] == [
+        (str(sources / "pkg" / "bad.py"), 2),
+        (str(sources / "pkg" / "broken.py"), 1),
+        (str(sources / "pkg" / "copy.py"), 2),
+    ]
+    assert findings[1].message.startswith("cannot parse")
+    assert lint_paths([sources / "pkg" / "bad.py"], jobs=1) == findings[:1]
+
+
+def test_cache(sources, monkeypatch):
+    cache = sources / "cache"
+    findings = lint_paths([sources / "pkg"], cache_dir=cache)
+    # One entry per distinct content
+    assert len(list(cache.glob("*.json"))) == 3
+
+    analyzed = []
+    monkeypatch.setattr(
+        lint, "_lint_content", lambda content: analyzed.append(content) or []
+    )
+    assert lint_paths([sources / "pkg"], jobs=1, cache_dir=cache) == findings
+    assert analyzed == []
+
+    (sources / "pkg" / "good.py").write_text("from hepunits import GeV\ny = GeV\n")
+    lint_paths([sources / "pkg"], jobs=1, cache_dir=cache)
+    assert analyzed == [b"from hepunits import GeV\ny = GeV\n"]
+
+
+def test_main(sources, capsys):
+    assert main([str(sources / "pkg" / "good.py"), "--no-cache"]) == 0
+    assert main([str(sources / "pkg" / "bad.py"), "--no-cache"]) == 1
+    assert capsys.readouterr().out == (
+        f"{sources / 'pkg' / 'bad.py'}:2:4: addition of [energy] and [length]\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-m", "hepunits.lint", "--no-cache", str(sources / "pkg")],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 1
+    assert len(result.stdout.splitlines()) == 3
+
+
+def test_finding():
+    finding = Finding("a.py", 1, 2, "message")
+    assert str(finding) == "a.py:1:2: message"
@@ -1,6 +1,10 @@
 import pytest
 
 import hepunits
+import hepunits.systems.geant3
+import hepunits.systems.hep
+import hepunits.systems.root
+import hepunits.systems.si
 
 
 def filter_module(item: str) -> bool:
@@ -19,6 +23,10 @@ def filter_module(item: str) -> bool:
         hepunits.constants.constants,
         hepunits.units.prefixes,
         hepunits.units.units,
+        hepunits.systems.geant3,
+        hepunits.systems.hep,
+        hepunits.systems.root,
+        hepunits.systems.si,
     ],
 )
 def test_missing_all(module):
@@ -0,0 +1,46 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.natural module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits import GeV, MeV, fm, hbar, hbarc, pb, s
+from hepunits import dimensions as dim
+from hepunits.dimensions import DimensionError
+from hepunits.natural import factor, from_natural, powers, to_natural
+
+
+def test_powers():
+    assert powers(dim.energy) == (1, 0, 0)
+    assert powers(dim.length) == (-1, 1, 1)
+    assert powers(dim.time) == (-1, 1, 0)
+    assert powers(dim.area) == (-2, 2, 2)
+    assert powers(dim.mass) == (1, 0, -2)
+    assert powers(dim.momentum) == (1, 0, -1)
+    assert powers(dim.dimensionless) == (0, 0, 0)
+    with pytest.raises(DimensionError):
+        powers(dim.charge)
+
+
+def test_factor():
+    assert factor("pb") == approx((hbarc / GeV) ** 2 / pb)
+    assert factor("fm") == approx(hbarc / GeV / fm)
+    assert factor("s") == approx(hbar / GeV / s)
+    assert factor("GeV/c^2") == approx(1)
+    assert factor("fm", energy="MeV") == approx(hbarc / MeV / fm)
+    assert factor("GeV^-2") == 1
+    with pytest.raises(DimensionError):
+        factor("coulomb")
+    with pytest.raises(DimensionError, match="unit of energy"):
+        factor("pb", energy="fm")
+
+
+def test_conversions():
+    np = pytest.importorskip("numpy")
+    cross_sections = np.array([1.0, 2.5e-9])
+    in_pb = from_natural(cross_sections, "pb")
+    assert in_pb == approx(cross_sections * (hbarc / GeV) ** 2 / pb)
+    assert to_natural(in_pb, "pb") == approx(cross_sections)
+    assert to_natural(1.0, "m/s") == approx(1 / 299_792_458)
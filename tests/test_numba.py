@@ -0,0 +1,85 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.numba module.
+"""
+
+import struct
+
+import pytest
+from pytest import approx
+
+import hepunits
+from hepunits.dimensions import DimensionError
+
+numba = pytest.importorskip("numba")
+np = pytest.importorskip("numpy")
+
+from hepunits.numba import constants, converter, factor, units
+
+# Calls that would look up Python objects when the kernel runs
+_lookups = ("PyObject_GetAttr", "PyDict_GetItem", "PyImport")
+
+
+def _llvm(kernel):
+    return kernel.inspect_llvm(kernel.signatures[0])
+
+
+def _literal(value):
+    """The LLVM IR representation of a double constant."""
+    if float(f"{value:e}") == value:
+        return f"{value:e}"
+    return f"0x{struct.unpack('<Q', struct.pack('<d', value))[0]:016X}"
+
+
+def test_tables():
+    assert units.GeV == hepunits.GeV
+    assert units.ps == hepunits.ps
+    assert constants.c_light == hepunits.c_light
+    for table, module in ((units, hepunits.units), (constants, hepunits.constants)):
+        names = [
+            name
+            for name in module.__all__
+            if isinstance(getattr(module, name), (int, float))
+        ]
+        assert list(table._fields) == names
+
+
+def test_factor():
+    assert factor("GeV", "MeV") == approx(1000.0)
+    assert factor("ns", "ps") == approx(1000.0)
+    with pytest.raises(DimensionError):
+        factor("GeV", "ns")
+
+
+def test_constants_are_folded():
+    @numba.njit
+    def kernel(energy, time):
+        return energy / units.GeV + time * constants.c_light
+
+    assert kernel(2000.0, 1.0) == approx(2.0 + hepunits.c_light)
+    llvm = _llvm(kernel)
+    assert f"fdiv double %arg.energy, {_literal(hepunits.GeV)}" in llvm
+    assert f"fmul double %arg.time, {_literal(hepunits.c_light)}" in llvm
+    assert not any(lookup in llvm for lookup in _lookups)
+
+
+def test_converter():
+    to_ps = converter("ns", "ps")
+    assert converter("ns", "ps") is to_ps
+    assert to_ps(1.5) == approx(1500.0)
+    assert to_ps(np.array([1.0, 2.0])) == approx([1000.0, 2000.0])
+
+    @numba.njit
+    def kernel(times):
+        out = np.empty_like(times)
+        for i in range(times.size):
+            out[i] = to_ps(times[i])
+        return out
+
+    assert kernel(np.array([0.5, 1.0])) == approx([500.0, 1000.0])
+    llvm = _llvm(kernel)
+    assert f", {_literal(1000.0)}" in llvm
+    assert not any(lookup in llvm for lookup in _lookups)
+
+    with pytest.raises(DimensionError):
+        converter("ns", "GeV")
@@ -0,0 +1,146 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.numpy module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits import GeV, Quantity, cm, mm
+from hepunits import dimensions as dim
+from hepunits.dimensions import DimensionError
+
+np = pytest.importorskip("numpy")
+
+from hepunits.numpy import QuantityArray
+
+
+def test_construction():
+    x = QuantityArray([1, 2], "cm")
+    assert x.dimension == dim.length
+    assert x.magnitude.dtype == np.float64
+    assert np.all(x.magnitude == [1 * cm, 2 * cm])
+    assert x.shape == (2,)
+    assert len(x) == 2
+    assert isinstance(x, Quantity)
+    assert not hasattr(x, "__dict__")
+
+
+def test_ufuncs():
+    E = QuantityArray([10.0, 20.0], "GeV")
+    p = QuantityArray([6.0, 12.0], "GeV/c")
+    m = np.sqrt(E**2 - (p * QuantityArray(1, "c")) ** 2)
+    assert m.dimension == dim.energy
+    assert m.to(GeV) == approx([8.0, 16.0])
+
+    assert (E / p).dimension == dim.velocity
+    assert (1 / E).dimension == dim.dimensionless / dim.energy
+    assert np.square(E).dimension == dim.energy**2
+    assert np.arctan2(E, E).dimension == dim.dimensionless
+
+    with pytest.raises(DimensionError):
+        E + p
+    with pytest.raises(DimensionError):
+        np.exp(E)
+    with pytest.raises(DimensionError):
+        E ** QuantityArray([1, 2])
+    assert np.exp(E / E).magnitude == approx(np.e)
+
+
+def test_scalar_quantities():
+    E = QuantityArray([10.0, 20.0], "GeV")
+    offset = Quantity(1, "GeV")
+    for result in (E + offset, offset + E):
+        assert isinstance(result, QuantityArray)
+        assert result.to(GeV) == approx([11.0, 21.0])
+    assert np.all((Quantity(15, "GeV") < E) == [False, True])
+
+
+def test_comparisons():
+    x = QuantityArray([1, 2, 3], "cm")
+    assert np.all((x > QuantityArray(15, "mm")) == [False, True, True])
+    assert not np.any(np.isnan(x))
+    with pytest.raises(DimensionError):
+        x > 1  # noqa: B015
+
+
+def test_inplace():
+    x = QuantityArray([1.0, 2.0], "mm")
+    buffer = x.magnitude
+    x += QuantityArray([1.0, 1.0], "mm")
+    x *= QuantityArray(2, "GeV")
+    assert x.magnitude is buffer
+    assert x.dimension == dim.length * dim.energy
+    assert x.magnitude == approx([4 * GeV, 6 * GeV])
+
+
+def test_reductions():
+    x = QuantityArray([1, 2, 3], "cm")
+    assert np.sum(x).to(cm) == approx(6.0)
+    assert np.add.reduce(x).dimension == dim.length
+    assert np.mean(x).dimension == dim.length
+    assert np.var(x).dimension == dim.area
+    assert np.max(x).to(mm) == approx(30.0)
+    assert np.argmax(x) == 2
+    assert np.prod(x / x) == approx(1.0)
+    with pytest.raises(DimensionError):
+        np.multiply.reduce(x)
+    with pytest.raises(TypeError):
+        np.prod(x)
+
+
+def test_functions():
+    x = QuantityArray([3, 1, 2], "cm")
+    assert np.sort(x).to(cm) == approx([1, 2, 3])
+    assert np.concatenate([x, x]).shape == (6,)
+    assert np.dot(x, x).dimension == dim.area
+    assert np.interp(QuantityArray(15, "mm"), np.sort(x), np.sort(x)).to(cm) == approx(
+        1.5
+    )
+    with pytest.raises(DimensionError):
+        np.concatenate([x, QuantityArray([1], "GeV")])
+    with pytest.raises(DimensionError):
+        np.asarray(x)
+
+
+def test_plain_numbers():
+    x = QuantityArray([1, 2, 3], "GeV")
+    two = QuantityArray(2, "GeV")
+    assert np.clip(x, 0, two).to(GeV) == approx([1, 2, 2])
+    assert np.clip(x, a_min=None, a_max=two).to(GeV) == approx([1, 2, 2])
+    with pytest.raises(DimensionError):
+        np.clip(x, 0, 2)
+    with pytest.raises(DimensionError):
+        np.clip(x, a_min=two, a_max=2)
+
+    assert np.where(x > two, x, 0).to(GeV) == approx([0, 0, 3])
+    assert np.where(x > two, x, two).to(GeV) == approx([2, 2, 3])
+    with pytest.raises(DimensionError):
+        np.where(x > two, x, 1.0)
+
+    with pytest.raises(DimensionError):
+        np.concatenate([x, [1.0]])
+    with pytest.raises(DimensionError):
+        np.histogram(x, bins=2, range=(0, 4))
+    assert np.sum(x, axis=0).to(GeV) == approx(6)
+
+
+def test_histogram():
+    x = QuantityArray([1, 2, 2, 3], "cm")
+    counts, edges = np.histogram(x, bins=2)
+    assert counts.tolist() == [1, 3]
+    assert edges.dimension == dim.length
+    assert edges.to(cm) == approx([1, 2, 3])
+
+    counts, edges = np.histogram(x, bins=QuantityArray([0, 2, 4], "cm"))
+    assert counts.tolist() == [1, 3]
+
+    weights = QuantityArray([1, 1, 1, 1], "GeV")
+    counts, _ = np.histogram(x, bins=2, weights=weights)
+    assert counts.dimension == dim.energy
+
+    density, _ = np.histogram(x, bins=2, density=True)
+    assert density.dimension == dim.dimensionless / dim.length
+
+    with pytest.raises(DimensionError):
+        np.histogram(x, bins=QuantityArray([0, 1], "GeV"))
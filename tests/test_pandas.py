@@ -0,0 +1,144 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.pandas module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits.dimensions import Dimension, DimensionError
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from hepunits.pandas import HepArray, HepDtype
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "pt": pd.Series([1200.0, 4100.0, np.nan], dtype="hep[MeV]"),
+            "t": pd.Series([1.5, 0.5, 2.0], dtype="hep[ns]"),
+            "n": [3, 1, 2],
+        }
+    )
+
+
+def test_dtype():
+    dtype = pd.api.types.pandas_dtype("hep[GeV/c^2]")
+    assert dtype == HepDtype("GeV/c^2")
+    assert dtype == "hep[GeV/c^2]"
+    assert dtype != HepDtype("MeV/c^2")
+    assert hash(dtype) == hash(HepDtype("GeV/c^2"))
+    assert dtype.name == "hep[GeV/c^2]"
+    assert dtype.dimension == Dimension(length=-2, time=2, energy=1)
+    assert pd.api.types.is_numeric_dtype(dtype)
+    with pytest.raises(TypeError):
+        HepDtype.construct_from_string("float64")
+    with pytest.raises(ValueError, match="Unknown unit"):
+        pd.Series([1.0], dtype="hep[foo]")
+
+
+def test_no_copy():
+    values = np.array([1.0, 2.0])
+    series = pd.Series(HepArray(values, "GeV"), copy=False)
+    assert np.shares_memory(series.hep.magnitude, values)
+    assert np.shares_memory(series.hep.to("GeV").hep.magnitude, values)
+    assert series.hep.to("MeV").tolist() == [1000.0, 2000.0]
+    tagged = pd.Series(values, copy=False).astype("hep[GeV]")
+    assert tagged.dtype == "hep[GeV]"
+    assert tagged.tolist() == [1.0, 2.0]
+
+
+def test_to(frame):
+    pt = frame["pt"].hep.to("GeV")
+    assert pt.dtype == "hep[GeV]"
+    assert pt.hep.unit == "GeV"
+    assert pt.name == "pt"
+    assert pt.iloc[:2].tolist() == approx([1.2, 4.1])
+    assert np.isnan(pt.iloc[2])
+    assert frame["pt"].astype("hep[GeV]").equals(pt)
+    assert frame["pt"].astype(float).dtype == np.float64
+    with pytest.raises(DimensionError, match="Cannot convert"):
+        frame["pt"].hep.to("ns")
+    with pytest.raises(AttributeError, match="hep"):
+        frame["n"].hep  # noqa: B018
+
+
+def test_frame(frame):
+    assert frame.hep.units == {"pt": "MeV", "t": "ns"}
+    converted = frame.hep.to({"pt": "GeV", "t": "ps"})
+    assert converted.hep.units == {"pt": "GeV", "t": "ps"}
+    assert converted["t"].tolist() == [1500.0, 500.0, 2000.0]
+    assert converted["n"].tolist() == [3, 1, 2]
+    assert frame.hep.units == {"pt": "MeV", "t": "ns"}
+    with pytest.raises(ValueError, match="No columns"):
+        frame.hep.to({"x": "GeV"})
+
+
+def test_concat_merge(frame):
+    more = pd.Series([2.5], dtype="hep[GeV]")
+    concatenated = pd.concat([frame["pt"], more], ignore_index=True)
+    assert concatenated.dtype == "hep[MeV]"
+    assert concatenated.iloc[3] == 2500.0
+    assert pd.concat([frame["pt"], frame["t"]]).dtype == object
+    direct = HepArray._concat_same_type([frame["pt"].array, more.array])
+    assert direct.unit == "MeV"
+    assert direct[3] == 2500.0
+
+    merged = frame.merge(frame[["n", "t"]], on="n")
+    assert merged.hep.units == {"pt": "MeV", "t_x": "ns", "t_y": "ns"}
+    assert frame.groupby("n")["t"].sum().dtype == "hep[ns]"
+
+
+def test_arithmetic(frame):
+    pt, t = frame["pt"], frame["t"]
+    assert (pt + pt.hep.to("GeV")).iloc[:2].tolist() == [2400.0, 8200.0]
+    assert (2 * pt).dtype == "hep[MeV]"
+    assert (pt / 2).dtype == "hep[MeV]"
+    assert (1 / t).dtype == "hep[(1)/(ns)]"
+    assert (pt / t).dtype.dimension == Dimension(energy=1, time=-1)
+    assert (-pt).iloc[0] == -1200.0
+    assert (pt > pd.Series([1.0, 5.0, 1.0], dtype="hep[GeV]")).tolist() == [
+        True,
+        False,
+        False,
+    ]
+    assert not (pt == 1200.0).any()
+    with pytest.raises(DimensionError, match="Cannot add"):
+        pt + t
+    with pytest.raises(DimensionError, match="a dimensionless number"):
+        pt > 20  # noqa: B015
+
+
+def test_reductions(frame):
+    pt = frame["pt"]
+    assert pt.sum() == 5300.0
+    assert pt.mean() == 2650.0
+    assert pt.max() == 4100.0
+    assert pt.quantile(0.5) == 2650.0
+    assert pt.describe()["count"] == 2
+    with pytest.raises(TypeError, match="var"):
+        pt.var()
+
+
+def test_selection(frame):
+    pt = frame["pt"].copy()
+    assert pt.iloc[0] == 1200.0
+    assert pt.dropna().dtype == "hep[MeV]"
+    assert pt.fillna(0.0).iloc[2] == 0.0
+    assert pt.sort_values(ascending=False).iloc[0] == 4100.0
+    pt.iloc[0] = 1.0
+    pt.iloc[1:2] = pd.Series([1.0], dtype="hep[GeV]").array
+    assert pt.iloc[:2].tolist() == [1.0, 1000.0]
+
+    # Series in other units are converted, as arrays
+    a = pd.Series([1000.0, 2000.0], dtype="hep[MeV]")
+    b = pd.Series([1.0, 3.0], dtype="hep[GeV]")
+    a[:] = b
+    assert a.tolist() == [1000.0, 3000.0]
+    a.iloc[0:1] = b.iloc[1:2]
+    assert a.tolist() == [3000.0, 3000.0]
+    assert a.dtype == "hep[MeV]"
+    assert frame["pt"].iloc[0] == 1200.0
@@ -0,0 +1,112 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.parsing module.
+"""
+
+import pytest
+from pytest import approx
+
+import hepunits
+from hepunits import GeV, T, c_light, fb, m, ns, parse
+from hepunits.dimensions import DimensionError
+from hepunits.parsing import conversion_factor, parse_array, parse_unit
+
+
+@pytest.mark.parametrize(
+    ("expr", "expected"),
+    [
+        ("25 ns", 25 * ns),
+        ("25ns", 25 * ns),
+        ("3.5 GeV/c^2", 3.5 * GeV / c_light**2),
+        ("3.5 GeV/c**2", 3.5 * GeV / c_light**2),
+        ("1.2e-3 T*m", 1.2e-3 * T * m),
+        ("-5 GeV", -5 * GeV),
+        ("1/fb", 1 / fb),
+        ("2 * GeV", 2 * GeV),
+        ("(2 GeV)^2", (2 * GeV) ** 2),
+        ("kg m/s^2", hepunits.newton),
+        ("GeV^-1", 1 / GeV),
+        ("10 GeV^(1/2)", 10 * GeV**0.5),
+        ("  4 keV ", 4 * hepunits.keV),
+        ("hbarc / GeV", hepunits.hbarc / GeV),
+        ("2 pi", hepunits.two_pi),
+        ("3", 3.0),
+        (".5e3 mm2", 500.0),
+    ],
+)
+def test_parse(expr, expected):
+    assert parse(expr) == approx(expected, rel=1e-15)
+
+
+def test_all_names():
+    for module in (hepunits.units, hepunits.constants):
+        for name in module.__all__:
+            value = getattr(module, name)
+            if isinstance(value, float):
+                assert parse(f"2 {name}") == 2 * value
+
+
+@pytest.mark.parametrize(
+    ("expr", "match"),
+    [
+        ("3 foo", "Unknown unit or constant 'foo'"),
+        ("3 GeV/", "unexpected end"),
+        ("GeV)", "unexpected '\\)'"),
+        ("3 GeV $", "Invalid character '\\$'"),
+        ("", "unexpected end"),
+        ("3 units", "Unknown unit or constant 'units'"),
+    ],
+)
+def test_parse_invalid(expr, match):
+    with pytest.raises(ValueError, match=match):
+        parse(expr)
+
+
+@pytest.mark.parametrize(
+    "expr", ["1 / 0", "GeV / (0 mm)", "10^400", "(-8)^(1/3)", "GeV^(1/0)"]
+)
+def test_parse_arithmetic_errors(expr):
+    with pytest.raises(ValueError, match="Cannot evaluate"):
+        parse(expr)
+
+
+def test_parse_unit_cache():
+    parse_unit.cache_clear()
+    for value in range(100):
+        assert parse(f"{value} GeV/c^2") == approx(value * GeV / c_light**2)
+    info = parse_unit.cache_info()
+    assert info.misses == 1
+    assert info.hits == 99
+
+
+def test_conversion_factor():
+    assert conversion_factor("GeV", "MeV") == approx(1000.0)
+    assert conversion_factor("GeV/c", "MeV/c_light") == approx(1000.0)
+    assert conversion_factor("1/fb", "1/pb") == approx(1000.0)
+    with pytest.raises(DimensionError, match="Cannot convert 'GeV'"):
+        conversion_factor("GeV", "ns")
+
+
+def test_parse_array():
+    np = pytest.importorskip("numpy")
+
+    values = ["12.3 keV", " 4.1 MeV", "2", "1e3  GeV/c^2", "-7 ns "]
+    result = parse_array(values)
+    assert result.dtype == np.float64
+    assert result == approx([parse(value) for value in values], rel=1e-15)
+
+    column = np.array([["1 mm", "2 cm"], ["3 m", "4"]])
+    result = parse_array(column)
+    assert result.shape == (2, 2)
+    assert result == approx(np.array([[1.0, 20.0], [3000.0, 4.0]]))
+
+    assert parse_array([]).shape == (0,)
+
+
+def test_parse_array_invalid():
+    pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError, match="Unknown unit or constant 'foo'"):
+        parse_array(["1 GeV", "2 foo"])
+    with pytest.raises(ValueError, match="could not convert"):
+        parse_array(["1 GeV", "two GeV"])
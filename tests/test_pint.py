@@ -9,7 +9,15 @@ import pytest
 from pytest import approx
 
 import hepunits
-from hepunits.pint import from_clhep, to_clhep
+from hepunits.pint import (
+    cache_clear,
+    cache_info,
+    from_clhep,
+    from_clhep_array,
+    get_registry,
+    to_clhep,
+    to_clhep_array,
+)
 
 
 def test_pint_constants():
@@ -54,3 +62,97 @@ def test_consistent_registry():
     b = 3 * ureg.nanosecond
     assert a * to_clhep(b) == 3 * hepunits.mm * hepunits.nanosecond
     assert from_clhep(a, ureg.mm) * b == 3 * ureg.mm * ureg.nanosecond
+
+
+def test_conversion_cache():
+    ureg = pint.UnitRegistry()
+    cache_clear()
+    assert cache_info().currsize == 0
+
+    assert to_clhep(2 * ureg.GeV) == approx(2 * hepunits.GeV)
+    assert to_clhep(5 * ureg.GeV) == approx(5 * hepunits.GeV)
+    assert from_clhep(hepunits.TeV, ureg.GeV).m == approx(1000.0)
+    info = cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+
+    # Units from another registry get their own entry
+    other = pint.UnitRegistry()
+    assert to_clhep(2 * other.GeV) == approx(2 * hepunits.GeV)
+    assert cache_info().currsize == 2
+
+    cache_clear()
+    assert cache_info() == (0, 0, info.maxsize, 0)
+
+
+def test_conversion_cache_bounded():
+    ureg = pint.UnitRegistry()
+    cache_clear()
+    maxsize = cache_info().maxsize
+    for i in range(maxsize + 10):
+        assert to_clhep(ureg.mm ** (i % 7) * ureg.ns ** (i // 7)) == approx(1.0)
+    assert cache_info().currsize == maxsize
+
+
+def test_array_roundtrip():
+    np = pytest.importorskip("numpy")
+    ureg = pint.UnitRegistry()
+
+    values = np.linspace(0.0, 10.0, 11)
+    clhep = to_clhep_array(ureg.Quantity(values, "GeV"))
+    assert clhep == approx(values * hepunits.GeV)
+
+    q = from_clhep_array(clhep, ureg.TeV)
+    assert q.units == ureg.TeV
+    assert q.m == approx(values / 1000.0)
+
+
+def test_array_out():
+    np = pytest.importorskip("numpy")
+    ureg = pint.UnitRegistry()
+
+    values = np.arange(5.0)
+    q = ureg.Quantity(values, "ps")
+    result = to_clhep_array(q, out=values)
+    assert result is values
+    assert values == approx(np.arange(5.0) * hepunits.ps)
+
+    q = from_clhep_array(values, ureg.ps, out=values)
+    assert np.shares_memory(q.m, values)
+    assert q.m == approx(np.arange(5.0))
+
+    out = np.empty(5, dtype=np.float32)
+    to_clhep_array(ureg.Quantity(np.arange(5.0), "micrometer"), out=out)
+    assert out.dtype == np.float32
+    assert out == approx(np.arange(5.0) * hepunits.micrometer)
+
+
+def test_shared_registry():
+    ureg = get_registry()
+    assert get_registry() is ureg
+    assert ureg.default_system == "clhep"
+
+    for name in hepunits.units.units.__all__:
+        unit = getattr(ureg, name)
+        value = getattr(hepunits, name)
+        assert (1.0 * unit).to_base_units().m == approx(value, rel=1e-14), name
+        if not {"[temperature]", "[substance]", "[luminosity]"} & set(
+            unit.dimensionality
+        ):
+            assert to_clhep(unit) == approx(value, rel=1e-14), name
+
+
+def test_shared_registry_clhep_system():
+    ureg = get_registry()
+
+    q = (3 * ureg.tesla).to_base_units()
+    assert q.m == approx(3 * hepunits.tesla)
+    assert q.units == ureg.MeV * ureg.ns / ureg.mm**2 / ureg.eplus
+
+    q = (2 * ureg.kg).to_base_units()
+    assert q.m == approx(2 * hepunits.kg)
+    assert q.units == ureg.MeV * ureg.ns**2 / ureg.mm**2
+
+    assert (1 * ureg.GeV).to_base_units().m == approx(1000.0)
+    assert (1 * ureg.K).to_base_units().units == ureg.kelvin
@@ -0,0 +1,90 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.precision module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits import GeV, Qg, ab, kg, ns, tesla
+from hepunits.systems import System, systems
+
+np = pytest.importorskip("numpy")
+
+from hepunits.precision import (
+    Issue,
+    _reference,
+    check,
+    from_profile,
+    profile,
+    report,
+    to_profile,
+)
+
+
+def test_check():
+    issues = {issue.name: issue for issue in check("float32")}
+    assert issues["ab"] == Issue("ab", ab, "subnormal")
+    assert issues["quettagram"].problem == "overflow"
+    assert "kg" not in issues
+    assert check("float64") == []
+    assert "kg" in {issue.name for issue in check("float32", headroom=1e15)}
+
+    issues = {issue.name: issue for issue in check(np.float16)}
+    assert issues["kg"].problem == "overflow"
+    assert issues["ab"].problem == "underflow"
+    assert issues["eV"].problem == "subnormal"
+    assert "GeV" not in issues
+
+    issues = {issue.name for issue in check("float32", system=systems["si"])}
+    assert "kg" not in issues
+    assert "e_SI" not in issues
+
+
+def test_report():
+    lines = report("float32").splitlines()
+    assert lines[0].startswith("float32: ")
+    assert "  ab = 1e-40: subnormal" in lines
+    assert len(lines) == 1 + len(check("float32"))
+
+
+def test_profile():
+    base = profile()
+    assert isinstance(base, System)
+    assert all(np.log10(value) == approx(round(np.log10(value))) for value in base)
+    assert base.energy == GeV
+    # Only dimensionless numbers are out of the range of float32
+    assert {issue.name for issue in check("float32", system=base)} <= {"googol"}
+    assert len(check("float16", system=base)) < len(check("float16"))
+
+
+def test_conversions():
+    masses = np.array([80 * kg, 1e-3 * kg])
+    stored = to_profile(masses, "kg")
+    assert stored.dtype == np.float32
+    assert np.isfinite(stored).all()
+    assert from_profile(stored, "kg") == approx(masses, rel=1e-6)
+    assert from_profile(stored, "kg").dtype == np.float64
+
+    fields = np.array([1.5 * tesla])
+    out = np.empty(1, dtype=np.float32)
+    assert to_profile(fields, "T", out=out) is out
+    assert from_profile(out, "T") == approx(fields)
+    assert to_profile([2 * ns], "ns", dtype=np.float64).dtype == np.float64
+
+    # The results are not rounded to the data type before the end
+    exact = np.empty(2, dtype=np.float64)
+    to_profile(masses, "kg", out=exact)
+    assert from_profile(exact, "kg") == approx(masses, rel=1e-12)
+
+
+def test_conversions_out_of_range():
+    # The values in the HEP system of units are out of the range of float32
+    assert to_profile([2 * Qg], "kg") == approx([2 * Qg / _reference("kg")], rel=1e-6)
+    assert np.isfinite(to_profile([2 * Qg], "kg")).all()
+    expected = 3 * ab / _reference("ab")
+    assert to_profile([3 * ab], "ab").tolist() == approx([expected], rel=1e-7)
+    assert from_profile(to_profile([3 * ab], "ab"), "ab") == approx([3 * ab], rel=1e-6)
+    for dimension in ("kg", "barn", "s"):
+        values = [3 * _reference(dimension)]
+        assert to_profile(values, dimension, dtype=np.float16).tolist() == [3.0]
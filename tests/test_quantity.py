@@ -0,0 +1,120 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.quantity module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits import GeV, MeV, Quantity, TeV, c_light, ns
+from hepunits import dimensions as dim
+from hepunits.dimensions import DimensionError
+
+
+def test_construction():
+    q = Quantity(3, "GeV")
+    assert q.magnitude == 3 * GeV
+    assert q.dimension == dim.energy
+
+    q = Quantity(3 * GeV, dim.energy)
+    assert q.magnitude == 3 * GeV
+    assert q.dimension == dim.energy
+
+    assert Quantity(2.0).dimension == dim.dimensionless
+    assert not hasattr(q, "__dict__")
+
+
+def test_arithmetic():
+    E = Quantity(2.5, "GeV") + Quantity(500, "MeV")
+    assert E.magnitude == approx(3 * GeV)
+    assert (E - Quantity(1, "GeV")).to(GeV) == approx(2.0)
+
+    p = E / Quantity(1, "c_light")
+    assert p.dimension == dim.momentum
+    assert p.magnitude == approx(3 * GeV / c_light)
+
+    m2 = E**2 - (p * Quantity(1, "c_light")) ** 2
+    assert m2.dimension == dim.energy**2
+    assert m2.magnitude == approx(0.0, abs=1e-6)
+
+    assert (2 * E).magnitude == approx(6 * GeV)
+    assert (E * 2).magnitude == approx(6 * GeV)
+    assert (1 / Quantity(2, "ns")).dimension == dim.frequency
+    assert (-E).magnitude == -E.magnitude
+    assert abs(-E).magnitude == E.magnitude
+    assert Quantity(4, "mm2") ** 0.5 == Quantity(2, "mm")
+
+
+def test_dimensionless():
+    ratio = Quantity(3, "GeV") / Quantity(1, "MeV")
+    assert ratio.dimension == dim.dimensionless
+    assert float(ratio) == approx(3000.0)
+    assert ratio + 1 == approx(3001.0)
+    assert 1 + ratio == Quantity(3001.0)
+
+
+def test_incompatible():
+    with pytest.raises(DimensionError, match="Cannot add"):
+        Quantity(1, "GeV") + Quantity(1, "ns")
+    with pytest.raises(DimensionError, match="Cannot subtract"):
+        Quantity(1, "GeV") - 1
+    with pytest.raises(DimensionError, match="Cannot compare"):
+        Quantity(1, "GeV") < Quantity(1, "ns")  # noqa: B015
+    with pytest.raises(DimensionError, match="Cannot convert"):
+        float(Quantity(1, "GeV"))
+    with pytest.raises(DimensionError, match="Non-integer exponents"):
+        Quantity(1, "GeV") ** 0.5
+
+
+def test_comparisons():
+    assert Quantity(1, "TeV") == Quantity(1000, "GeV")
+    assert Quantity(1, "TeV") != Quantity(1, "ns")
+    assert Quantity(1, "TeV") != 1
+    assert Quantity(1, "TeV") > Quantity(1, "GeV")
+    assert Quantity(1, "GeV") <= Quantity(1000, "MeV")
+
+
+def test_to():
+    q = Quantity(500, "GeV")
+    assert q.to(TeV) == approx(0.5)
+    assert q.to("TeV") == approx(0.5)
+    assert q.to(Quantity(1, "MeV")) == approx(500000.0)
+    assert Quantity(3, "m/ns").to("c") == approx(3000.0 / c_light)
+    with pytest.raises(DimensionError, match="Cannot convert"):
+        q.to("ns")
+    with pytest.raises(DimensionError, match="Cannot convert"):
+        q.to(Quantity(1, "ns"))
+
+
+def test_arrays():
+    np = pytest.importorskip("numpy")
+
+    values = np.linspace(1.0, 2.0, 5)
+    q = Quantity(values, "GeV")
+    assert q.to(MeV) == approx(values * 1000.0)
+
+    q2 = values * Quantity(1, "GeV")
+    assert isinstance(q2, Quantity)
+    assert q2.dimension == dim.energy
+    assert q2.magnitude == approx(values * GeV)
+
+    t = q / Quantity(np.full(5, 2.0), "ns")
+    assert t.dimension == dim.power
+    assert t.magnitude == approx(values * GeV / (2 * ns))
+    assert (q == q2).all()
+
+
+def test_pint_roundtrip():
+    pint = pytest.importorskip("pint")
+    ureg = pint.UnitRegistry()
+
+    q = Quantity.from_pint(2 * ureg.tesla * ureg.meter)
+    assert q.dimension == Quantity(1, "T*m").dimension
+    assert q.magnitude == approx(2 * Quantity(1, "T*m").magnitude)
+
+    back = q.to_pint(ureg.tesla * ureg.cm)
+    assert back.m == approx(200.0)
+    assert Quantity.from_pint(back).magnitude == approx(q.magnitude)
+
+    with pytest.raises(DimensionError, match="Cannot convert"):
+        Quantity(1, "GeV").to_pint(ureg.ns)
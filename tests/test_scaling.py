@@ -0,0 +1,70 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.scaling module.
+"""
+
+import tracemalloc
+
+import pytest
+from pytest import approx
+
+import hepunits
+from hepunits import GeV, MeV, ns, ps
+from hepunits.dimensions import DimensionError
+
+np = pytest.importorskip("numpy")
+
+from hepunits.scaling import scale
+
+
+def test_scale():
+    assert hepunits.scale is scale
+    assert scale([1.5, 0.25], "GeV", "MeV") == approx([1500, 250])
+    assert scale([1.5, 0.25], GeV, MeV) == approx([1500, 250])
+    assert scale([1.5], "ns", ps) == approx([1500])
+    assert scale(np.arange(3), "GeV", "MeV").dtype == np.float64
+    with pytest.raises(DimensionError):
+        scale([1.0], "GeV", "ns")
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64])
+def test_dtype(dtype):
+    values = np.array([1.5, 0.25], dtype=dtype)
+    assert scale(values, "GeV", "MeV").dtype == dtype
+    assert scale(values, "GeV", "MeV", dtype=np.float64).dtype == np.float64
+    out = np.empty(2, dtype=np.float32)
+    assert scale(values, "GeV", "MeV", out=out) is out
+    assert out == approx([1500, 250])
+    # Exact for factors that are inverses of integers
+    assert scale(values * 1000, "MeV", "GeV").tolist() == [1.5, 0.25]
+
+
+def test_out_of_range_factors():
+    # The factors, 1e6 and 1e-6, are out of the range of float16
+    values = np.array([1e4, 3e4], dtype=np.float16)
+    result = scale(values, "micrometer", "m")
+    assert result.dtype == np.float16
+    assert result == approx([0.01, 0.03], rel=1e-3)
+    out = np.empty(2, dtype=np.float16)
+    assert scale(result, "m", "micrometer", out=out) is out
+    assert out == approx([1e4, 3e4], rel=1e-3)
+    # Values out of the range of float16 are scaled before rounding
+    assert scale([1e6], "micrometer", "m", dtype=np.float16) == approx([1.0])
+
+
+def test_in_place():
+    values = np.full(1_000_000, 2.0, dtype=np.float32)
+    scale(values, "ns", "ps", out=values)  # parse the units once
+    tracemalloc.start()
+    try:
+        result = scale(values, ns, ps, out=values)
+        _, in_place = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        (values * ns) / ps
+        _, naive = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert result is values
+    assert values[0] == approx(2e6)
+    assert in_place < 10_000
+    assert naive >= 2 * values.nbytes
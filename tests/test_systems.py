@@ -0,0 +1,62 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.systems package.
+"""
+
+import pytest
+from pytest import approx
+
+import hepunits
+from hepunits import dimensions as dim
+from hepunits.systems import convert, factor, geant3, hep, matrix, root, si, systems
+
+
+def test_names():
+    assert hep.__all__ == root.__all__ == geant3.__all__ == si.__all__
+    assert {"GeV", "cm", "tesla", "c_light", "hbar"} <= set(root.__all__)
+    for name in hep.__all__:
+        assert getattr(hep, name) == getattr(hepunits, name)
+
+
+def test_base_units():
+    assert (root.cm, root.second, root.GeV, root.eplus) == (1, 1, 1, 1)
+    assert (geant3.cm, geant3.second, geant3.GeV) == (1, 1, 1)
+    assert (si.m, si.s, si.joule, si.coulomb, si.kelvin) == (1, 1, 1, 1, 1)
+    assert si.kg == approx(1)
+    assert si.newton == approx(1)
+    assert si.tesla == approx(1)
+    assert si.c_light == approx(299_792_458)
+    assert si.hbar == approx(1.054571817e-34)
+    assert root.MeV == approx(1e-3)
+    assert root.tesla == approx(1e-13)
+
+
+def test_matrix():
+    assert set(matrix) == {(a, b) for a in systems for b in systems}
+    assert matrix["hep", "root"] == (0.1, 1e-9, 1e-3, 1, 1, 1, 1)
+    assert matrix["root", "root"] == (1,) * 7
+
+
+def test_factor():
+    assert factor(dim.energy, "hep", "root") == approx(1e-3)
+    assert factor("GeV/c^2", "hep", "si") == approx(
+        hepunits.GeV / hepunits.c_light**2 / hepunits.kg * 1e-3
+    )
+    assert factor(dim.dimensionless, "hep", "si") == 1
+    assert factor(dim.area, "root", "hep") == approx(100)
+    with pytest.raises(ValueError, match="Unknown system"):
+        factor(dim.energy, "hep", "cgs")
+
+
+def test_convert():
+    np = pytest.importorskip("numpy")
+    energies = np.array([1500.0, 250.0])
+    assert convert(energies, "MeV", "hep", "root") == approx([1.5, 0.25])
+    assert convert(1.5, dim.energy, "root", "hep") == approx(1500)
+    for name in ("GeV", "tesla", "hbar", "Avogadro"):
+        value = getattr(hepunits, name)
+        dimension = dim.registry[name]
+        assert convert(value, dimension, "hep", "si") == approx(getattr(si, name))
+        assert convert(getattr(si, name), dimension, "si", "root") == approx(
+            getattr(root, name)
+        )
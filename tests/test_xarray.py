@@ -0,0 +1,87 @@
+# Licensed under a 3-clause BSD style license, see LICENSE.
+"""
+Tests for the hepunits.xarray module.
+"""
+
+import pytest
+from pytest import approx
+
+from hepunits.dimensions import DimensionError
+
+np = pytest.importorskip("numpy")
+xr = pytest.importorskip("xarray")
+
+import hepunits.xarray  # noqa: F401
+
+
+@pytest.fixture
+def dataset():
+    return xr.Dataset(
+        {
+            "t": ("hit", [1.5, 0.5, 2.0], {"units": "ns", "long_name": "time"}),
+            "e": ("hit", [12.0, 3.0, 4.5], {"units": "MeV"}),
+            "n": ("hit", [3, 1, 2]),
+        },
+        coords={"z": ("hit", [10.0, 20.0, 30.0], {"units": "mm"})},
+        attrs={"run": 42},
+    )
+
+
+def test_data_array(dataset):
+    t = dataset["t"]
+    assert t.hep.unit == "ns"
+    converted = t.hep.to("ps")
+    assert converted.hep.unit == "ps"
+    assert converted.attrs["long_name"] == "time"
+    assert converted.values.tolist() == [1500.0, 500.0, 2000.0]
+    assert converted.coords["z"].values.tolist() == [10.0, 20.0, 30.0]
+    assert t.hep.unit == "ns"
+    assert dataset["n"].hep.unit is None
+    with pytest.raises(ValueError, match="no units"):
+        dataset["n"].hep.to("ps")
+    with pytest.raises(DimensionError, match="Cannot convert"):
+        t.hep.to("GeV")
+
+
+def test_dataset(dataset):
+    assert dataset.hep.units == {"t": "ns", "e": "MeV", "z": "mm"}
+    converted = dataset.hep.to({"t": "ps", "e": "keV", "z": "cm"})
+    assert converted.hep.units == {"t": "ps", "e": "keV", "z": "cm"}
+    assert converted["e"].values.tolist() == [12000.0, 3000.0, 4500.0]
+    assert converted["z"].values.tolist() == approx([1.0, 2.0, 3.0])
+    assert converted["n"].values.tolist() == [3, 1, 2]
+    assert converted.attrs == {"run": 42}
+    with pytest.raises(ValueError, match="No variables"):
+        dataset.hep.to({"x": "GeV"})
+
+
+def test_dask(dataset):
+    da = pytest.importorskip("dask.array")
+    callbacks = pytest.importorskip("dask.callbacks")
+
+    chunked = dataset.chunk(hit=2)
+    computed = []
+    with callbacks.Callback(start=computed.append):
+        converted = chunked.hep.to({"t": "ps", "e": "keV"}).hep.to({"t": "us"})
+    assert computed == []
+    assert isinstance(converted["t"].data, da.Array)
+
+    # Chained conversions are a single multiply of the original values
+    assert (
+        len(converted["t"].data.dask.layers) == len(chunked["t"].data.dask.layers) + 1
+    )
+    assert chunked["t"].hep.to("ps").hep.to("ns").data is chunked["t"].data
+    dask = pytest.importorskip("dask")
+    (optimized,) = dask.optimize(converted["t"].data)
+    assert len(optimized.dask.layers) == 1
+    assert converted["t"].values.tolist() == approx([1.5e-3, 0.5e-3, 2e-3])
+    assert converted["e"].values.tolist() == [12000.0, 3000.0, 4500.0]
+
+
+def test_dask_relabelled(dataset):
+    pytest.importorskip("dask.array")
+    converted = dataset["t"].chunk(hit=2).hep.to("ps")
+    relabelled = converted.copy(deep=False)
+    relabelled.attrs["units"] = "fs"
+    assert relabelled.hep.to("ps").values.tolist() == approx([1.5, 0.5, 2.0])
+    assert converted.hep.to("ns").values.tolist() == approx([1.5, 0.5, 2.0])